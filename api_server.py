@@ -1,4 +1,5 @@
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -10,7 +11,10 @@ from rag.stock_agent.graph.tools.quiz.session_manager import QuizSessionManager
 load_dotenv()
 logger = get_logger(__name__)
 
-app = FastAPI(title="Miraeasset Stock Agent API")
+# 응답 직렬화는 orjson 사용 (표준 json 대비 인코딩 비용 감소)
+app = FastAPI(
+    title="Miraeasset Stock Agent API", default_response_class=ORJSONResponse
+)
 
 # 세션 저장소
 session_store: Dict[str, StockAgentState] = {}
@@ -10,6 +10,41 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# 신호 도구의 대표 조회와 사용되어야 하는 인덱스 (플래너 회귀 점검용)
+PLAN_CHECKS = [
+    (
+        "ix_technical_signals_indicator_date_cover",
+        "SELECT ts.ticker, ts.value FROM technical_signals ts "
+        "WHERE ts.date BETWEEN '2024-01-01' AND '2024-12-31' AND ts.indicator = 'RSI_14'",
+    ),
+    (
+        "ix_technical_signals_date_indicator_cover",
+        "SELECT ts.indicator, ts.value FROM technical_signals ts "
+        "WHERE ts.date = '2024-01-02' AND ts.indicator IN ('RSI_14', 'BOLLINGER_UPPER', 'MA_20')",
+    ),
+]
+
+
+def check_query_plans(cursor) -> bool:
+    """
+    EXPLAIN QUERY PLAN으로 대표 조회가 기대한 인덱스를 쓰는지 확인합니다.
+    SQLite 버전 변경 등으로 플래너가 다른 인덱스를 고르면 경고를 남깁니다.
+
+    Returns:
+        모든 조회가 기대한 인덱스를 사용하면 True
+    """
+    all_ok = True
+    for index_name, query in PLAN_CHECKS:
+        cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+        plan = " / ".join(row[3] for row in cursor.fetchall())
+        if index_name in plan:
+            logger.info(f"쿼리 플랜 확인: {index_name} 사용")
+        else:
+            all_ok = False
+            logger.warning(f"쿼리 플랜이 {index_name}을 사용하지 않습니다: {plan}")
+    return all_ok
+
+
 def create_performance_indexes():
     """
     모든 테이블에 성능 최적화를 위한 인덱스를 생성합니다.
@@ -24,6 +59,9 @@ def create_performance_indexes():
     cursor = conn.cursor()
 
     try:
+        # 기존 DB도 WAL 모드로 전환 (DB 파일에 유지되므로 연결마다 설정할 필요 없음)
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # 기존 인덱스 확인
         cursor.execute("PRAGMA index_list(technical_signals)")
         existing_tech_indexes = [row[1] for row in cursor.fetchall()]
@@ -41,30 +79,28 @@ def create_performance_indexes():
         existing_market_indexes = [row[1] for row in cursor.fetchall()]
         logger.info(f"market_index_ohlcv 기존 인덱스: {existing_market_indexes}")
 
+        cursor.execute("PRAGMA index_list(quiz_history)")
+        existing_quiz_indexes = [row[1] for row in cursor.fetchall()]
+        logger.info(f"quiz_history 기존 인덱스: {existing_quiz_indexes}")
+
         # 성능 최적화를 위한 복합 인덱스들
         indexes_to_create = [
             # technical_signals 테이블 인덱스
-            (
-                "ix_technical_signals_date_indicator",
-                "CREATE INDEX ix_technical_signals_date_indicator ON technical_signals(date, indicator)",
-            ),
             (
                 "ix_technical_signals_ticker_date",
                 "CREATE INDEX ix_technical_signals_ticker_date ON technical_signals(ticker, date)",
             ),
+            # 신호 도구(indicator + date 필터) 조회용 커버링 인덱스
             (
-                "ix_technical_signals_indicator_date",
-                "CREATE INDEX ix_technical_signals_indicator_date ON technical_signals(indicator, date)",
-            ),
-            # ohlcv 테이블 인덱스
-            (
-                "ix_ohlcv_date_ticker",
-                "CREATE INDEX ix_ohlcv_date_ticker ON ohlcv(date, ticker)",
+                "ix_technical_signals_indicator_date_cover",
+                "CREATE INDEX ix_technical_signals_indicator_date_cover ON technical_signals(indicator, date, ticker, value)",
             ),
+            # 단일 날짜의 여러 지표 일괄 조회(date = ?, indicator IN)용 커버링 인덱스
             (
-                "ix_ohlcv_ticker_date",
-                "CREATE INDEX ix_ohlcv_ticker_date ON ohlcv(ticker, date)",
+                "ix_technical_signals_date_indicator_cover",
+                "CREATE INDEX ix_technical_signals_date_indicator_cover ON technical_signals(date, indicator, ticker, value)",
             ),
+            # ohlcv 테이블 인덱스
             (
                 "ix_ohlcv_date_volume",
                 "CREATE INDEX ix_ohlcv_date_volume ON ohlcv(date, volume)",
@@ -77,6 +113,16 @@ def create_performance_indexes():
                 "ix_ohlcv_date_close",
                 "CREATE INDEX ix_ohlcv_date_close ON ohlcv(date, close)",
             ),
+            # 일별 시총 순위 계산용 커버링 인덱스 (테이블 조회 없이 인덱스만 스캔)
+            (
+                "ix_ohlcv_date_mc",
+                "CREATE INDEX ix_ohlcv_date_mc ON ohlcv(date, ticker, close, volume)",
+            ),
+            # 신호 도구의 ohlcv JOIN(ticker, date)용 커버링 인덱스
+            (
+                "ix_ohlcv_ticker_date_cover",
+                "CREATE INDEX ix_ohlcv_ticker_date_cover ON ohlcv(ticker, date, close, high, low, volume)",
+            ),
             # stocks 테이블 인덱스
             ("ix_stocks_market", "CREATE INDEX ix_stocks_market ON stocks(market)"),
             ("ix_stocks_name", "CREATE INDEX ix_stocks_name ON stocks(name)"),
@@ -89,8 +135,41 @@ def create_performance_indexes():
                 "ix_market_index_ohlcv_date_market",
                 "CREATE INDEX ix_market_index_ohlcv_date_market ON market_index_ohlcv(date, market)",
             ),
+            # quiz_history 테이블 인덱스 (보상 자격/보상 집계 조회용 커버링 부분 인덱스)
+            (
+                "idx_quiz_user_reward",
+                "CREATE INDEX idx_quiz_user_reward ON quiz_history(request_id, is_correct, completed_at, reward_stock, reward_amount) WHERE reward_amount > 0",
+            ),
+        ]
+
+        # 커버링 인덱스로 대체되어 쓰기 비용과 용량만 늘리는 인덱스
+        superseded_indexes = [
+            # ix_technical_signals_date_indicator_cover가 대체
+            "ix_technical_signals_date_indicator",
+            # ix_technical_signals_indicator_date_cover가 대체
+            "ix_technical_signals_indicator_date",
+            # ix_ohlcv_date_mc(date, ticker, close, volume)가 대체
+            "ix_ohlcv_date_ticker",
+            # ix_ohlcv_ticker_date_cover가 대체
+            "ix_ohlcv_ticker_date",
+            # stocks.ticker 유니크 인덱스 + ix_stocks_name과 중복
+            "ix_stocks_ticker_name",
         ]
 
+        existing_indexes = set(
+            existing_tech_indexes
+            + existing_ohlcv_indexes
+            + existing_stocks_indexes
+            + existing_market_indexes
+            + existing_quiz_indexes
+        )
+        dropped_count = 0
+        for index_name in superseded_indexes:
+            if index_name in existing_indexes:
+                logger.info(f"대체된 인덱스 삭제 중: {index_name}")
+                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                dropped_count += 1
+
         created_count = 0
         for index_name, create_sql in indexes_to_create:
             if (
@@ -98,6 +177,7 @@ def create_performance_indexes():
                 and index_name not in existing_ohlcv_indexes
                 and index_name not in existing_stocks_indexes
                 and index_name not in existing_market_indexes
+                and index_name not in existing_quiz_indexes
             ):
                 logger.info(f"인덱스 생성 중: {index_name}")
                 cursor.execute(create_sql)
@@ -106,11 +186,28 @@ def create_performance_indexes():
                 logger.info(f"인덱스가 이미 존재합니다: {index_name}")
 
         conn.commit()
-        logger.info(f"총 {created_count}개의 인덱스가 생성되었습니다.")
+        logger.info(
+            f"총 {created_count}개의 인덱스가 생성되고 {dropped_count}개가 삭제되었습니다."
+        )
+
+        # 쿼리 플래너가 바뀐 인덱스 구성으로 선택하도록 통계 갱신
+        if created_count or dropped_count:
+            cursor.execute("ANALYZE")
+            conn.commit()
+            logger.info("ANALYZE 완료")
+
+        # 플래너가 신호 조회에 복합 인덱스를 사용하는지 확인
+        check_query_plans(cursor)
 
         # 최종 인덱스 목록 확인
         logger.info("=== 최종 인덱스 목록 ===")
-        for table in ["technical_signals", "ohlcv", "stocks", "market_index_ohlcv"]:
+        for table in [
+            "technical_signals",
+            "ohlcv",
+            "stocks",
+            "market_index_ohlcv",
+            "quiz_history",
+        ]:
             cursor.execute(f"PRAGMA index_list({table})")
             final_indexes = [row[1] for row in cursor.fetchall()]
             logger.info(f"{table}: {final_indexes}")
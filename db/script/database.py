@@ -7,6 +7,17 @@ DATABASE_URL = "sqlite:///./market.db"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def enable_wal_mode():
+    """
+    DB 파일을 WAL 모드로 전환합니다.
+    읽기/쓰기 동시성을 높이고 커밋당 fsync 비용을 줄이며, 설정은 DB 파일에 유지되므로 초기 구성 시 한 번만 실행합니다.
+    """
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+
 if __name__ == "__main__":
     print("Creating tables...")
     Base.metadata.create_all(bind=engine)
+    enable_wal_mode()
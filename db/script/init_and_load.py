@@ -1,5 +1,5 @@
 from db.script.models import Base, Stock, OHLCV, MarketIndexOHLCV, TechnicalSignal
-from db.script.database import engine, SessionLocal
+from db.script.database import engine, SessionLocal, enable_wal_mode
 from db.script.fetcher import (
     get_all_tickers_and_names,
     to_yf_ticker,
@@ -12,8 +12,9 @@ import argparse
 import sys
 from sqlalchemy import and_
 
-# 1. 테이블 생성
+# 1. 테이블 생성 및 WAL 모드 설정 (DB 파일에 유지됨)
 Base.metadata.create_all(bind=engine)
+enable_wal_mode()
 
 def main(start_date: str, end_date: str):
     """
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     Text,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
@@ -20,7 +21,7 @@ class Stock(Base):
     __tablename__ = "stocks"
     id = Column(Integer, primary_key=True, autoincrement=True)
     ticker = Column(String, unique=True, index=True)
-    name = Column(String)
+    name = Column(String, index=True)
     market = Column(String)
 
 
@@ -86,6 +87,16 @@ class QuizHistory(Base):
         Index("idx_quiz_completed_at", "completed_at"),
         Index("idx_quiz_id", "quiz_id"),
         Index("idx_quiz_is_correct", "is_correct"),
+        # 보상 자격/보상 집계 조회용 커버링 부분 인덱스
+        Index(
+            "idx_quiz_user_reward",
+            "request_id",
+            "is_correct",
+            "completed_at",
+            "reward_stock",
+            "reward_amount",
+            sqlite_where=text("reward_amount > 0"),
+        ),
     )
 
     def __repr__(self):
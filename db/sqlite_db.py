@@ -1,8 +1,33 @@
 import sqlite3
-from typing import Any, List, Tuple, Optional
+import threading
+from typing import Any, Dict, List, Tuple, Optional
 
 DB_PATH = "market.db"
 
+# 스레드별 공유 클라이언트 저장소 (sqlite3 연결은 생성한 스레드에서만 사용 가능)
+_thread_local = threading.local()
+
+# 모든 연결에 적용하는 PRAGMA (연결마다 적용되므로 캐시는 작게 유지)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",  # 잠금 대기 최대 5초
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8192",  # 페이지 캐시 최대 8MB
+)
+
+# 읽기 전용 공유 연결에만 추가로 적용하는 PRAGMA (조회 위주 경로용 대용량 캐시)
+_READONLY_SHARED_PRAGMAS = (
+    "PRAGMA cache_size=-131072",  # 페이지 캐시 최대 128MB
+    "PRAGMA mmap_size=1073741824",  # 최대 1GB 메모리 맵 I/O (read() 호출 없이 접근)
+)
+
+# 연결별 컴파일된 statement 캐시 크기 (기본 128)
+# 신호 도구는 조건/기간 조합별로 미리 만든 쿼리 문자열을 재사용하므로 재파싱 없이 적중
+_CACHED_STATEMENTS = 256
+
+# 프로세스당 한 번 실행하는 통계 갱신 여부 (PRAGMA optimize)
+_optimized = False
+
 
 class SqliteDBClient:
     """
@@ -11,12 +36,75 @@ class SqliteDBClient:
         db = SqliteDBClient()
         results = db.execute("SELECT * FROM ...", params)
         db.close()
+
+    반복 호출되는 짧은 쿼리는 공유 클라이언트를 사용합니다. (close 불필요)
+        db = SqliteDBClient.get_shared()
+        results = db.execute("SELECT * FROM ...", params)
+
+    조회만 하는 경로는 읽기 전용 공유 클라이언트를 사용할 수 있습니다.
+        db = SqliteDBClient.get_shared_readonly()
     """
 
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, readonly: bool = False):
         self.db_path = db_path
-        self.conn = sqlite3.connect(self.db_path)
+        if readonly:
+            # 읽기 전용 연결: 쓰기 트랜잭션과 락을 다투지 않음 (WAL 모드에서 효과적)
+            self.conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                cached_statements=_CACHED_STATEMENTS,
+            )
+        else:
+            self.conn = sqlite3.connect(
+                self.db_path, cached_statements=_CACHED_STATEMENTS
+            )
+        for pragma in _CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
         self.conn.row_factory = sqlite3.Row
+        self._shared = False
+
+    @classmethod
+    def get_shared(cls, db_path: str = DB_PATH) -> "SqliteDBClient":
+        """
+        현재 스레드에서 재사용되는 공유 클라이언트를 반환합니다.
+        호출마다 연결을 열고 닫는 비용을 없애기 위해 사용하며, close()는 무시됩니다.
+        프로세스에서 처음 만들 때 PRAGMA optimize로 플래너 통계(sqlite_stat1)를 갱신합니다.
+        """
+        global _optimized
+        clients = getattr(_thread_local, "clients", None)
+        if clients is None:
+            clients = _thread_local.clients = {}
+
+        client = clients.get(db_path)
+        if client is None:
+            client = cls(db_path)
+            client._shared = True
+            if not _optimized:
+                client.conn.execute("PRAGMA optimize")
+                _optimized = True
+            clients[db_path] = client
+        return client
+
+    @classmethod
+    def get_shared_readonly(cls, db_path: str = DB_PATH) -> "SqliteDBClient":
+        """
+        현재 스레드에서 재사용되는 읽기 전용 공유 클라이언트를 반환합니다.
+        조회 전용 경로에서 사용하며, WAL 모드는 DB 초기 구성 스크립트에서 한 번 설정합니다.
+        대용량 페이지 캐시와 메모리 맵 I/O는 이 연결에만 적용합니다.
+        """
+        clients = getattr(_thread_local, "clients", None)
+        if clients is None:
+            clients = _thread_local.clients = {}
+
+        key = (db_path, "ro")
+        client = clients.get(key)
+        if client is None:
+            client = cls(db_path, readonly=True)
+            for pragma in _READONLY_SHARED_PRAGMAS:
+                client.conn.execute(pragma)
+            client._shared = True
+            clients[key] = client
+        return client
 
     def execute(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         cursor = self.conn.execute(query, params)
@@ -40,5 +128,21 @@ class SqliteDBClient:
         results = cursor.fetchall()
         return results, columns
 
+    def execute_columns(self, query: str, params: tuple = ()) -> Dict[str, List[Any]]:
+        """
+        쿼리를 실행하고 결과를 열 이름별 리스트로 반환합니다.
+        행마다 sqlite3.Row를 만들지 않고 열당 리스트 하나로 모으므로
+        DataFrame 생성 등 열 단위로 처리하는 경로에서 사용합니다.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # sqlite3.Row 대신 가벼운 tuple 행 사용
+        cursor.execute(query, params)
+        columns = [description[0] for description in cursor.description]
+        values = list(zip(*cursor.fetchall())) or [()] * len(columns)
+        return {name: list(column) for name, column in zip(columns, values)}
+
     def close(self):
+        # 공유 클라이언트는 프로세스 종료 시까지 유지
+        if self._shared:
+            return
         self.conn.close()
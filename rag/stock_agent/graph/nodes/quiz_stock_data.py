@@ -12,7 +12,9 @@ from rag.stock_agent.graph.tools.quiz.session_manager import (
     QuizSessionPhase,
 )
 from rag.stock_agent.graph.tools.quiz.database import QuizDatabase
-from rag.stock_agent.graph.tools.news.naver_news_search import naver_news_search_tool
+from rag.stock_agent.graph.tools.news.naver_news_search import (
+    get_naver_news_search_tool,
+)
 from utils.logger import get_logger
 import os
 
@@ -190,9 +192,11 @@ def _handle_user_answer(state: StockAgentState, user_answer: str) -> StockAgentS
             state, QuizSessionPhase.PROCESSING
         )
 
-        # 답변 검증
+        # 답변 검증 (번호/기업명이 정확히 일치하면 LLM 없이 바로 판정)
         checker = QuizAnswerChecker()
-        answer_result = checker.check_answer(current_quiz, user_answer)
+        answer_result = checker.check_exact_match(current_quiz, user_answer)
+        if answer_result is None:
+            answer_result = checker.check_answer(current_quiz, user_answer)
 
         if not answer_result.get("success", False):
             logger.error(f"답변 검증 실패: {answer_result}")
@@ -364,12 +368,17 @@ def _handle_hint_request(
         # 힌트 사용 표시
         state["quiz_hint_used"] = True
 
-        # 1. 기존 힌트 생성
+        # 1. 네이버 뉴스 기반 힌트 생성 (배경지식 키워드도 함께 추출)
+        news_hint_result = get_naver_news_search_tool().generate_news_based_hint(
+            quiz_data
+        )
+
+        # 2. 기존 힌트 + 뉴스 힌트에서 함께 추출된 배경지식 키워드
         checker = QuizAnswerChecker()
         traditional_hint = checker.get_hint(quiz_data)
-
-        # 2. 네이버 뉴스 기반 힌트 생성
-        news_hint_result = naver_news_search_tool.generate_news_based_hint(quiz_data)
+        background_keywords = news_hint_result.get("background_keywords", [])
+        if background_keywords:
+            traditional_hint += f"\n💡 키워드: {', '.join(background_keywords)}"
 
         # 3. 힌트 메시지 통합 구성
         hint_message = _combine_hints(traditional_hint, news_hint_result)
@@ -33,7 +33,9 @@ from .generate_response_prompts import (
 )
 from .quiz_prompts import (
     get_company_insight_prompt,
+    get_company_profile_block,
     get_quiz_answer_check_prompt,
+    COMPANY_INSIGHT_SYSTEM_MSG,
     COMPANY_INSIGHT_TEMPLATE_FIELDS,
     QUIZ_CHECK_RESPONSE_FORMAT,
     MIN_INSIGHT_LENGTH,
@@ -63,7 +65,9 @@ __all__ = [
     "GENERATE_RESPONSE_SYSTEM_MSG",
     "CLARIFIED_QUERY_SYSTEM_MSG",
     "get_company_insight_prompt",
+    "get_company_profile_block",
     "get_quiz_answer_check_prompt",
+    "COMPANY_INSIGHT_SYSTEM_MSG",
     "COMPANY_INSIGHT_TEMPLATE_FIELDS",
     "QUIZ_CHECK_RESPONSE_FORMAT",
     "MIN_INSIGHT_LENGTH",
@@ -1,53 +1,87 @@
 # quiz_prompts.py - 퀴즈 관련 프롬프트 정의
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+
+# 기업 통찰 스낵글 생성용 시스템 메시지
+# 기업과 무관한 지시문만 담아 모든 요청에서 동일한 접두부가 되도록 유지 (LLM 프롬프트 캐시 적중)
+COMPANY_INSIGHT_SYSTEM_MSG = """
+당신은 투자 전문 분석가입니다. 주어진 실제 데이터를 바탕으로 정확히 다음 템플릿 구조를 지켜서 투자자 관점의 기업 스낵글을 작성해주세요.
+
+**템플릿 구조:**
+[회사명]는 [업종] 분야의 [시장포지션]으로, [사업모델]을 통해 수익을 창출합니다. 최근 [분석기간]일간 [주가변동]하며 [현재상황] 상황입니다.
+
+**작성 규칙:**
+1. 반드시 위 템플릿 구조를 따라 작성하세요
+2. 제공된 실제 데이터만을 사용하세요
+3. 주가 분석 기간은 영업일 기준이므로 실제 달력상 기간임을 고려하세요
+4. 주가 변동률과 업종 특성을 고려하여 자연스럽게 최근 상황을 설명하세요
+5. 정중한 존댓말로 작성하세요
+6. 1문단 4-6문장으로 제한하세요
+7. 투자자가 알아두면 좋은 핵심 정보를 포함하세요
+""".strip()
+
+
+def get_company_profile_block(company_name: str, static_data: Dict[str, Any]) -> str:
+    """
+    기업별로 변하지 않는 정적 데이터 블록을 생성합니다.
+    같은 기업에 대한 요청은 시스템 메시지 + 이 블록까지 동일한 접두부를 공유합니다.
+
+    Args:
+        company_name: 기업명
+        static_data: 업종/사업 모델 등 정적 데이터
+
+    Returns:
+        정적 데이터 블록 문자열
+    """
+
+    return f"""**제공된 실제 데이터:**
+- 회사명: {company_name}
+- 업종: {static_data.get('sector', '정보없음')}
+- 사업 모델: {static_data.get('business_model', '정보없음')}"""
 
 
 def get_company_insight_prompt(
-    company_name: str, combined_data: Dict[str, Any], quiz_background: str = ""
-) -> str:
+    company_name: str,
+    combined_data: Dict[str, Any],
+    quiz_background: str = "",
+    company_profile: str = "",
+) -> List[Dict[str, str]]:
     """
     기업 통찰 스낵글 생성을 위한 구조화된 프롬프트
 
+    고정 지시문은 시스템 메시지에, 기업별 데이터는 사용자 메시지에만 담습니다.
+    사용자 메시지는 기업별 정적 블록 → 실시간 데이터 순서로 구성합니다.
+
     Args:
         company_name: 기업명
         combined_data: 정적 + 동적 데이터 결합
         quiz_background: 퀴즈 배경지식
+        company_profile: 미리 생성한 기업별 정적 블록 (없으면 combined_data로 생성)
 
     Returns:
-        LLM에게 전달할 프롬프트 문자열
+        LLM에게 전달할 메시지 리스트
     """
 
-    prompt = f"""
-당신은 투자 전문 분석가입니다. 주어진 실제 데이터를 바탕으로 정확히 다음 템플릿 구조를 지켜서 투자자 관점의 기업 스낵글을 작성해주세요.
-
-**템플릿 구조:**
-[회사명]는 [업종] 분야의 [시장포지션]으로, [사업모델]을 통해 수익을 창출합니다. 최근 [분석기간]일간 [주가변동]하며 [현재상황] 상황입니다.
+    if not company_profile:
+        company_profile = get_company_profile_block(company_name, combined_data)
 
-**제공된 실제 데이터:**
-- 회사명: {company_name}
-- 업종: {combined_data.get('sector', '정보없음')}
+    user_msg = f"""
+{company_profile}
 - 시가총액 순위: {combined_data.get('market_cap_rank', '정보없음')}위
 - 시장 포지션: {combined_data.get('market_position', '정보없음')}
-- 사업 모델: {combined_data.get('business_model', '정보없음')}
 - 주가 분석 기간: {combined_data.get('actual_days', 30)}일 (영업일 기준 약 30거래일)
 - 해당 기간 주가 변동: {combined_data.get('price_trend', 0):.1f}%
 - 현재 상황: {combined_data.get('current_status', '정보없음')}
 
-**작성 규칙:**
-1. 반드시 위 템플릿 구조를 따라 작성하세요
-2. 제공된 실제 데이터만을 사용하세요
-3. 주가 분석 기간은 영업일 기준이므로 실제 달력상 기간임을 고려하세요
-4. 주가 변동률과 업종 특성을 고려하여 자연스럽게 최근 상황을 설명하세요
-5. 정중한 존댓말로 작성하세요  
-6. 1문단 4-6문장으로 제한하세요
-7. 투자자가 알아두면 좋은 핵심 정보를 포함하세요
-
 퀴즈 배경지식 참고: {quiz_background if quiz_background else "없음"}
 
 스낵글:
 """
-    return prompt.strip()
+    return [
+        {"role": "system", "content": COMPANY_INSIGHT_SYSTEM_MSG},
+        {"role": "user", "content": user_msg.strip()},
+    ]
 
 
 def get_quiz_answer_check_prompt(
@@ -22,7 +22,8 @@ class StockAgentState(TypedDict):
     # 퀴즈 세션 관리 필드들
     quiz_session_active: bool - 퀴즈 세션 활성 여부 (기본: False)
     quiz_current_question: Dict[str, Any] - 현재 퀴즈 문제 정보
-    quiz_session_start_time: str - 퀴즈 세션 시작 시간 (ISO format)
+    quiz_session_start_time: str - 퀴즈 세션 시작 시간 (ISO format, 표시용)
+    quiz_session_start_ts: float - 퀴즈 세션 시작 시각 (time.monotonic(), 경과시간 계산용)
     quiz_hint_used: bool - 힌트 사용 여부 (기본: False)
     quiz_session_phase: str - 퀴즈 세션 단계 ("inactive", "asking", "processing", "completed")
     quiz_session_id: str - 세션 고유 ID
@@ -41,6 +42,7 @@ class StockAgentState(TypedDict):
     quiz_session_active: bool
     quiz_current_question: Dict[str, Any]
     quiz_session_start_time: str
+    quiz_session_start_ts: float
     quiz_hint_used: bool
     quiz_session_phase: str
     quiz_session_id: str
@@ -61,6 +63,7 @@ def default_stock_agent_state() -> StockAgentState:
         quiz_session_active=False,
         quiz_current_question={},
         quiz_session_start_time="",
+        quiz_session_start_ts=0.0,
         quiz_hint_used=False,
         quiz_session_phase="inactive",
         quiz_session_id="",
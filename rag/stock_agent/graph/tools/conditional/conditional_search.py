@@ -120,7 +120,7 @@ def get_stocks_by_price_range(
     """
     특정 날짜 또는 기간에 주어진 가격 범위에 해당하는 종목들을 조회합니다.
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     # 날짜 조건 결정 (기간 또는 단일 날짜)
     if start_date and end_date:
@@ -243,7 +243,7 @@ def get_stocks_by_volume(
     """
     특정 날짜 또는 기간에 거래량이 기준 이상인 종목들을 조회합니다.
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     # 날짜 조건 결정 (기간 또는 단일 날짜)
     if start_date and end_date:
@@ -352,7 +352,7 @@ def get_stocks_by_change_rate(
     """
     특정 날짜 또는 기간에 등락률이 기준 범위에 해당하는 종목들을 조회합니다.
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     # 날짜 조건 결정 (기간 또는 단일 날짜)
     if start_date and end_date:
@@ -478,7 +478,7 @@ def get_stocks_by_volume_change(
     """
     특정 날짜 또는 기간에 전일 대비 거래량이 기준 비율 이상 증가한 종목들을 조회합니다.
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     # 날짜 조건 결정 (기간 또는 단일 날짜)
     if start_date and end_date:
@@ -624,7 +624,7 @@ def get_stocks_by_combined_conditions(
     """
     여러 조건을 조합하여 종목들을 필터링합니다. 기간 또는 단일 날짜 조회를 지원합니다.
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     # 날짜 조건 결정 (기간 또는 단일 날짜)
     if start_date and end_date:
@@ -831,7 +831,7 @@ def get_top_stocks_by_price(
     """
     특정 시장에서 종가/거래량/등락률 기준 상위 N개 종목을 조회합니다.
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     # 시장별 종목 필터링
     market_filter = ""
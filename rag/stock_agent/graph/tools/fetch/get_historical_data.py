@@ -52,7 +52,7 @@ def get_historical_data(
         조회된 데이터 딕셔너리 또는 에러 메시지
         항상 일관된 구조로 반환: 시가, 고가, 저가, 종가, 거래량, 등락률, 거래대금, 날짜
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     try:
         # 기본 쿼리 구성
@@ -113,8 +113,6 @@ def get_historical_data(
 
     except Exception as e:
         return {"error": f"Database error: {str(e)}"}
-    finally:
-        db_client.close()
 
 
 def _format_row_data(row_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -193,7 +191,7 @@ def get_stock_ranking(
     Returns:
         종목의 순위 정보와 해당 지표값
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     try:
         # 1. 해당 종목의 데이터 조회
@@ -269,8 +267,6 @@ def get_stock_ranking(
 
     except Exception as e:
         return {"error": f"Database error: {str(e)}"}
-    finally:
-        db_client.close()
 
 
 class StockComparisonInput(BaseModel):
@@ -314,7 +310,7 @@ def get_stock_comparison(
     Returns:
         종목별 비교 결과와 우위 분석
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     try:
         # 시가총액 비교가 포함된 경우 yfinance로 시가총액 데이터 조회
@@ -426,8 +422,6 @@ def get_stock_comparison(
 
     except Exception as e:
         return {"error": f"Database error: {str(e)}"}
-    finally:
-        db_client.close()
 
 
 class MarketAverageComparisonInput(BaseModel):
@@ -468,7 +462,7 @@ def get_market_average_comparison(
     Returns:
         종목 지표와 시장 평균 비교 결과
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     try:
         # 1. 해당 종목의 데이터 조회
@@ -533,8 +527,6 @@ def get_market_average_comparison(
 
     except Exception as e:
         return {"error": f"Database error: {str(e)}"}
-    finally:
-        db_client.close()
 
 
 class MarketRatioInput(BaseModel):
@@ -575,7 +567,7 @@ def get_market_ratio(
     Returns:
         종목의 시장 비율 정보
     """
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     try:
         # 1. 해당 종목의 데이터 조회
@@ -636,5 +628,3 @@ def get_market_ratio(
 
     except Exception as e:
         return {"error": f"Database error: {str(e)}"}
-    finally:
-        db_client.close()
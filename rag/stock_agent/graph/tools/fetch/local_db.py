@@ -26,7 +26,7 @@ def get_market_ohlcv(market: Market, date: str):
     질문에 따라 필요한 정보만 반환합니다.
     """
 
-    db_client = SqliteDBClient()
+    db_client = SqliteDBClient.get_shared()
 
     if market == Market.KOSPI:
         results, columes = db_client.fetch_query(
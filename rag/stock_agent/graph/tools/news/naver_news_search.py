@@ -1,31 +1,236 @@
+import functools
 import os
-from typing import Dict, Any, List
+import re
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from langchain_naver import ChatClovaX
+from pydantic import BaseModel, Field, ValidationError
+from rag.stock_agent.graph.utils import (
+    cache_llm_response,
+    cached_llm_invoke,
+    get_cached_llm_response,
+    get_shared_executor,
+)
 from utils.logger import get_logger
 
 load_dotenv()
 
 logger = get_logger(__name__)
 
+# 키워드 추출 프롬프트 버전 (프롬프트 변경 시 올려서 캐시 무효화)
+PROMPT_VERSION = "v3"
+
+# 힌트 번들 구조화 출력 검증 실패 시 재시도 횟수
+HINT_BUNDLE_MAX_RETRIES = 1
+
+# 힌트 번들 재요청 시 프롬프트에 덧붙이는 고정 안내문
+HINT_BUNDLE_RETRY_INSTRUCTION = """
+이전 답변이 올바른 JSON 형식이 아니었습니다. 다른 설명 없이 위 답변 형식의 유효한 JSON만 다시 답변해주세요.
+"""
+
+# 키워드 추출 LLM 호출을 생략하는 최소 입력 길이
+MIN_KEYWORD_SOURCE_LENGTH = 30
+
+# 키워드 추출 프롬프트에 넣을 뉴스 내용 토큰 예산 (한글 약 2자/토큰)
+NEWS_CONTENT_TOKEN_BUDGET = 750
+_CHARS_PER_TOKEN = 2
+
+# 동시에 검색할 상위 키워드 개수
+NEWS_SEARCH_FANOUT = 3
+
+# 네이버 검색 API 타임아웃 (연결, 응답) 초
+NAVER_SEARCH_TIMEOUT = (3.05, 7)
+
+# 네이버 검색 API 재시도 정책
+_NAVER_SEARCH_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+)
+
+# 네이버 검색 결과의 강조 태그 (<b>, </b>)
+_BTAG_RE = re.compile(r"</?b>")
+
+# 업종별 키워드 매핑
+_SECTOR_MAPPING = MappingProxyType(
+    {
+        "전자": ("전자", "IT", "기술"),
+        "반도체": ("반도체", "메모리", "칩"),
+        "자동차": ("자동차", "차량", "모빌리티"),
+        "바이오": ("바이오", "제약", "의료"),
+        "금융": ("금융", "은행", "보험"),
+        "건설": ("건설", "부동산"),
+        "화학": ("화학", "석유"),
+        "통신": ("통신", "네트워크"),
+        "유통": ("유통", "소매", "마트"),
+    }
+)
+_SECTOR_RE = re.compile("|".join(re.escape(sector) for sector in _SECTOR_MAPPING))
+
+# 배경지식에서 찾을 추가 키워드 패턴 (그룹명 순서대로 키워드 추가)
+_BG_TOKEN_RE = re.compile(r"(?P<listing>상장)|(?P<ipo>IPO|공모)|(?P<mcap>시총|시가총액)")
+_BG_TOKEN_KEYWORDS = (("listing", "상장"), ("ipo", "IPO"), ("mcap", "시가총액"))
+
+# 키워드 추출 프롬프트 템플릿 (payload: 추출 대상, exclude: 제외할 정답 기업명)
+_PROMPT_TEMPLATES = MappingProxyType(
+    {
+        "company": """
+다음 기업명에서 검색에 유용한 핵심 키워드 3-5개를 추출해주세요.
+
+기업명: {payload}
+
+요구사항:
+1. 기업명 자체는 제외하고 추출
+2. 업종, 주요 사업, 특징, 기술 등을 포함
+3. 검색 가능한 형태로 추출
+4. 다른 설명 없이 문자열 JSON 배열로만 답변
+
+예시: "삼성전자" → ["반도체", "메모리", "스마트폰", "가전"]
+예시: "현대자동차" → ["자동차", "전기차", "수출", "국내최대"]
+
+답변 형식: ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"]
+""",
+        "text": """
+다음 텍스트에서 검색에 유용한 핵심 키워드 3-5개를 추출해주세요.
+
+텍스트: {payload}
+
+요구사항:
+1. 기업명은 제외하고 추출
+2. 업종, 특징, 연도, 금액, 기술명 등을 포함
+3. 검색 가능한 형태로 추출
+4. 다른 설명 없이 문자열 JSON 배열로만 답변
+
+예시: ["반도체", "메모리", "2023년", "AI", "자동차"]
+""",
+        "news": """
+다음 뉴스 내용에서 퀴즈와 관련된 핵심 키워드 3-5개를 추출해주세요.
+
+뉴스 내용: {payload}
+
+요구사항:
+1. 정답 기업명 "{exclude}"은 절대 포함하지 마세요
+2. 기업명의 일부분도 포함하지 마세요
+3. 업종, 기술, 트렌드, 특징 등을 포함해주세요
+4. 다른 설명 없이 문자열 JSON 배열로만 답변해주세요
+
+답변 형식: ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"]
+
+예시: ["AI", "반도체", "메모리", "자율주행", "전기차"]
+""",
+    }
+)
+
+# 뉴스 제목 정규화용 공백 패턴
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# LLM 키워드 응답에서 제외할 설명성 접두사
+_BAD_PREFIXES = ("예시", "답변")
+
+
+def _build_news_content(news_results: List[Dict[str, Any]]) -> str:
+    """중복 제목을 제외한 뉴스 내용을 토큰 예산 내로 통합합니다."""
+    chunks = []
+    seen_titles = set()
+    for item in news_results:
+        title = item.get("title", "")
+        normalized_title = _WHITESPACE_RE.sub(" ", title).strip().lower()
+        if normalized_title in seen_titles:
+            continue
+        seen_titles.add(normalized_title)
+        chunks.append(title)
+        chunks.append(item.get("content", ""))
+
+    return " ".join(chunks)[: NEWS_CONTENT_TOKEN_BUDGET * _CHARS_PER_TOKEN]
+
+
+def _parse_keyword_json(text: str, limit: int = 5, exclude: str = "") -> List[str]:
+    """JSON 배열 형식의 LLM 응답을 키워드 리스트로 변환합니다. (형식 오류 시 쉼표 파싱)"""
+    start, end = text.find("["), text.rfind("]")
+    try:
+        parsed = orjson.loads(text[start : end + 1]) if start != -1 else None
+    except orjson.JSONDecodeError:
+        parsed = None
+
+    if not isinstance(parsed, list):
+        return _parse_keyword_csv(text, limit=limit, exclude=exclude)
+
+    keywords = []
+    for raw in parsed:
+        if not isinstance(raw, str):
+            continue
+        kw = raw.strip()
+        if not kw or len(kw) > 20 or (exclude and exclude in kw):
+            continue
+        keywords.append(kw)
+        if len(keywords) >= limit:
+            break
+    return keywords
+
+
+def _parse_keyword_csv(text: str, limit: int = 5, exclude: str = "") -> List[str]:
+    """쉼표로 구분된 LLM 응답을 키워드 리스트로 변환합니다."""
+    keywords = []
+    for raw in text.split(","):
+        kw = raw.strip()
+        # 설명이나 추가 텍스트 제거
+        if not kw or len(kw) > 20 or kw.startswith(_BAD_PREFIXES):
+            continue
+        # "키워드:" 접두사 제거
+        if kw.startswith("키워드:"):
+            kw = kw[4:].strip()
+        # 제외 대상(정답 기업명)이 포함된 키워드 제거
+        if not kw or (exclude and exclude in kw):
+            continue
+        keywords.append(kw)
+        if len(keywords) >= limit:
+            break
+    return keywords
+
+
+class HintBundle(BaseModel):
+    """뉴스/배경지식 키워드를 한 번의 LLM 호출로 받기 위한 구조화 출력"""
+
+    news_keywords: List[str] = Field(
+        default_factory=list, description="뉴스 내용에서 추출한 핵심 키워드"
+    )
+    background_keywords: List[str] = Field(
+        default_factory=list, description="퀴즈 배경지식에서 추출한 핵심 키워드"
+    )
+
 
 class NaverSearchAPIWrapper:
     """네이버 검색 API 래퍼 (LangChain 스타일)"""
 
+    __slots__ = ("client_id", "client_secret", "base_url", "_session")
+
     def __init__(self, naver_client_id: str, naver_client_secret: str):
         self.client_id = naver_client_id
         self.client_secret = naver_client_secret
         self.base_url = "https://openapi.naver.com/v1/search"
 
+        # 커넥션 재사용을 위한 세션 (스레드 간 공유)
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "X-Naver-Client-Id": self.client_id,
+                "X-Naver-Client-Secret": self.client_secret,
+            }
+        )
+        self._session.mount("https://", HTTPAdapter(max_retries=_NAVER_SEARCH_RETRY))
+
     def run(self, query: str, search_type: str = "news", max_results: int = 5) -> str:
         """검색을 실행하고 결과를 문자열로 반환합니다."""
         try:
             url = f"{self.base_url}/{search_type}.json"
-            headers = {
-                "X-Naver-Client-Id": self.client_id,
-                "X-Naver-Client-Secret": self.client_secret,
-            }
             params = {
                 "query": query,
                 "display": max_results,
@@ -33,23 +238,21 @@ class NaverSearchAPIWrapper:
                 "sort": "date" if search_type == "news" else "sim",
             }
 
-            response = requests.get(url, headers=headers, params=params)
+            response = self._session.get(
+                url, params=params, timeout=NAVER_SEARCH_TIMEOUT
+            )
             response.raise_for_status()
 
-            data = response.json()
+            # 응답 바이트를 바로 파싱 (텍스트 디코딩 단계 생략)
+            data = orjson.loads(response.content)
             results = []
 
-            if "items" in data:
-                for item in data["items"]:
-                    title = item.get("title", "").replace("<b>", "").replace("</b>", "")
-                    description = (
-                        item.get("description", "")
-                        .replace("<b>", "")
-                        .replace("</b>", "")
-                    )
-                    link = item.get("link", "")
+            for item in data.get("items", ()):
+                title = _BTAG_RE.sub("", item.get("title", ""))
+                description = _BTAG_RE.sub("", item.get("description", ""))
+                link = item.get("link", "")
 
-                    results.append(f"{title} - {description} {link}")
+                results.append(f"{title} - {description} {link}")
 
             return "\n".join(results)
 
@@ -61,6 +264,14 @@ class NaverSearchAPIWrapper:
 class NaverNewsSearchTool:
     """네이버 뉴스 검색을 통한 최근 뉴스 기반 힌트 생성 도구"""
 
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "search_available",
+        "search_wrapper",
+        "llm",
+    )
+
     def __init__(self):
         """네이버 뉴스 검색 도구 초기화"""
         try:
@@ -116,8 +327,14 @@ class NaverNewsSearchTool:
             if not news_results:
                 return self._get_fallback_hint("관련 뉴스를 찾을 수 없습니다.")
 
-            # 3. 뉴스 내용 분석 및 키워드 추출
-            news_keywords = self._extract_news_keywords(news_results, quiz_data)
+            # 3. 뉴스/배경지식 키워드를 한 번의 호출로 추출 (실패 시 뉴스 키워드만 개별 추출)
+            hint_bundle = self._extract_hint_bundle(news_results, quiz_data)
+            if hint_bundle is not None:
+                news_keywords = hint_bundle.news_keywords
+                background_keywords = hint_bundle.background_keywords
+            else:
+                news_keywords = self._extract_news_keywords(news_results, quiz_data)
+                background_keywords = []
 
             # 4. 힌트 메시지 생성
             hint_message = self._create_hint_message(news_keywords, quiz_data)
@@ -129,6 +346,7 @@ class NaverNewsSearchTool:
                 "search_keywords": search_keywords,
                 "news_count": len(news_results),
                 "extracted_keywords": news_keywords,
+                "background_keywords": background_keywords,
                 "raw_news": news_results[:3],  # 디버깅용 (최대 3개)
             }
 
@@ -156,8 +374,8 @@ class NaverNewsSearchTool:
             additional_keywords = self._get_additional_keywords(quiz_data)
             keywords.extend(additional_keywords)
 
-            # 3. 중복 제거
-            unique_keywords = list(set(keywords))
+            # 3. 중복 제거 (순서 유지)
+            unique_keywords = list(dict.fromkeys(keywords))
 
             # 4. 검색 가능한 키워드만 필터링 (2글자 이상)
             searchable_keywords = [kw for kw in unique_keywords if len(kw) >= 2]
@@ -169,47 +387,18 @@ class NaverNewsSearchTool:
             logger.error(f"검색 키워드 생성 중 오류: {e}")
             return []
 
+    def _llm_extract(self, kind: str, payload: str, exclude: str = "") -> List[str]:
+        """종류별 프롬프트 템플릿으로 LLM 키워드 추출을 수행합니다."""
+        prompt = _PROMPT_TEMPLATES[kind].format(payload=payload, exclude=exclude)
+        result = cached_llm_invoke(self.llm, prompt, PROMPT_VERSION)
+
+        # JSON 배열을 키워드 리스트로 변환 (최대 5개)
+        return _parse_keyword_json(result, exclude=exclude)
+
     def _extract_keywords_from_company(self, company_name: str) -> List[str]:
         """정답 기업명에서 검색 키워드를 추출합니다."""
         try:
-            # LLM을 사용하여 기업명에서 키워드 추출
-            prompt = f"""
-다음 기업명에서 검색에 유용한 핵심 키워드 3-5개를 추출해주세요.
-
-기업명: {company_name}
-
-요구사항:
-1. 기업명 자체는 제외하고 추출
-2. 업종, 주요 사업, 특징, 기술 등을 포함
-3. 검색 가능한 형태로 추출
-4. 쉼표로만 구분하여 답변 (다른 설명 없이)
-
-예시: "삼성전자" → "반도체, 메모리, 스마트폰, 가전"
-예시: "현대자동차" → "자동차, 전기차, 수출, 국내최대"
-
-답변 형식: 키워드1, 키워드2, 키워드3, 키워드4, 키워드5
-"""
-
-            response = self.llm.invoke(prompt)
-            result = response.content.strip()
-
-            # 쉼표로 분리하여 키워드 리스트 생성
-            keywords = []
-            for kw in result.split(","):
-                kw = kw.strip()
-                # 설명이나 추가 텍스트 제거
-                if (
-                    kw
-                    and len(kw) <= 20
-                    and not kw.startswith("예시")
-                    and not kw.startswith("답변")
-                ):
-                    # "키워드:" 접두사 제거
-                    if kw.startswith("키워드:"):
-                        kw = kw[4:].strip()
-                    keywords.append(kw)
-
-            return keywords[:5]  # 최대 5개
+            return self._llm_extract("company", company_name)
 
         except Exception as e:
             logger.error(f"기업명 키워드 추출 중 오류: {e}")
@@ -218,41 +407,11 @@ class NaverNewsSearchTool:
     def _extract_keywords_from_text(self, text: str) -> List[str]:
         """텍스트에서 핵심 키워드를 추출합니다."""
         try:
-            # LLM을 사용하여 키워드 추출
-            prompt = f"""
-다음 텍스트에서 검색에 유용한 핵심 키워드 3-5개를 추출해주세요.
-
-텍스트: {text}
-
-요구사항:
-1. 기업명은 제외하고 추출
-2. 업종, 특징, 연도, 금액, 기술명 등을 포함
-3. 검색 가능한 형태로 추출
-4. 쉼표로 구분하여 답변
-
-예시: "반도체, 메모리, 2023년, AI, 자동차"
-"""
-
-            response = self.llm.invoke(prompt)
-            result = response.content.strip()
+            # 입력이 너무 짧으면 LLM 호출 생략
+            if len(text.strip()) < MIN_KEYWORD_SOURCE_LENGTH:
+                return []
 
-            # 쉼표로 분리하여 키워드 리스트 생성
-            keywords = []
-            for kw in result.split(","):
-                kw = kw.strip()
-                # 설명이나 추가 텍스트 제거
-                if (
-                    kw
-                    and len(kw) <= 20
-                    and not kw.startswith("예시")
-                    and not kw.startswith("답변")
-                ):
-                    # "키워드:" 접두사 제거
-                    if kw.startswith("키워드:"):
-                        kw = kw[4:].strip()
-                    keywords.append(kw)
-
-            return keywords[:5]  # 최대 5개
+            return self._llm_extract("text", text)
 
         except Exception as e:
             logger.error(f"텍스트 키워드 추출 중 오류: {e}")
@@ -275,12 +434,12 @@ class NaverNewsSearchTool:
 
             # 배경지식에서 추가 키워드
             background = quiz_data.get("background", "")
-            if "상장" in background:
-                keywords.append("상장")
-            if "IPO" in background or "공모" in background:
-                keywords.append("IPO")
-            if "시총" in background or "시가총액" in background:
-                keywords.append("시가총액")
+            found = set()
+            for match in _BG_TOKEN_RE.finditer(background):
+                found.add(match.lastgroup)
+                if len(found) == len(_BG_TOKEN_KEYWORDS):
+                    break
+            keywords.extend(kw for name, kw in _BG_TOKEN_KEYWORDS if name in found)
 
         except Exception as e:
             logger.error(f"추가 키워드 추출 중 오류: {e}")
@@ -289,27 +448,8 @@ class NaverNewsSearchTool:
 
     def _extract_sector_keywords(self, company_name: str) -> List[str]:
         """기업명에서 업종 관련 키워드를 추출합니다."""
-        sector_keywords = []
-
-        # 업종별 키워드 매핑
-        sector_mapping = {
-            "전자": ["전자", "IT", "기술"],
-            "반도체": ["반도체", "메모리", "칩"],
-            "자동차": ["자동차", "차량", "모빌리티"],
-            "바이오": ["바이오", "제약", "의료"],
-            "금융": ["금융", "은행", "보험"],
-            "건설": ["건설", "부동산"],
-            "화학": ["화학", "석유"],
-            "통신": ["통신", "네트워크"],
-            "유통": ["유통", "소매", "마트"],
-        }
-
-        for sector, keywords in sector_mapping.items():
-            if sector in company_name:
-                sector_keywords.extend(keywords)
-                break
-
-        return sector_keywords
+        match = _SECTOR_RE.search(company_name)
+        return list(_SECTOR_MAPPING[match.group(0)]) if match else []
 
     def _search_recent_news(
         self, keywords: List[str], max_count: int
@@ -319,23 +459,31 @@ class NaverNewsSearchTool:
             if not keywords:
                 return []
 
-            # 가장 관련성 높은 키워드로 검색
-            primary_keyword = keywords[0]
+            # 관련성 높은 상위 키워드들로 동시에 검색
+            search_queries = [f"{kw} 뉴스" for kw in keywords[:NEWS_SEARCH_FANOUT]]
 
-            # 최근 1주일 내 뉴스 검색
-            search_query = f"{primary_keyword} 뉴스"
-
-            logger.info(f"뉴스 검색 실행 (LangChain 스타일): {search_query}")
+            logger.info(f"뉴스 검색 실행 (LangChain 스타일): {search_queries}")
 
             # LangChain 스타일의 NaverSearchAPIWrapper 사용
-            search_results = self.search_wrapper.run(
-                search_query, search_type="news", max_results=max_count
+            search_results_list = get_shared_executor().map(
+                lambda query: self.search_wrapper.run(
+                    query, search_type="news", max_results=max_count
+                ),
+                search_queries,
             )
 
-            # 검색 결과 파싱
-            news_items = self._parse_search_results(search_results, max_count)
+            # 검색 결과 파싱 후 병합 (앞선 키워드 결과 우선, 중복 기사 제거)
+            news_items = []
+            seen = set()
+            for search_results in search_results_list:
+                for item in self._parse_search_results(search_results, max_count):
+                    item_key = (item["title"], item["link"])
+                    if item_key in seen:
+                        continue
+                    seen.add(item_key)
+                    news_items.append(item)
 
-            return news_items
+            return news_items[:max_count]
 
         except Exception as e:
             logger.error(f"뉴스 검색 중 오류: {e}")
@@ -359,35 +507,27 @@ class NaverNewsSearchTool:
                 if not line:
                     continue
 
-                # 제목과 링크 추출 (간단한 파싱)
-                if " - " in line and "http" in line:
-                    # 제목 - 설명 링크 형식
-                    parts = line.split(" - ")
-                    title = parts[0].strip()
-
-                    # 설명과 링크 분리
-                    remaining = " - ".join(parts[1:])
-                    if "http" in remaining:
-                        desc_link_parts = remaining.split("http")
-                        description = desc_link_parts[0].strip()
-                        link = "http" + desc_link_parts[1].strip()
-                    else:
-                        description = remaining
-                        link = ""
-
-                    news_items.append(
-                        {
-                            "title": title,
-                            "content": description,
-                            "date": "",  # 날짜 정보는 별도로 추출 필요
-                            "link": link,
-                        }
-                    )
-                else:
+                # 제목 - 설명 링크 형식 (첫 구분자 기준으로 분리)
+                title, sep, remaining = line.partition(" - ")
+                if not sep:
                     # 단순한 형식
                     news_items.append(
                         {"title": line, "content": line, "date": "", "link": ""}
                     )
+                    continue
+
+                # 설명과 링크 분리
+                description, link_sep, link_tail = remaining.partition("http")
+                link = "http" + link_tail.strip() if link_sep else ""
+
+                news_items.append(
+                    {
+                        "title": title.strip(),
+                        "content": description.strip(),
+                        "date": "",  # 날짜 정보는 별도로 추출 필요
+                        "link": link,
+                    }
+                )
 
             return news_items
 
@@ -403,63 +543,104 @@ class NaverNewsSearchTool:
             if not news_results:
                 return []
 
-            # 뉴스 내용 통합
-            combined_content = " ".join(
-                [
-                    item.get("title", "") + " " + item.get("content", "")
-                    for item in news_results
-                ]
-            )
+            # 뉴스 내용 통합 (중복 제목 제거, 토큰 예산 내로 제한)
+            combined_content = _build_news_content(news_results)
+
+            # 뉴스 내용이 너무 짧으면 LLM 호출 생략
+            if len(combined_content.strip()) < MIN_KEYWORD_SOURCE_LENGTH:
+                return []
 
-            # 정답 기업명 제외
+            # 정답 기업명 포함 키워드는 제외
+            correct_answer = quiz_data.get("correct_answer", {})
+            correct_company = correct_answer.get("company", "")
+            return self._llm_extract("news", combined_content, exclude=correct_company)
+
+        except Exception as e:
+            logger.error(f"뉴스 키워드 추출 중 오류: {e}")
+            return []
+
+    def _extract_hint_bundle(
+        self, news_results: List[Dict[str, Any]], quiz_data: Dict[str, Any]
+    ) -> Optional[HintBundle]:
+        """뉴스 키워드와 배경지식 키워드를 한 번의 LLM 호출로 추출합니다."""
+        try:
+            if not news_results:
+                return None
+
+            # 뉴스 내용 통합 (중복 제목 제거, 토큰 예산 내로 제한)
+            combined_content = _build_news_content(news_results)
+
+            background = quiz_data.get("background", "")
             correct_answer = quiz_data.get("correct_answer", {})
             correct_company = correct_answer.get("company", "")
 
-            # LLM을 사용하여 관련 키워드 추출
             prompt = f"""
-다음 뉴스 내용에서 퀴즈와 관련된 핵심 키워드 3-5개를 추출해주세요.
+아래 두 자료에서 퀴즈 힌트로 사용할 핵심 키워드를 각각 3-5개씩 추출해주세요.
+
+<<NEWS>>
+{combined_content}
+<<END>>
 
-뉴스 내용: {combined_content[:1000]}  # 길이 제한
+<<BACKGROUND>>
+{background if background else "없음"}
+<<END>>
 
 요구사항:
 1. 정답 기업명 "{correct_company}"은 절대 포함하지 마세요
 2. 기업명의 일부분도 포함하지 마세요
-3. 업종, 기술, 트렌드, 특징 등을 포함해주세요
-4. 쉼표로만 구분하여 답변해주세요 (다른 설명 없이)
-
-답변 형식: 키워드1, 키워드2, 키워드3, 키워드4, 키워드5
+3. news_keywords: 뉴스 내용의 업종, 기술, 트렌드, 특징 등
+4. background_keywords: 배경지식의 년도, 금액, 숫자, 업종, 특징 등
+5. 다른 설명 없이 아래 JSON 형식으로만 답변해주세요
 
-예시: "AI, 반도체, 메모리, 자율주행, 전기차"
+답변 형식: {{"news_keywords": ["키워드1", "키워드2"], "background_keywords": ["키워드1", "키워드2"]}}
 """
 
-            response = self.llm.invoke(prompt)
-            result = response.content.strip()
+            # 검증에 성공한 응답만 캐시하고, 캐시된 응답도 다시 검증
+            # (재시도는 캐시를 거치지 않고 항상 LLM에 다시 요청)
+            base_prompt = prompt
+            result = get_cached_llm_response(self.llm, base_prompt, PROMPT_VERSION)
+            for attempt in range(HINT_BUNDLE_MAX_RETRIES + 1):
+                if not result:
+                    result = self.llm.invoke(prompt).content.strip()
+
+                # 코드 블록 등 JSON 외 텍스트 제거
+                start, end = result.find("{"), result.rfind("}")
+                payload = result[start : end + 1] if start != -1 else result
+
+                try:
+                    bundle = HintBundle.model_validate_json(payload)
+                except ValidationError as e:
+                    logger.warning(
+                        f"힌트 번들 형식 오류 (시도 {attempt + 1}회): {e.error_count()}건"
+                    )
+                    if attempt == HINT_BUNDLE_MAX_RETRIES:
+                        break
+                    # 고정 안내문을 덧붙여 즉시 재요청
+                    prompt = base_prompt + HINT_BUNDLE_RETRY_INSTRUCTION
+                    result = None
+                    continue
 
-            # 쉼표로 분리하여 키워드 리스트 생성
-            keywords = []
-            for kw in result.split(","):
-                kw = kw.strip()
-                # 설명이나 추가 텍스트 제거
-                if (
-                    kw
-                    and len(kw) <= 20
-                    and not kw.startswith("예시")
-                    and not kw.startswith("답변")
-                ):
-                    # "키워드:" 접두사 제거
-                    if kw.startswith("키워드:"):
-                        kw = kw[4:].strip()
-                    keywords.append(kw)
-
-            # 정답 기업명이 포함된 경우 제거
-            if correct_company:
-                keywords = [kw for kw in keywords if correct_company not in kw]
+                cache_llm_response(self.llm, base_prompt, result, PROMPT_VERSION)
+
+                # 정답 기업명이 포함된 키워드 제거
+                for field in ("news_keywords", "background_keywords"):
+                    keywords = [kw.strip() for kw in getattr(bundle, field)]
+                    setattr(
+                        bundle,
+                        field,
+                        [
+                            kw
+                            for kw in keywords
+                            if kw and not (correct_company and correct_company in kw)
+                        ][:5],
+                    )
+                return bundle
 
-            return keywords[:5]  # 최대 5개
+            return None
 
         except Exception as e:
-            logger.error(f"뉴스 키워드 추출 중 오류: {e}")
-            return []
+            logger.error(f"힌트 번들 추출 중 오류: {e}")
+            return None
 
     def _create_hint_message(
         self, keywords: List[str], quiz_data: Dict[str, Any]
@@ -497,9 +678,13 @@ class NaverNewsSearchTool:
             "search_keywords": [],
             "news_count": 0,
             "extracted_keywords": [],
+            "background_keywords": [],
             "raw_news": [],
         }
 
 
-# 싱글톤 인스턴스
-naver_news_search_tool = NaverNewsSearchTool()
+# 싱글톤 인스턴스 (최초 사용 시 생성)
+@functools.lru_cache(maxsize=1)
+def get_naver_news_search_tool() -> NaverNewsSearchTool:
+    """네이버 뉴스 검색 도구 싱글톤을 반환합니다."""
+    return NaverNewsSearchTool()
@@ -1,22 +1,35 @@
 import re
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 from langchain_naver import ChatClovaX
 from rag.stock_agent.graph.prompts import (
     get_quiz_answer_check_prompt,
     DEFAULT_CONFIDENCE,
 )
+from rag.stock_agent.graph.utils import cached_llm_invoke
 from utils.logger import get_logger
 
 load_dotenv()
 
 logger = get_logger(__name__)
 
+# 힌트 프롬프트 버전 (프롬프트 변경 시 올려서 캐시 무효화)
+PROMPT_VERSION = "v1"
+
+# LLM 답변 검증 응답 파싱용 패턴
+_CONFIDENCE_RE = re.compile(r"신뢰도:\s*(\d+)")
+_REASON_RE = re.compile(r"이유:\s*(.+)")
+
+# 원문자 선택지 번호 -> 일반 번호
+_CIRCLED_NUMBERS = {"①": "1", "②": "2", "③": "3", "④": "4"}
+
 
 class QuizAnswerChecker:
     """퀴즈 답변 검증 클래스"""
 
+    __slots__ = ("llm",)
+
     def __init__(self):
         self.llm = ChatClovaX(model="HCX-005", temperature=0)
 
@@ -33,9 +46,50 @@ class QuizAnswerChecker:
         Returns:
             검증 결과 딕셔너리
         """
+        # 번호/기업명이 정확히 일치하면 LLM 호출 생략
+        exact_result = self.check_exact_match(quiz_data, user_answer)
+        if exact_result is not None:
+            return exact_result
+
         llm_result = self._check_with_llm(quiz_data, user_answer)
         return llm_result
 
+    def check_exact_match(
+        self, quiz_data: Dict[str, Any], user_answer: str
+    ) -> Optional[Dict[str, Any]]:
+        """선택지 번호나 정답 기업명과 정확히 일치하는 답변을 판정합니다."""
+        answer = user_answer.strip()
+        if not answer:
+            return None
+
+        correct_answer = quiz_data.get("correct_answer", {})
+        correct_number = str(correct_answer.get("number", "")).strip()
+        correct_company = correct_answer.get("company", "").strip()
+
+        # "3", "3번", "③" 형태의 번호 답변 정규화
+        number = _CIRCLED_NUMBERS.get(answer, answer.removesuffix("번").strip())
+
+        if (correct_number and number == correct_number) or (
+            correct_company and answer == correct_company
+        ):
+            is_correct = True
+            explanation = "정답과 정확히 일치합니다."
+        elif number in quiz_data.get("options", {}):
+            # 유효한 다른 선택지 번호
+            is_correct = False
+            explanation = f"{number}번은 정답이 아닙니다."
+        else:
+            return None
+
+        return {
+            "success": True,
+            "is_correct": is_correct,
+            "confidence": 100,
+            "explanation": explanation,
+            "method": "exact",
+            "raw_response": answer,
+        }
+
     def _check_with_llm(
         self, quiz_data: Dict[str, Any], user_answer: str
     ) -> Dict[str, Any]:
@@ -62,12 +116,12 @@ class QuizAnswerChecker:
             # 신뢰도 추출 (프롬프트 모듈의 상수 사용)
             confidence = DEFAULT_CONFIDENCE  # 기본값
 
-            confidence_match = re.search(r"신뢰도:\s*(\d+)", result_text)
+            confidence_match = _CONFIDENCE_RE.search(result_text)
             if confidence_match:
                 confidence = int(confidence_match.group(1))
 
             # 이유 추출
-            reason_match = re.search(r"이유:\s*(.+)", result_text)
+            reason_match = _REASON_RE.search(result_text)
             explanation = reason_match.group(1) if reason_match else "LLM 판단 결과"
 
             return {
@@ -144,8 +198,7 @@ class QuizAnswerChecker:
 예시: "키워드: 2022년, 상장, 첫날, 59만원, 시총2위"
 """
 
-            response = self.llm.invoke(hint_prompt)
-            hint_text = response.content.strip()
+            hint_text = cached_llm_invoke(self.llm, hint_prompt, PROMPT_VERSION)
 
             # 혹시 기업명이 포함되었는지 최종 검증
             if correct_company and correct_company in hint_text:
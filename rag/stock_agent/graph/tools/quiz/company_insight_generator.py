@@ -1,25 +1,80 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Mapping
 from dotenv import load_dotenv
-from langchain_naver import ChatClovaX
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
+import bisect
+import functools
+import time
+from types import MappingProxyType
 from db.sqlite_db import SqliteDBClient
-from rag.stock_agent.graph.prompts import get_company_insight_prompt, MIN_INSIGHT_LENGTH
+from rag.stock_agent.graph.prompts import (
+    get_company_insight_prompt,
+    get_company_profile_block,
+    MIN_INSIGHT_LENGTH,
+)
 from utils.logger import get_logger
 
 load_dotenv()
 
 logger = get_logger(__name__)
 
-
-class CompanyInsightGenerator:
-    """구조화된 프롬프트 기반 기업 통찰 스낵글 생성 클래스"""
-
-    def __init__(self):
-        self.llm = ChatClovaX(model="HCX-003", temperature=0.7)
-
-        # 15개 퀴즈 종목 정적 데이터
-        self.static_company_data = {
+# 스낵글 캐시 유지 시간 (초)
+INSIGHT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# 스낵글 캐시 최대 항목 수 (초과 시 만료 항목 정리 후 가장 오래된 항목부터 제거)
+INSIGHT_CACHE_MAXSIZE = 256
+
+# 일별 종목 지표 캐시 크기 (초과 시 지난 날짜 항목 정리)
+DAILY_CACHE_MAXSIZE = 32
+
+# 최신 거래일과 종목의 최근 30영업일 시작/끝 종가, 실제 경과 일수를 한 번에 조회
+TICKER_METRICS_QUERY = """
+    WITH latest AS (SELECT MAX(date) AS d FROM ohlcv),
+    hist AS (
+        SELECT close, date
+        FROM ohlcv
+        WHERE ticker = ?
+        ORDER BY date DESC
+        LIMIT 30
+    )
+    SELECT (SELECT d FROM latest),
+           (SELECT close FROM hist ORDER BY date DESC LIMIT 1),
+           (SELECT close FROM hist ORDER BY date ASC LIMIT 1),
+           (SELECT CAST(julianday(MAX(date)) - julianday(MIN(date)) AS INTEGER)
+            FROM hist)
+"""
+
+# 해당 거래일 전 종목 종가/거래량 (순위 계산은 pandas에서, 거래일이 바뀔 때만 실행)
+MARKET_CAP_SLICE_QUERY = """
+    SELECT ticker, close, volume
+    FROM ohlcv
+    WHERE date = ?
+"""
+
+# 시총 순위 구간 경계(이하)와 구간별 시장 포지션 설명
+_RANK_BOUNDS = (1, 3, 10, 30)
+_RANK_LABELS = (
+    "코스피 최대 시가총액 기업",
+    "코스피 대형주",
+    "코스피 주요 기업",
+    "중견 상장기업",
+    "코스피 상장기업",
+)
+
+# 주가 트렌드(%) 구간 경계(이하)와 구간별 현재 상황 설명
+_TREND_BOUNDS = (-10, -5, 5, 10)
+_TREND_LABELS = (
+    "큰 조정을 겪고 있는",
+    "조정을 받고 있는",
+    "안정적인 흐름을 보이고 있는",
+    "상승 흐름을 이어가고 있는",
+    "강한 상승세를 보이고 있는",
+)
+
+# 15개 퀴즈 종목 정적 데이터 (import 시 한 번만 생성, 읽기 전용)
+_STATIC_COMPANY_DATA: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        name: MappingProxyType(info)
+        for name, info in {
             "삼성전자": {
                 "sector": "반도체",
                 "business_model": "메모리 반도체, 스마트폰, 가전제품 제조",
@@ -110,7 +165,70 @@ class CompanyInsightGenerator:
                 "ticker": "329180.KS",
                 "group_affiliation": "현대중공업그룹",
             },
-        }
+        }.items()
+    }
+)
+
+# 기업별 정적 프롬프트 블록 (import 시 한 번만 생성)
+_COMPANY_PROFILE_BLOCKS: Mapping[str, str] = MappingProxyType(
+    {
+        name: get_company_profile_block(name, data)
+        for name, data in _STATIC_COMPANY_DATA.items()
+    }
+)
+
+
+def _today_str() -> str:
+    """오늘 날짜 문자열 (YYYY-MM-DD)"""
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _daily_cache(fn):
+    """(ticker, 오늘 날짜) 기준으로 결과를 캐시하는 메서드 데코레이터 (예외는 캐시하지 않음)"""
+
+    cache: Dict[tuple, Any] = {}
+
+    @functools.wraps(fn)
+    def wrapper(self, ticker: str, *args):
+        today = _today_str()
+        key = (ticker, today)
+        value = cache.get(key)
+        if value is None:
+            value = fn(self, ticker, *args)
+            if len(cache) >= DAILY_CACHE_MAXSIZE:
+                # 지난 날짜 항목 정리
+                for stale_key in [k for k in cache if k[1] != today]:
+                    cache.pop(stale_key, None)
+            cache[key] = value
+        return value
+
+    return wrapper
+
+
+class CompanyInsightGenerator:
+    """구조화된 프롬프트 기반 기업 통찰 스낵글 생성 클래스"""
+
+    # 최신 거래일 기준 전 종목 시총 순위 캐시 {ticker: rank}
+    _rank_cache: Dict[str, int] = {}
+    _rank_cache_date: Optional[str] = None
+
+    def __init__(self):
+        # 스낵글 캐시 {(기업명, 배경지식, 시장 포지션, 현재 상황): (생성 시각, 스낵글)}
+        self._insight_cache: Dict[tuple, tuple[float, str]] = {}
+
+        # 오늘 마지막으로 캐시한 스낵글 키 {(기업명, 배경지식): (날짜, 캐시 키)}
+        # 종목 지표는 하루 단위로 고정되므로 같은 날에는 동적 데이터 수집 없이 캐시 조회 가능
+        self._daily_insight_keys: Dict[tuple, tuple[str, tuple]] = {}
+
+        # 15개 퀴즈 종목 정적 데이터
+        self.static_company_data = _STATIC_COMPANY_DATA
+
+    @functools.cached_property
+    def llm(self):
+        """LLM 클라이언트 (최초 스낵글 생성 시 import 및 생성)"""
+        from langchain_naver import ChatClovaX
+
+        return ChatClovaX(model="HCX-003", temperature=0.7)
 
     def generate_company_insight(
         self, company_name: str, quiz_background: str = ""
@@ -132,19 +250,38 @@ class CompanyInsightGenerator:
                 logger.warning(f"정적 데이터가 없는 기업: {company_name}")
                 return self._get_fallback_insight(company_name)
 
-            # 2. 실시간 데이터 수집
+            # 2. 오늘 생성한 스낵글이 있으면 실시간 데이터 수집 없이 재사용
+            cached_insight = self._get_todays_insight(company_name, quiz_background)
+            if cached_insight:
+                logger.debug(f"{company_name} 스낵글 캐시 사용")
+                return cached_insight
+
+            # 3. 실시간 데이터 수집
             dynamic_data = self._collect_dynamic_data(
                 company_name, static_data["ticker"], static_data["sector"]
             )
 
-            # 3. 데이터 통합
+            # 4. 캐시 확인 (순위/주가 흐름을 구간 단위로 묶어 같은 상황이면 재사용)
+            cache_key = self._get_insight_cache_key(
+                company_name, quiz_background, dynamic_data
+            )
+            cached_insight = self._get_cached_insight(cache_key)
+            if cached_insight:
+                logger.debug(f"{company_name} 스낵글 캐시 사용")
+                return cached_insight
+
+            # 5. 데이터 통합
             combined_data = {**static_data, **dynamic_data}
 
-            # 4. 구조화된 프롬프트로 스낵글 생성
+            # 6. 구조화된 프롬프트로 스낵글 생성
             insight_text = self._generate_structured_insight(
                 company_name, combined_data, quiz_background
             )
 
+            # 폴백이 아닌 LLM 생성 결과만 캐시
+            if insight_text != self._get_fallback_insight(company_name):
+                self._store_insight(cache_key, insight_text)
+
             logger.info(
                 f"{company_name} 구조화된 스낵글 생성 완료 ({len(insight_text)}자)"
             )
@@ -154,6 +291,68 @@ class CompanyInsightGenerator:
             logger.error(f"{company_name} 스낵글 생성 중 오류: {e}")
             return self._get_fallback_insight(company_name)
 
+    def _get_insight_cache_key(
+        self, company_name: str, quiz_background: str, dynamic_data: Dict[str, Any]
+    ) -> tuple:
+        """스낵글 캐시 키를 생성합니다."""
+
+        return (
+            company_name,
+            quiz_background,
+            dynamic_data["market_position"],
+            dynamic_data["current_status"],
+        )
+
+    def _get_cached_insight(self, cache_key: tuple) -> Optional[str]:
+        """유효 기간 내의 캐시된 스낵글을 반환합니다."""
+
+        cached = self._insight_cache.get(cache_key)
+        if cached and time.time() - cached[0] < INSIGHT_CACHE_TTL_SECONDS:
+            return cached[1]
+        return None
+
+    def _get_todays_insight(
+        self, company_name: str, quiz_background: str
+    ) -> Optional[str]:
+        """오늘 캐시한 스낵글을 동적 데이터 수집 없이 조회합니다."""
+
+        entry = self._daily_insight_keys.get((company_name, quiz_background))
+        if entry and entry[0] == _today_str():
+            return self._get_cached_insight(entry[1])
+        return None
+
+    def _store_insight(self, cache_key: tuple, insight_text: str) -> None:
+        """스낵글을 캐시하고 오늘의 캐시 키로 기록합니다. (항목 수는 INSIGHT_CACHE_MAXSIZE 이내로 유지)"""
+
+        now = time.time()
+        today = _today_str()
+
+        if len(self._insight_cache) >= INSIGHT_CACHE_MAXSIZE:
+            # 만료 항목 정리
+            for expired_key in [
+                k
+                for k, (created_at, _) in self._insight_cache.items()
+                if now - created_at >= INSIGHT_CACHE_TTL_SECONDS
+            ]:
+                del self._insight_cache[expired_key]
+        if len(self._daily_insight_keys) >= INSIGHT_CACHE_MAXSIZE:
+            # 지난 날짜 항목 정리
+            for stale_key in [
+                k for k, (date, _) in self._daily_insight_keys.items() if date != today
+            ]:
+                del self._daily_insight_keys[stale_key]
+
+        # 그래도 가득 차 있으면 가장 오래 전에 저장한 항목부터 제거 (dict 삽입 순서)
+        for cache in (self._insight_cache, self._daily_insight_keys):
+            while len(cache) >= INSIGHT_CACHE_MAXSIZE:
+                del cache[next(iter(cache))]
+
+        # 재저장 시 최신 항목이 되도록 기존 항목을 지우고 다시 삽입
+        self._insight_cache.pop(cache_key, None)
+        self._insight_cache[cache_key] = (now, insight_text)
+        self._daily_insight_keys.pop(cache_key[:2], None)
+        self._daily_insight_keys[cache_key[:2]] = (today, cache_key)
+
     def _collect_dynamic_data(
         self, company_name: str, ticker: str, sector: str
     ) -> Dict[str, Any]:
@@ -162,15 +361,15 @@ class CompanyInsightGenerator:
         dynamic_data = {}
 
         try:
-            # 시가총액 순위 조회
-            market_cap_rank = self._get_market_cap_rank(ticker)
+            # 시가총액 순위 + 최근 주가 트렌드 (실제 기간 포함) 일괄 조회
+            market_cap_rank, price_trend, actual_days = self._fetch_ticker_metrics(
+                ticker
+            )
             dynamic_data["market_cap_rank"] = market_cap_rank
             dynamic_data["market_position"] = self._convert_rank_to_position(
                 market_cap_rank
             )
 
-            # 최근 주가 트렌드 분석 (실제 기간 포함)
-            price_trend, actual_days = self._analyze_price_trend(ticker)
             dynamic_data["price_trend"] = price_trend
             dynamic_data["actual_days"] = actual_days
             dynamic_data["current_status"] = self._convert_trend_to_status(price_trend)
@@ -198,97 +397,65 @@ class CompanyInsightGenerator:
 
         return dynamic_data
 
-    def _get_market_cap_rank(self, ticker: str) -> int:
-        """DB에서 시가총액 순위를 조회합니다."""
+    def _fetch_ticker_metrics(self, ticker: str) -> tuple[int, float, int]:
+        """시가총액 순위와 최근 영업일 기준 주가 트렌드를 조회합니다. (실패 시 기본값, 캐시하지 않음)"""
 
         try:
-            db = SqliteDBClient()
-            # 최근 데이터로 시총 계산 및 순위 조회
-            query = """
-                SELECT ticker, close, volume, 
-                       RANK() OVER (ORDER BY close * volume DESC) as market_rank
-                FROM ohlcv 
-                WHERE date = (SELECT MAX(date) FROM ohlcv)
-                AND ticker = ?
-            """
-            results, _ = db.fetch_query(query, [ticker])
-            db.close()
-
-            if results:
-                return results[0][3]  # market_rank
-            else:
-                return 50  # 기본값
-
+            return self._query_ticker_metrics(ticker)
         except Exception as e:
-            logger.warning(f"시총 순위 조회 오류: {e}")
-            return 50
+            logger.warning(f"종목 지표 조회 오류: {e}")
+            return 50, 0.0, 0
 
-    def _convert_rank_to_position(self, rank: int) -> str:
-        """순위를 시장 포지션 설명으로 변환합니다."""
+    @_daily_cache
+    def _query_ticker_metrics(self, ticker: str) -> tuple[int, float, int]:
+        """시가총액 순위와 주가 트렌드를 한 번의 쿼리로 조회합니다. (종목별 하루 1회)"""
 
-        if rank == 1:
-            return "코스피 최대 시가총액 기업"
-        elif rank <= 3:
-            return "코스피 대형주"
-        elif rank <= 10:
-            return "코스피 주요 기업"
-        elif rank <= 30:
-            return "중견 상장기업"
-        else:
-            return "코스피 상장기업"
+        db = SqliteDBClient.get_shared()
+        row = db.execute(TICKER_METRICS_QUERY, (ticker,))[0]
+        latest_date, recent_price, past_price, actual_days = row
 
-    def _analyze_price_trend(self, ticker: str) -> tuple[float, int]:
-        """최근 영업일 기준 주가 트렌드를 분석합니다."""
+        market_cap_rank = self._get_market_cap_rank(db, ticker, latest_date)
 
-        try:
-            db = SqliteDBClient()
-            query = """
-                SELECT close, date
-                FROM ohlcv
-                WHERE ticker = ?
-                ORDER BY date DESC
-                LIMIT 30
-            """
-            results, _ = db.fetch_query(query, [ticker])
-            db.close()
-
-            if len(results) >= 2:
-                recent_price = results[0][0]
-                past_price = results[-1][0]
-
-                # 실제 기간 계산 (첫 날짜와 마지막 날짜의 차이)
-                recent_date = results[0][1]  # 최신 날짜
-                past_date = results[-1][1]  # 과거 날짜
-
-                # 날짜 문자열을 datetime으로 변환해서 실제 일수 계산
-                from datetime import datetime
-
-                recent_dt = datetime.strptime(recent_date, "%Y-%m-%d")
-                past_dt = datetime.strptime(past_date, "%Y-%m-%d")
-                actual_days = (recent_dt - past_dt).days
-
-                trend_percent = (recent_price - past_price) / past_price * 100
-                return trend_percent, actual_days
-            else:
-                return 0.0, 0
+        if recent_price is None or past_price is None:
+            return market_cap_rank, 0.0, 0
 
-        except Exception as e:
-            logger.warning(f"주가 트렌드 분석 오류: {e}")
-            return 0.0, 0
+        trend_percent = (recent_price - past_price) / past_price * 100
+        return market_cap_rank, trend_percent, actual_days
+
+    def _get_market_cap_rank(
+        self, db: SqliteDBClient, ticker: str, latest_date: Optional[str]
+    ) -> int:
+        """시가총액 순위를 반환합니다. (최신 거래일이 바뀔 때만 전 종목 순위를 다시 계산)"""
+
+        cls = CompanyInsightGenerator
+        if latest_date != cls._rank_cache_date:
+            # pandas는 순위 계산 시에만 import (모듈 import 시 콜드 스타트 비용 방지)
+            import pandas as pd
+
+            df = pd.read_sql_query(
+                MARKET_CAP_SLICE_QUERY, db.conn, params=(latest_date,)
+            )
+            market_cap = df["close"].to_numpy(dtype=float) * df[
+                "volume"
+            ].to_numpy(dtype=float)
+            # RANK()와 동일하게 동점은 같은 (가장 높은) 순위
+            ranks = pd.Series(market_cap).rank(
+                method="min", ascending=False, na_option="bottom"
+            )
+            cls._rank_cache = dict(zip(df["ticker"], ranks.astype(int).tolist()))
+            cls._rank_cache_date = latest_date
+
+        return cls._rank_cache.get(ticker, 50)  # 없으면 기본값
+
+    def _convert_rank_to_position(self, rank: int) -> str:
+        """순위를 시장 포지션 설명으로 변환합니다."""
+
+        return _RANK_LABELS[bisect.bisect_left(_RANK_BOUNDS, rank)]
 
     def _convert_trend_to_status(self, trend: float) -> str:
         """주가 트렌드를 현재 상황 설명으로 변환합니다."""
 
-        if trend > 10:
-            return "강한 상승세를 보이고 있는"
-        elif trend > 5:
-            return "상승 흐름을 이어가고 있는"
-        elif trend > -5:
-            return "안정적인 흐름을 보이고 있는"
-        elif trend > -10:
-            return "조정을 받고 있는"
-        else:
-            return "큰 조정을 겪고 있는"
+        return _TREND_LABELS[bisect.bisect_left(_TREND_BOUNDS, trend)]
 
     def _generate_structured_insight(
         self, company_name: str, combined_data: Dict[str, Any], quiz_background: str
@@ -297,12 +464,21 @@ class CompanyInsightGenerator:
 
         # 프롬프트 모듈에서 가져온 함수 사용
         structured_prompt = get_company_insight_prompt(
-            company_name, combined_data, quiz_background
+            company_name,
+            combined_data,
+            quiz_background,
+            company_profile=_COMPANY_PROFILE_BLOCKS.get(company_name, ""),
         )
 
         try:
             response = self.llm.invoke(structured_prompt)
-            insight_text = response.content.strip()
+            raw_text = response.content
+            # 앞뒤 공백이 있을 때만 strip (전체 문자열 복사 회피)
+            insight_text = (
+                raw_text.strip()
+                if raw_text[:1].isspace() or raw_text[-1:].isspace()
+                else raw_text
+            )
 
             # 기본 품질 검증 (프롬프트 모듈의 상수 사용)
             if len(insight_text) < MIN_INSIGHT_LENGTH:
@@ -325,5 +501,8 @@ class CompanyInsightGenerator:
         return f"{company_name}는 {sector} 분야의 주요 기업으로, {business_model}을 통해 수익을 창출하고 있습니다. 투자 전에는 기업의 재무상태와 시장 전망을 종합적으로 검토해보시기 바랍니다."
 
 
-# 전역 인스턴스
-company_insight_generator = CompanyInsightGenerator()
+# 싱글톤 인스턴스 (최초 사용 시 생성)
+@functools.lru_cache(maxsize=1)
+def get_company_insight_generator() -> CompanyInsightGenerator:
+    """기업 통찰 스낵글 생성기 싱글톤을 반환합니다."""
+    return CompanyInsightGenerator()
@@ -1,11 +1,20 @@
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
 import uuid
 from db.sqlite_db import SqliteDBClient
+from rag.stock_agent.graph.utils import now_iso
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 퀴즈 결과 저장 쿼리 (동일 문자열을 재사용해 SQLite statement 캐시 적중)
+INSERT_QUIZ_RESULT_QUERY = """
+    INSERT INTO quiz_history (
+        request_id, quiz_id, quiz_question, correct_answer, user_answer,
+        is_correct, hint_used, reward_stock, reward_amount,
+        completed_at, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class QuizDatabase:
     """퀴즈 이력 데이터베이스 관리 클래스"""
@@ -45,17 +54,9 @@ class QuizDatabase:
             저장 성공 여부
         """
         try:
-            db = SqliteDBClient()
-
-            current_time = datetime.now().isoformat()
+            db = SqliteDBClient.get_shared()
 
-            query = """
-                INSERT INTO quiz_history (
-                    request_id, quiz_id, quiz_question, correct_answer, user_answer,
-                    is_correct, hint_used, reward_stock, reward_amount,
-                    completed_at, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+            current_time = now_iso()
 
             params = (
                 request_id,
@@ -71,9 +72,8 @@ class QuizDatabase:
                 current_time,
             )
 
-            db.conn.execute(query, params)
+            db.conn.execute(INSERT_QUIZ_RESULT_QUERY, params)
             db.conn.commit()
-            db.close()
 
             logger.info(
                 f"퀴즈 결과 저장 완료 - 사용자: {request_id}, 퀴즈: {quiz_id}, 정답: {is_correct}"
@@ -85,38 +85,82 @@ class QuizDatabase:
             return False
 
     @staticmethod
-    def get_user_attempted_quiz_ids(request_id: str) -> List[int]:
+    def save_quiz_results_bulk(rows: List[tuple]) -> bool:
         """
-        특정 사용자가 시도한 퀴즈 ID 목록을 조회합니다.
+        여러 퀴즈 결과를 하나의 트랜잭션으로 일괄 저장합니다.
 
         Args:
-            request_id: 사용자 요청 고유 ID
+            rows: (request_id, quiz_id, quiz_question, correct_answer, user_answer,
+                   is_correct, hint_used, reward_stock, reward_amount) 튜플 리스트
 
         Returns:
-            시도한 퀴즈 ID 리스트
+            저장 성공 여부
         """
+        if not rows:
+            return True
+
         try:
-            if not request_id:
-                logger.debug("request_id가 없어 빈 목록 반환")
-                return []
+            db = SqliteDBClient.get_shared()
 
-            db = SqliteDBClient()
+            current_time = now_iso()
+            params = [(*row, current_time, current_time) for row in rows]
 
-            query = """
-                SELECT DISTINCT quiz_id 
-                FROM quiz_history 
-                WHERE request_id = ?
-                ORDER BY quiz_id
-            """
+            with db.conn:
+                db.conn.executemany(INSERT_QUIZ_RESULT_QUERY, params)
 
-            results, columns = db.fetch_query(query, [request_id])
-            db.close()
+            logger.info(f"퀴즈 결과 일괄 저장 완료 - {len(rows)}건")
+            return True
 
-            attempted_ids = [row[0] for row in results] if results else []
+        except Exception as e:
+            logger.error(f"퀴즈 결과 일괄 저장 중 오류 발생: {e}")
+            return False
+
+    @staticmethod
+    def get_user_attempted_quiz_ids(request_id: str) -> List[int]:
+        """
+        특정 사용자가 시도한 퀴즈 ID 목록을 조회합니다.
 
-            logger.debug(f"사용자 {request_id} 시도 퀴즈: {attempted_ids}")
-            return attempted_ids
+        Args:
+            request_id: 사용자 요청 고유 ID
+
+        Returns:
+            시도한 퀴즈 ID 리스트 (오류 시 빈 리스트)
+        """
+        try:
+            return QuizDatabase.fetch_user_attempted_quiz_ids(request_id)
 
         except Exception as e:
             logger.error(f"시도한 퀴즈 ID 조회 중 오류 발생: {e}")
             return []
+
+    @staticmethod
+    def fetch_user_attempted_quiz_ids(request_id: str) -> List[int]:
+        """
+        특정 사용자가 시도한 퀴즈 ID 목록을 조회합니다.
+        DB 오류를 그대로 전파하므로, 결과를 캐시하는 호출자는 오류 결과를 캐시하지 않습니다.
+
+        Args:
+            request_id: 사용자 요청 고유 ID
+
+        Returns:
+            시도한 퀴즈 ID 리스트
+        """
+        if not request_id:
+            logger.debug("request_id가 없어 빈 목록 반환")
+            return []
+
+        db = SqliteDBClient.get_shared()
+
+        query = """
+            SELECT DISTINCT quiz_id 
+            FROM quiz_history 
+            WHERE request_id = ?
+            ORDER BY quiz_id
+        """
+
+        results, columns = db.fetch_query(query, [request_id])
+
+        attempted_ids = [row[0] for row in results] if results else []
+
+        logger.debug(f"사용자 {request_id} 시도 퀴즈: {attempted_ids}")
+        return attempted_ids
@@ -1,15 +1,19 @@
 import random
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 from rag.stock_agent.graph.tools.quiz.reward_calculator import quiz_reward_calculator
 from rag.stock_agent.graph.tools.quiz.user_reward_manager import user_reward_manager
 from rag.stock_agent.graph.tools.quiz.company_insight_generator import (
-    company_insight_generator,
+    get_company_insight_generator,
 )
+from rag.stock_agent.graph.utils import get_shared_executor, now_iso
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 선택지 번호와 표시용 원문자
+_OPTION_NUMBERS = ("1", "2", "3", "4")
+_CIRCLED_DIGITS = ("①", "②", "③", "④")
+
 
 class QuizInfoProvider:
     """퀴즈 완료 후 종합 정보 제공 클래스"""
@@ -17,7 +21,7 @@ class QuizInfoProvider:
     def __init__(self):
         self.reward_calculator = quiz_reward_calculator
         self.user_manager = user_reward_manager
-        self.insight_generator = company_insight_generator
+        self.insight_generator = get_company_insight_generator()
 
     def generate_answer_package(
         self,
@@ -41,31 +45,20 @@ class QuizInfoProvider:
             종합 정보 패키지
         """
         try:
-            correct_answer = quiz_data.get("correct_answer", {})
-            correct_company = correct_answer.get("company", "")
-
-            # 기본 정보 구성
-            package = {
-                "quiz_id": quiz_data.get("id", 0),
-                "question": quiz_data.get("question", ""),
-                "user_answer": user_answer,
-                "is_correct": is_correct,
-                "correct_answer": correct_answer,
-                "explanation": self._generate_explanation(
-                    quiz_data, user_answer, is_correct, answer_check_result
-                ),
-                "reward_info": self._generate_reward_info(
-                    correct_company, is_correct, request_id
-                ),
-                "company_insight": (
-                    self._generate_company_insight(quiz_data) if is_correct else ""
-                ),
-                "timestamp": datetime.now().isoformat(),
-            }
+            # 기업 통찰(LLM)은 보상 정보(DB) 조회와 동시에 생성
+            insight_future = (
+                get_shared_executor().submit(
+                    self._generate_company_insight, quiz_data
+                )
+                if is_correct
+                else None
+            )
 
-            # 보상 정보를 생성한 후에 사용자 보상 현황 조회 (현재 보상 포함)
-            package["user_rewards_info"] = self._get_user_rewards_info(
-                request_id, package["reward_info"]
+            package = self._build_answer_package(
+                quiz_data, user_answer, is_correct, answer_check_result, request_id
+            )
+            package["company_insight"] = (
+                insight_future.result() if insight_future else ""
             )
 
             logger.debug(f"퀴즈 {quiz_data.get('id', 'Unknown')} 정보 패키지 생성")
@@ -75,6 +68,47 @@ class QuizInfoProvider:
             logger.error(f"정보 패키지 생성 중 오류: {e}")
             return self._get_error_package(quiz_data, user_answer, str(e))
 
+    def _build_answer_package(
+        self,
+        quiz_data: Dict[str, Any],
+        user_answer: str,
+        is_correct: bool,
+        answer_check_result: Dict[str, Any],
+        request_id: str,
+    ) -> Dict[str, Any]:
+        """기업 통찰을 제외한 정보 패키지를 구성합니다."""
+
+        correct_answer = quiz_data.get("correct_answer", {})
+        correct_company = correct_answer.get("company", "")
+
+        # 보상 자격과 기존 보상 현황을 한 번의 쿼리로 조회
+        eligibility, base_rewards_info = self.user_manager.get_user_reward_state(
+            request_id
+        )
+
+        # 기본 정보 구성
+        package = {
+            "quiz_id": quiz_data.get("id", 0),
+            "question": quiz_data.get("question", ""),
+            "user_answer": user_answer,
+            "is_correct": is_correct,
+            "correct_answer": correct_answer,
+            "explanation": self._generate_explanation(
+                quiz_data, user_answer, is_correct, answer_check_result
+            ),
+            "reward_info": self._generate_reward_info(
+                correct_company, is_correct, request_id, eligibility
+            ),
+            "timestamp": now_iso(),
+        }
+
+        # 보상 정보를 생성한 후에 사용자 보상 현황 조회 (현재 보상 포함)
+        package["user_rewards_info"] = self._get_user_rewards_info(
+            request_id, package["reward_info"], base_rewards_info
+        )
+
+        return package
+
     def _generate_explanation(
         self,
         quiz_data: Dict[str, Any],
@@ -120,9 +154,13 @@ class QuizInfoProvider:
             return f"답변 설명을 생성하는 중 오류가 발생했습니다: {str(e)}"
 
     def _generate_reward_info(
-        self, company_name: str, is_correct: bool, request_id: str = ""
+        self,
+        company_name: str,
+        is_correct: bool,
+        request_id: str = "",
+        eligibility: Optional[Tuple[bool, Optional[str]]] = None,
     ) -> Dict[str, Any]:
-        """보상 정보를 생성합니다."""
+        """보상 정보를 생성합니다. eligibility가 주어지면 자격 조회를 생략합니다."""
 
         try:
             if not is_correct:
@@ -135,9 +173,9 @@ class QuizInfoProvider:
                 }
 
             # 1시간 제한 체크
-            can_receive_reward, next_reward_time = (
-                self.user_manager.check_reward_eligibility(request_id)
-            )
+            if eligibility is None:
+                eligibility = self.user_manager.check_reward_eligibility(request_id)
+            can_receive_reward, next_reward_time = eligibility
 
             if not can_receive_reward:
                 return {
@@ -176,13 +214,17 @@ class QuizInfoProvider:
             total_value = reward_result.get("total_value", 0)
             date = reward_result.get("date", "")
 
+            # 금액 문자열은 한 번만 포맷팅해서 재사용
+            closing_price_text = f"{closing_price:,.0f}원"
+            total_value_text = f"{total_value:,.0f}원"
+
             return {
                 "eligible": True,
-                "message": f"🎁 축하합니다! {date} 종가 기준 {total_value:,.0f}원 가치의 {company_name} 주식 {shares}주를 선물로 드렸습니다!",
+                "message": f"🎁 축하합니다! {date} 종가 기준 {total_value_text} 가치의 {company_name} 주식 {shares}주를 선물로 드렸습니다!",
                 "stock_name": company_name,
                 "amount": shares,
-                "closing_price": f"{closing_price:,.0f}원",
-                "total_value": f"{total_value:,.0f}원",
+                "closing_price": closing_price_text,
+                "total_value": total_value_text,
                 "reference_date": date,
                 "calculation_details": f"({date} 종가 기준)",
             }
@@ -219,13 +261,19 @@ class QuizInfoProvider:
             return ""
 
     def _get_user_rewards_info(
-        self, request_id: str = "", current_reward: Dict[str, Any] = None
+        self,
+        request_id: str = "",
+        current_reward: Dict[str, Any] = None,
+        base_rewards_info: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """사용자 전체 보상 현황을 조회합니다. 현재 받은 보상도 포함합니다."""
 
         try:
-            # 기존 보상 현황 조회
-            base_rewards_info = self.user_manager.get_user_total_rewards(request_id)
+            # 기존 보상 현황 조회 (미리 조회한 값이 없을 때만)
+            if base_rewards_info is None:
+                base_rewards_info = self.user_manager.get_user_total_rewards(
+                    request_id
+                )
 
             # 현재 받은 보상이 있고 지급 가능한 경우 포함
             if (
@@ -239,19 +287,16 @@ class QuizInfoProvider:
                 if stock_name and amount > 0:
                     # 기존 보상에 현재 보상 추가
                     if base_rewards_info.get("success", False):
-                        total_rewards = base_rewards_info.get(
-                            "total_rewards", {}
-                        ).copy()
+                        base_rewards = base_rewards_info["total_rewards"]
                         total_count = base_rewards_info.get("total_count", 0)
 
-                        # 현재 받은 주식을 기존 보상에 추가
-                        if stock_name in total_rewards:
-                            total_rewards[stock_name] += amount
-                        else:
-                            total_rewards[stock_name] = amount
-
-                        # 소수점 정리
-                        total_rewards[stock_name] = round(total_rewards[stock_name], 7)
+                        # 현재 받은 주식을 기존 보상에 추가 (소수점 정리 포함)
+                        total_rewards = {
+                            **base_rewards,
+                            stock_name: round(
+                                base_rewards.get(stock_name, 0) + amount, 7
+                            ),
+                        }
 
                         return {
                             "success": True,
@@ -306,7 +351,7 @@ class QuizInfoProvider:
                 "total_rewards": {},
                 "total_count": 0,
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "error": error_message,
         }
 
@@ -318,27 +363,25 @@ class QuizInfoProvider:
             options = quiz_data.get("options", {})
             quiz_id = quiz_data.get("id", "Unknown")
 
-            message_parts = []
-
-            # 헤더
-            message_parts.append("🎯 주식 퀴즈 도전!")
-            message_parts.append(f"문제 #{quiz_id}")
-            message_parts.append("")
-
-            # 문제
-            message_parts.append(f"Q. {question}")
-            message_parts.append("")
-
-            # 선택지
-            for num in sorted(options.keys()):
-                option_text = options[num]
-                symbol = {"1": "①", "2": "②", "3": "③", "4": "④"}.get(num, f"{num}.")
-                message_parts.append(f"{symbol} {option_text}")
-
-            message_parts.append("")
-            message_parts.append(
-                "💡 번호(1,2,3,4), 기업명, 또는 '힌트'를 입력해주세요!"
-            )
+            # 선택지 (파서가 "1"~"4" 키를 보장하므로 정렬 없이 순서대로)
+            option_lines = [
+                f"{symbol} {options[num]}"
+                for num, symbol in zip(_OPTION_NUMBERS, _CIRCLED_DIGITS)
+                if num in options
+            ]
+
+            message_parts = [
+                # 헤더
+                "🎯 주식 퀴즈 도전!",
+                f"문제 #{quiz_id}",
+                "",
+                # 문제
+                f"Q. {question}",
+                "",
+                *option_lines,
+                "",
+                "💡 번호(1,2,3,4), 기업명, 또는 '힌트'를 입력해주세요!",
+            ]
 
             return "\n".join(message_parts)
 
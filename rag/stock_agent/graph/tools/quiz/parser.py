@@ -1,48 +1,115 @@
+import copy
+import functools
+import os
 import re
 import random
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import (
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from rag.stock_agent.graph.tools.quiz import database as _quiz_db
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 퀴즈 파싱용 정규식
+_NUM_START_RE = re.compile(r"\d+\.")
+_NUM_ONLY_RE = re.compile(r"(\d+)\.\s*$")
+_NUM_Q_RE = re.compile(r"(\d+)\.\s*Q\.\s*(.*)")
 
-def parse_quiz_file(file_path: str) -> List[Dict[str, Any]]:
+# 퀴즈 파일 읽기 버퍼 크기
+_READ_BUFFER_SIZE = 1 << 16
+
+
+@dataclass(frozen=True)
+class QuizIndex:
+    """퀴즈 리스트의 ID 인덱스 (미완료 퀴즈 필터링용)"""
+
+    ids: FrozenSet[int]
+    by_id: Dict[int, Dict[str, Any]]
+
+
+# 마지막으로 사용한 퀴즈 목록과 그 인덱스 (퀴즈 목록, QuizIndex)
+_quiz_index_cache: Tuple[Optional[Sequence], Optional[QuizIndex]] = (None, None)
+
+# 퀴즈 선택용 난수 생성기 (모듈 전역 상태를 공유하지 않는 전용 인스턴스)
+_rng = random.Random()
+
+# 유니코드 번호 -> 일반 번호
+_SYMBOL_TO_NUMBER = {"①": "1", "②": "2", "③": "3", "④": "4"}
+
+# 유효한 선택지 번호 집합
+_OPTION_NUMBERS = frozenset(_SYMBOL_TO_NUMBER.values())
+
+
+def parse_quiz_file(file_path: str) -> Tuple[Dict[str, Any], ...]:
     """
-    Quiz.txt 파일을 파싱하여 퀴즈 데이터 리스트를 반환합니다.
+    Quiz.txt 파일을 파싱하여 퀴즈 데이터 튜플을 반환합니다.
+    파일이 바뀌지 않았다면 (경로, 수정 시각) 기준으로 캐시된 결과를 재사용합니다.
 
     Args:
         file_path: Quiz.txt 파일 경로
 
     Returns:
-        퀴즈 데이터 딕셔너리 리스트
+        퀴즈 데이터 딕셔너리 튜플 (캐시와 공유되므로 수정 금지,
+        선택 함수는 복사본을 반환)
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            content = file.read()
+        return _parse_quiz_file_cached(file_path, os.path.getmtime(file_path))
 
-        # 문제별로 분할 (숫자. 으로 시작하는 부분을 기준으로)
-        quiz_blocks = re.split(r"\n(?=\d+\.)", content.strip())
-
-        quizzes = []
-        for block in quiz_blocks:
-            if not block.strip():
-                continue
-
-            quiz_data = parse_single_quiz(block.strip())
+    except FileNotFoundError:
+        logger.error(f"퀴즈 파일을 찾을 수 없습니다: {file_path}")
+        return ()
+    except Exception as e:
+        logger.error(f"퀴즈 파일 파싱 중 오류 발생: {e}")
+        return ()
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_quiz_file_cached(
+    file_path: str, mtime: float
+) -> Tuple[Dict[str, Any], ...]:
+    """퀴즈 파일을 파싱합니다. (경로/수정 시각별 캐시, 오류는 캐시하지 않음)"""
+    quizzes = []
+    with open(file_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as file:
+        for block_lines in _iter_quiz_blocks(file):
+            quiz_data = parse_single_quiz_lines(block_lines)
             if quiz_data and validate_quiz_data(quiz_data):
                 quizzes.append(quiz_data)
             else:
-                logger.warning(f"유효하지 않은 퀴즈 블록 건너뜀: {block[:50]}...")
+                block_preview = "\n".join(block_lines)[:50]
+                logger.warning(f"유효하지 않은 퀴즈 블록 건너뜀: {block_preview}...")
 
-        logger.info(f"총 {len(quizzes)}개의 유효한 퀴즈를 파싱했습니다.")
-        return quizzes
+    logger.info(f"총 {len(quizzes)}개의 유효한 퀴즈를 파싱했습니다.")
+    return tuple(quizzes)
 
-    except FileNotFoundError:
-        logger.error(f"퀴즈 파일을 찾을 수 없습니다: {file_path}")
-        return []
-    except Exception as e:
-        logger.error(f"퀴즈 파일 파싱 중 오류 발생: {e}")
-        return []
+
+def _iter_quiz_blocks(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    파일을 한 줄씩 읽으며 문제 단위 블록(공백 제거된 비어있지 않은 줄 리스트)을 반환합니다.
+    숫자. 으로 시작하는 줄에서 새 블록이 시작됩니다.
+    """
+    block_lines: List[str] = []
+    for raw_line in lines:
+        if raw_line[:1].isdigit() and _NUM_START_RE.match(raw_line):
+            if block_lines:
+                yield block_lines
+            block_lines = []
+
+        line = raw_line.strip()
+        if line:
+            block_lines.append(line)
+
+    if block_lines:
+        yield block_lines
 
 
 def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
@@ -55,9 +122,23 @@ def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
     Returns:
         퀴즈 데이터 딕셔너리 또는 None
     """
-    try:
-        lines = [line.strip() for line in quiz_block.split("\n") if line.strip()]
+    lines = [
+        stripped for line in quiz_block.split("\n") if (stripped := line.strip())
+    ]
+    return parse_single_quiz_lines(lines)
 
+
+def parse_single_quiz_lines(lines: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    줄 단위로 분리된 단일 퀴즈 블록을 파싱하여 구조화된 데이터로 변환합니다.
+
+    Args:
+        lines: 공백이 제거된 비어있지 않은 줄 리스트
+
+    Returns:
+        퀴즈 데이터 딕셔너리 또는 None
+    """
+    try:
         if len(lines) < 6:  # 최소 필요한 라인 수
             logger.warning("퀴즈 블록의 라인 수가 부족합니다.")
             return None
@@ -65,7 +146,7 @@ def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
         # 문제 번호와 질문 추출
         # 첫 번째 줄에서 번호 추출
         first_line = lines[0]
-        number_match = re.match(r"(\d+)\.\s*$", first_line)
+        number_match = _NUM_ONLY_RE.match(first_line)
         if number_match:
             # 번호가 별도 줄에 있는 경우
             quiz_number = int(number_match.group(1))
@@ -78,7 +159,7 @@ def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
                 return None
         else:
             # 번호와 질문이 한 줄에 있는 경우 (기존 로직)
-            quiz_number_match = re.match(r"(\d+)\.\s*Q\.\s*(.*)", first_line)
+            quiz_number_match = _NUM_Q_RE.match(first_line)
             if not quiz_number_match:
                 logger.warning(f"문제 번호와 질문을 추출할 수 없습니다: {first_line}")
                 return None
@@ -87,20 +168,15 @@ def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
 
         # 선택지 추출 (질문 다음 줄부터 시작)
         options = {}
-        option_pattern = r"^[①②③④]\s*(.*)"
 
         # 질문이 별도 줄에 있는 경우 2번째 줄부터, 한 줄에 있는 경우 1번째 줄부터
         start_line = 2 if number_match else 1
 
         for line in lines[start_line:]:
-            if re.match(option_pattern, line):
-                # 유니코드 번호를 일반 번호로 변환
-                option_mapping = {"①": "1", "②": "2", "③": "3", "④": "4"}
-                for unicode_num, regular_num in option_mapping.items():
-                    if line.startswith(unicode_num):
-                        option_text = line[1:].strip()
-                        options[regular_num] = option_text
-                        break
+            # 첫 글자가 원문자(①~④)인 줄이 선택지
+            regular_num = _SYMBOL_TO_NUMBER.get(line[:1])
+            if regular_num is not None:
+                options[regular_num] = line[1:].lstrip()
 
         # 4개의 선택지가 모두 있는지 확인
         if len(options) != 4:
@@ -113,17 +189,16 @@ def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
         correct_answer = {}
         background_info = ""
 
-        for i, line in enumerate(lines):
+        # 정답 줄은 블록 끝쪽에 있으므로 뒤에서부터 탐색
+        for i in range(len(lines) - 1, -1, -1):
+            line = lines[i]
             if line.startswith("정답:"):
                 # 정답 라인 파싱
-                answer_match = re.match(r"정답:\s*([①②③④])\s*(.*)", line)
-                if answer_match:
-                    answer_symbol = answer_match.group(1)
-                    answer_company = answer_match.group(2)
-
-                    # 유니코드 번호를 일반 번호로 변환
-                    symbol_mapping = {"①": "1", "②": "2", "③": "3", "④": "4"}
-                    answer_number = symbol_mapping.get(answer_symbol, "1")
+                answer_body = line[len("정답:") :].lstrip()
+                answer_symbol = answer_body[:1]
+                answer_number = _SYMBOL_TO_NUMBER.get(answer_symbol)
+                if answer_number is not None:
+                    answer_company = answer_body[1:].strip()
 
                     correct_answer = {
                         "number": answer_number,
@@ -131,12 +206,8 @@ def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
                         "symbol": answer_symbol,
                     }
 
-                # 배경지식은 정답 다음 줄부터
-                if i + 1 < len(lines):
-                    background_lines = lines[i + 1 :]
-                    background_info = " ".join(
-                        [l.strip() for l in background_lines if l.strip()]
-                    )
+                # 배경지식은 정답 다음 줄부터 (줄은 이미 공백 제거됨)
+                background_info = " ".join(lines[i + 1 :])
                 break
 
         if not correct_answer:
@@ -151,7 +222,7 @@ def parse_single_quiz(quiz_block: str) -> Optional[Dict[str, Any]]:
             "background": background_info,
         }
 
-        logger.debug(f"퀴즈 {quiz_number}번 파싱 완료: {question[:30]}...")
+        logger.debug("퀴즈 %d번 파싱 완료: %.30s...", quiz_number, question)
         return quiz_data
 
     except Exception as e:
@@ -193,17 +264,25 @@ def validate_quiz_data(quiz_data: Dict[str, Any]) -> bool:
             logger.error(f"선택지 개수 오류: {len(options)}개 (4개 필요)")
             return False
 
-        # 선택지 번호 확인 (1, 2, 3, 4)
-        expected_numbers = {"1", "2", "3", "4"}
-        if set(options.keys()) != expected_numbers:
+        # 선택지 번호 확인 (1, 2, 3, 4) - dict 키 뷰는 집합과 직접 비교 가능
+        if options.keys() != _OPTION_NUMBERS:
             logger.error(f"선택지 번호 오류: {set(options.keys())} (1,2,3,4 필요)")
             return False
 
-        # 선택지 내용 확인
-        for num, option_text in options.items():
-            if not option_text or len(option_text.strip()) < 2:
-                logger.error(f"선택지 {num}번이 너무 짧거나 비어있습니다.")
-                return False
+        # 선택지 내용 확인 (짧은 선택지는 strip 없이 바로 걸러냄)
+        invalid_num = next(
+            (
+                num
+                for num, option_text in options.items()
+                if not option_text
+                or len(option_text) < 2
+                or len(option_text.strip()) < 2
+            ),
+            None,
+        )
+        if invalid_num is not None:
+            logger.error(f"선택지 {invalid_num}번이 너무 짧거나 비어있습니다.")
+            return False
 
         # 정답 정보 확인
         correct_answer = quiz_data["correct_answer"]
@@ -239,12 +318,12 @@ def validate_quiz_data(quiz_data: Dict[str, Any]) -> bool:
         return False
 
 
-def get_random_quiz(quizzes: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def get_random_quiz(quizzes: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """
     퀴즈 리스트에서 랜덤하게 하나를 선택합니다.
 
     Args:
-        quizzes: 퀴즈 데이터 리스트
+        quizzes: 퀴즈 데이터 시퀀스
 
     Returns:
         선택된 퀴즈 데이터 또는 None
@@ -253,23 +332,43 @@ def get_random_quiz(quizzes: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         logger.error("선택할 퀴즈가 없습니다.")
         return None
 
-    try:
-        selected_quiz = random.choice(quizzes)
-        logger.info(f"퀴즈 {selected_quiz.get('id', 'Unknown')}번이 선택되었습니다.")
-        return selected_quiz
-    except Exception as e:
-        logger.error(f"퀴즈 선택 중 오류: {e}")
-        return None
+    return copy.deepcopy(_rng.choice(quizzes))
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_attempted_ids(request_id: str) -> FrozenSet[int]:
+    """
+    사용자가 시도한 퀴즈 ID 집합을 조회합니다. (request_id별 캐시)
+    DB 오류는 예외로 전파되어 캐시되지 않고, 호출자가 처리합니다.
+    """
+    return frozenset(_quiz_db.QuizDatabase.fetch_user_attempted_quiz_ids(request_id))
+
+
+def _get_quiz_index(quizzes: Sequence[Dict[str, Any]]) -> QuizIndex:
+    """퀴즈 ID 인덱스를 반환합니다. (같은 퀴즈 리스트 객체면 재사용)"""
+    global _quiz_index_cache
+
+    cached_quizzes, quiz_index = _quiz_index_cache
+    if cached_quizzes is not quizzes or quiz_index is None:
+        by_id = {quiz.get("id"): quiz for quiz in quizzes}
+        quiz_index = QuizIndex(ids=frozenset(by_id), by_id=by_id)
+        _quiz_index_cache = (quizzes, quiz_index)
+    return quiz_index
+
+
+def clear_attempted_quiz_cache() -> None:
+    """시도한 퀴즈 ID 캐시를 비웁니다. 퀴즈 결과 저장 후 호출합니다."""
+    _cached_attempted_ids.cache_clear()
 
 
 def get_unplayed_quiz(
-    quizzes: List[Dict[str, Any]], request_id: str = ""
+    quizzes: Sequence[Dict[str, Any]], request_id: str = ""
 ) -> Optional[Dict[str, Any]]:
     """
     사용자가 시도하지 않은 퀴즈 중에서 랜덤하게 하나를 선택합니다.
 
     Args:
-        quizzes: 퀴즈 데이터 리스트
+        quizzes: 퀴즈 데이터 시퀀스
         request_id: 사용자 요청 고유 ID
 
     Returns:
@@ -285,17 +384,14 @@ def get_unplayed_quiz(
             logger.debug("request_id가 없어 랜덤 선택")
             return get_random_quiz(quizzes)
 
-        # 사용자가 시도한 퀴즈 ID 조회
-        from rag.stock_agent.graph.tools.quiz.database import QuizDatabase
-
-        attempted_quiz_ids = QuizDatabase.get_user_attempted_quiz_ids(request_id)
+        # 사용자가 시도한 퀴즈 ID 조회 (결과 저장 전까지 캐시 재사용)
+        attempted_quiz_ids = _cached_attempted_ids(request_id)
 
-        # 시도하지 않은 퀴즈만 필터링
-        unplayed_quizzes = [
-            quiz for quiz in quizzes if quiz.get("id") not in attempted_quiz_ids
-        ]
+        # 시도하지 않은 퀴즈 ID만 집합 연산으로 필터링
+        quiz_index = _get_quiz_index(quizzes)
+        unplayed_ids = quiz_index.ids - attempted_quiz_ids
 
-        if not unplayed_quizzes:
+        if not unplayed_ids:
             # 모든 퀴즈를 다 풀었을 경우
             logger.warning(
                 f"사용자 {request_id}가 모든 퀴즈를 완료했습니다. 전체 퀴즈에서 랜덤 선택"
@@ -303,14 +399,15 @@ def get_unplayed_quiz(
             return get_random_quiz(quizzes)
 
         # 미완료 퀴즈 중에서 랜덤 선택
-        selected_quiz = random.choice(unplayed_quizzes)
+        selected_quiz = quiz_index.by_id[_rng.choice(tuple(unplayed_ids))]
 
         logger.info(
-            f"사용자 {request_id} - 미완료 퀴즈 {len(unplayed_quizzes)}개 중 "
+            f"사용자 {request_id} - 미완료 퀴즈 {len(unplayed_ids)}개 중 "
             f"퀴즈 {selected_quiz.get('id', 'Unknown')}번 선택"
         )
 
-        return selected_quiz
+        # 캐시된 퀴즈가 호출자 수정에 오염되지 않도록 복사본 반환
+        return copy.deepcopy(selected_quiz)
 
     except Exception as e:
         logger.error(f"미완료 퀴즈 선택 중 오류: {e}")
@@ -1,8 +1,14 @@
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+from datetime import datetime
+import time
 from enum import Enum
 from rag.stock_agent.graph.state import StockAgentState
 from rag.stock_agent.graph.tools.quiz.database import QuizDatabase
+from rag.stock_agent.graph.tools.quiz.parser import clear_attempted_quiz_cache
+from rag.stock_agent.graph.tools.quiz.user_reward_manager import (
+    invalidate_eligibility,
+    record_reward_granted,
+)
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +23,18 @@ class QuizSessionPhase(Enum):
     COMPLETED = "completed"  # 완료됨
 
 
+# 유효한 세션 단계 전환 규칙 (현재 단계, 목표 단계)
+_VALID_TRANSITIONS: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        (QuizSessionPhase.INACTIVE.value, QuizSessionPhase.ASKING.value),
+        (QuizSessionPhase.ASKING.value, QuizSessionPhase.PROCESSING.value),
+        (QuizSessionPhase.ASKING.value, QuizSessionPhase.COMPLETED.value),
+        (QuizSessionPhase.PROCESSING.value, QuizSessionPhase.COMPLETED.value),
+        (QuizSessionPhase.COMPLETED.value, QuizSessionPhase.INACTIVE.value),
+    }
+)
+
+
 class QuizSessionManager:
     """퀴즈 세션 관리 클래스"""
 
@@ -51,6 +69,7 @@ class QuizSessionManager:
             state["quiz_session_active"] = True
             state["quiz_session_id"] = session_id
             state["quiz_session_start_time"] = current_time
+            state["quiz_session_start_ts"] = time.monotonic()
             state["quiz_current_question"] = quiz_data
             state["quiz_hint_used"] = False
             state["quiz_session_phase"] = QuizSessionPhase.ASKING.value
@@ -86,7 +105,7 @@ class QuizSessionManager:
             old_phase = state.get("quiz_session_phase", "unknown")
             state["quiz_session_phase"] = new_phase.value
 
-            logger.info(f"세션 단계 변경: {old_phase} -> {new_phase.value}")
+            logger.info("세션 단계 변경: %s -> %s", old_phase, new_phase.value)
             return state
 
         except Exception as e:
@@ -142,6 +161,12 @@ class QuizSessionManager:
                     )
 
                     if success:
+                        # 시도한 퀴즈 목록/보상 자격이 바뀌었으므로 캐시 갱신
+                        clear_attempted_quiz_cache()
+                        if is_correct and reward_info.get("amount", 0) > 0:
+                            record_reward_granted(request_id)
+                        else:
+                            invalidate_eligibility(request_id)
                         logger.info(f"퀴즈 결과 DB 저장 완료 - 사용자: {request_id}")
                     else:
                         logger.error(f"퀴즈 결과 DB 저장 실패 - 사용자: {request_id}")
@@ -153,6 +178,7 @@ class QuizSessionManager:
             state["quiz_session_active"] = False
             state["quiz_session_id"] = ""
             state["quiz_session_start_time"] = ""
+            state["quiz_session_start_ts"] = 0.0
             state["quiz_current_question"] = {}
             state["quiz_hint_used"] = False
             state["quiz_session_phase"] = QuizSessionPhase.INACTIVE.value
@@ -177,6 +203,25 @@ class QuizSessionManager:
         """
         return state.get("quiz_session_active", False)
 
+    @staticmethod
+    def _get_elapsed_seconds(state: StockAgentState) -> Optional[float]:
+        """
+        세션 시작 후 경과 시간(초)을 반환합니다.
+
+        시작 시각(monotonic)이 없는 세션은 ISO 시작 시간 문자열로 계산하며,
+        둘 다 없으면 None을 반환합니다.
+        """
+        start_ts = state.get("quiz_session_start_ts", 0.0)
+        if start_ts:
+            return time.monotonic() - start_ts
+
+        start_time_str = state.get("quiz_session_start_time", "")
+        if not start_time_str:
+            return None
+
+        start_time = datetime.fromisoformat(start_time_str)
+        return (datetime.now() - start_time).total_seconds()
+
     @classmethod
     def is_session_expired(cls, state: StockAgentState) -> bool:
         """
@@ -192,18 +237,17 @@ class QuizSessionManager:
             if not cls.is_session_active(state):
                 return False
 
-            start_time_str = state.get("quiz_session_start_time", "")
-            if not start_time_str:
+            elapsed_seconds = cls._get_elapsed_seconds(state)
+            if elapsed_seconds is None:
                 return True
 
-            start_time = datetime.fromisoformat(start_time_str)
-            current_time = datetime.now()
-            elapsed_time = current_time - start_time
-
-            is_expired = elapsed_time > timedelta(minutes=cls.SESSION_TIMEOUT_MINUTES)
+            is_expired = elapsed_seconds > cls.SESSION_TIMEOUT_MINUTES * 60
 
             if is_expired:
-                logger.warning(f"퀴즈 세션 만료 감지 - 경과시간: {elapsed_time}")
+                logger.warning(
+                    f"퀴즈 세션 만료 감지 - 경과시간: {elapsed_seconds:.0f}초 "
+                    f"(시작: {state.get('quiz_session_start_time', '')})"
+                )
 
             return is_expired
 
@@ -260,10 +304,9 @@ class QuizSessionManager:
             elapsed_minutes = 0
             remaining_minutes = cls.SESSION_TIMEOUT_MINUTES
 
-            if start_time_str:
-                start_time = datetime.fromisoformat(start_time_str)
-                elapsed_time = datetime.now() - start_time
-                elapsed_minutes = round(elapsed_time.total_seconds() / 60, 1)
+            elapsed_seconds = cls._get_elapsed_seconds(state)
+            if elapsed_seconds is not None:
+                elapsed_minutes = round(elapsed_seconds / 60, 1)
                 remaining_minutes = max(
                     0, cls.SESSION_TIMEOUT_MINUTES - elapsed_minutes
                 )
@@ -300,19 +343,7 @@ class QuizSessionManager:
         try:
             current_phase = state.get("quiz_session_phase", "inactive")
 
-            # 유효한 전환 규칙 정의
-            valid_transitions = {
-                QuizSessionPhase.INACTIVE.value: [QuizSessionPhase.ASKING.value],
-                QuizSessionPhase.ASKING.value: [
-                    QuizSessionPhase.PROCESSING.value,
-                    QuizSessionPhase.COMPLETED.value,
-                ],
-                QuizSessionPhase.PROCESSING.value: [QuizSessionPhase.COMPLETED.value],
-                QuizSessionPhase.COMPLETED.value: [QuizSessionPhase.INACTIVE.value],
-            }
-
-            allowed_targets = valid_transitions.get(current_phase, [])
-            is_valid = target_phase.value in allowed_targets
+            is_valid = (current_phase, target_phase.value) in _VALID_TRANSITIONS
 
             if not is_valid:
                 logger.warning(
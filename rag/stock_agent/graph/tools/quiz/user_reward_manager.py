@@ -1,222 +1,489 @@
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict
+import functools
+import threading
+import time
 from db.sqlite_db import SqliteDBClient
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 보상 지급 간격 (시간)
+REWARD_INTERVAL_HOURS = 24
 
-class UserRewardManager:
-    """사용자별 퀴즈 보상 관리 클래스"""
-
-    # 보상 지급 간격 (시간)
-    REWARD_INTERVAL_HOURS = 24
+# 보상 지급 간격/조회 기준 시각용 SQLite 날짜 수정자
+_INTERVAL_MODIFIER = f"+{REWARD_INTERVAL_HOURS} hours"
+_CUTOFF_MODIFIER = f"-{REWARD_INTERVAL_HOURS} hours"
 
-    @staticmethod
-    def check_reward_eligibility(request_id: str) -> Tuple[bool, Optional[str]]:
-        """
-        사용자가 보상을 받을 수 있는지 확인합니다.
+# 보상 가능 결과 및 보상 지급 직후 결과의 캐시 유지 시간 (초) - 동시에 들어온 중복 확인만 흡수
+ELIGIBLE_CACHE_TTL_SECONDS = 5
 
-        Args:
-            request_id: 사용자 요청 고유 ID
+# 보상 자격 캐시 {request_id: (만료 시각(monotonic), (보상 가능 여부, 다음 보상 가능 시간))}
+_eligibility_cache: Dict[str, Tuple[float, Tuple[bool, Optional[str]]]] = {}
+_eligibility_cache_lock = threading.Lock()
 
-        Returns:
-            (보상 가능 여부, 다음 보상 가능 시간)
-        """
-        try:
-            if not request_id:
-                logger.warning("request_id가 제공되지 않았습니다.")
-                return True, None  # request_id가 없으면 일단 허용
 
-            db = SqliteDBClient()
+# 보상 제한 안내 메시지 템플릿
+_REWARD_LIMIT_TEMPLATE = """⏰ **보상 지급 제한**
 
-            # 최근 1시간 내 정답 및 보상 받은 이력 조회
-            cutoff_time = datetime.now() - timedelta(
-                hours=UserRewardManager.REWARD_INTERVAL_HOURS
-            )
-            cutoff_time_str = cutoff_time.isoformat()
-
-            query = """
-                SELECT completed_at, reward_stock, reward_amount 
-                FROM quiz_history 
-                WHERE request_id = ? 
-                  AND is_correct = 1 
-                  AND reward_amount > 0
-                  AND completed_at > ?
-                ORDER BY completed_at DESC
-                LIMIT 1
-            """
-
-            results, columns = db.fetch_query(query, [request_id, cutoff_time_str])
-            db.close()
-
-            if not results:
-                # 24시간 내 보상 이력이 없음 - 지급 가능
-                logger.debug(
-                    f"사용자 {request_id}: 24시간 내 보상 이력 없음 - 지급 가능"
-                )
-                return True, None
+하루에 한 번만 주식 보상을 받을 수 있습니다.
+다음 보상 가능 시간: {next_reward_time}
 
-            # 최근 보상 시간 계산
-            last_reward_time_str = results[0][0]
-            last_reward_time = datetime.fromisoformat(
-                last_reward_time_str.replace("Z", "+00:00").replace("+00:00", "")
-            )
+그래도 퀴즈는 계속 풀 수 있으니 도전해보세요!"""
 
-            # 다음 보상 가능 시간 계산
-            next_reward_time = last_reward_time + timedelta(
-                hours=UserRewardManager.REWARD_INTERVAL_HOURS
+# 24시간 내 가장 최근 보상의 다음 보상 가능 시각과 남은 시간(초) 조회
+# (completed_at은 로컬 시각 ISO 문자열로 저장되므로 'now'도 localtime 기준,
+#  기준 시각도 같은 ISO 형식('T' 구분자)으로 만들어 문자열 비교/인덱스 범위 검색 유지)
+RECENT_REWARD_QUERY = """
+    SELECT next_time,
+           (julianday(next_time) - julianday('now', 'localtime')) * 86400
+               AS remaining_seconds
+    FROM (
+        SELECT datetime(completed_at, ?) AS next_time
+        FROM quiz_history
+        WHERE request_id = ?
+          AND is_correct = 1
+          AND reward_amount > 0
+          AND completed_at > strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime', ?)
+        ORDER BY completed_at DESC
+        LIMIT 1
+    )
+"""
+
+# 여러 사용자 일괄 자격 확인 시 한 쿼리에 넣을 request_id 수
+# (SQLITE_MAX_VARIABLE_NUMBER 기본값이 작은 구버전 SQLite 고려)
+BULK_CHUNK_SIZE = 500
+
+# 여러 사용자의 24시간 내 최근 보상 기준 다음 보상 가능 시각과 남은 시간(초) 조회
+# (IN 절의 자리표시자는 호출 시 청크 크기에 맞춰 채움)
+BULK_RECENT_REWARD_QUERY = """
+    SELECT request_id,
+           next_time,
+           (julianday(next_time) - julianday('now', 'localtime')) * 86400
+               AS remaining_seconds
+    FROM (
+        SELECT request_id, datetime(MAX(completed_at), ?) AS next_time
+        FROM quiz_history
+        WHERE request_id IN ({placeholders})
+          AND is_correct = 1
+          AND reward_amount > 0
+          AND completed_at > strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime', ?)
+        GROUP BY request_id
+    )
+"""
+
+# 종목별 보상 집계 (보유 수량 많은 종목 순)
+TOTAL_REWARDS_QUERY = """
+    SELECT reward_stock,
+           ROUND(SUM(reward_amount), 7) AS total_amount,
+           MAX(completed_at) AS last_time,
+           COUNT(*) AS reward_count
+    FROM quiz_history
+    WHERE request_id = ?
+      AND is_correct = 1
+      AND reward_amount > 0
+    GROUP BY reward_stock
+    ORDER BY total_amount DESC
+"""
+
+# 최근 보상 이력('r')과 종목별 집계('t')를 한 번에 조회
+REWARD_STATE_QUERY = """
+    WITH recent AS (
+        SELECT datetime(completed_at, ?) AS next_time
+        FROM quiz_history
+        WHERE request_id = ?
+          AND is_correct = 1
+          AND reward_amount > 0
+          AND completed_at > strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime', ?)
+        ORDER BY completed_at DESC
+        LIMIT 1
+    ),
+    totals AS (
+        SELECT reward_stock,
+               ROUND(SUM(reward_amount), 7) AS total_amount,
+               MAX(completed_at) AS last_time,
+               COUNT(*) AS reward_count
+        FROM quiz_history
+        WHERE request_id = ?
+          AND is_correct = 1
+          AND reward_amount > 0
+        GROUP BY reward_stock
+    )
+    SELECT 'r' AS kind,
+           next_time,
+           (julianday(next_time) - julianday('now', 'localtime')) * 86400,
+           NULL,
+           NULL
+    FROM recent
+    UNION ALL
+    SELECT 't' AS kind, reward_stock, total_amount, last_time, reward_count FROM totals
+    ORDER BY 1, 3 DESC
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_limit_message(next_reward_time: str) -> str:
+    """보상 제한 메시지를 만듭니다. (다음 보상 가능 시간별 캐시)"""
+    return _REWARD_LIMIT_TEMPLATE.format(next_reward_time=next_reward_time)
+
+
+def check_reward_eligibility(request_id: str) -> Tuple[bool, Optional[str]]:
+    """
+    사용자가 보상을 받을 수 있는지 확인합니다.
+
+    Args:
+        request_id: 사용자 요청 고유 ID
+
+    Returns:
+        (보상 가능 여부, 다음 보상 가능 시간)
+    """
+    if not request_id:
+        logger.warning("request_id가 제공되지 않았습니다.")
+        return True, None  # request_id가 없으면 일단 허용
+
+    try:
+        cached = _get_cached_eligibility(request_id)
+        if cached is not None:
+            return cached
+
+        db = SqliteDBClient.get_shared_readonly()
+
+        results = db.execute(
+            RECENT_REWARD_QUERY,
+            (
+                _INTERVAL_MODIFIER,
+                request_id,
+                _CUTOFF_MODIFIER,
+            ),
+        )
+
+        if not results:
+            return _evaluate_eligibility(request_id, None, 0)
+        return _evaluate_eligibility(request_id, *results[0])
+
+    except Exception as e:
+        logger.error(f"보상 자격 확인 중 오류: {e}")
+        return True, None  # 오류 시 일단 허용
+
+
+def check_reward_eligibility_bulk(
+    request_ids: List[str],
+) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """
+    여러 사용자의 보상 가능 여부를 일괄 확인합니다.
+    캐시에 없는 사용자만 BULK_CHUNK_SIZE 단위의 IN 쿼리로 조회합니다.
+
+    Args:
+        request_ids: 사용자 요청 고유 ID 리스트
+
+    Returns:
+        {request_id: (보상 가능 여부, 다음 보상 가능 시간)}
+    """
+    results: Dict[str, Tuple[bool, Optional[str]]] = {}
+    pending: List[str] = []
+    now = time.monotonic()  # 캐시 만료 판단용 시각은 한 번만 측정
+    for request_id in dict.fromkeys(request_ids):
+        if not request_id:
+            continue
+        cached = _get_cached_eligibility(request_id, now)
+        if cached is not None:
+            results[request_id] = cached
+        else:
+            pending.append(request_id)
+
+    if not pending:
+        return results
+
+    try:
+        db = SqliteDBClient.get_shared_readonly()
+
+        for start in range(0, len(pending), BULK_CHUNK_SIZE):
+            chunk = pending[start : start + BULK_CHUNK_SIZE]
+            query = BULK_RECENT_REWARD_QUERY.format(
+                placeholders=",".join("?" * len(chunk))
             )
+            rows = db.execute(query, (_INTERVAL_MODIFIER, *chunk, _CUTOFF_MODIFIER))
 
-            if datetime.now() >= next_reward_time:
-                logger.debug(f"사용자 {request_id}: 24시간 경과 - 지급 가능")
-                return True, None
-            else:
-                next_time_str = next_reward_time.strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(
-                    f"사용자 {request_id}: 24시간 미경과 - 다음 가능 시간: {next_time_str}"
+            for request_id, next_time_str, remaining_seconds in rows:
+                results[request_id] = _evaluate_eligibility(
+                    request_id, next_time_str, remaining_seconds
                 )
-                return False, next_time_str
-
-        except Exception as e:
-            logger.error(f"보상 자격 확인 중 오류: {e}")
-            return True, None  # 오류 시 일단 허용
-
-    @staticmethod
-    def get_user_total_rewards(request_id: str) -> Dict[str, Any]:
-        """
-        사용자의 전체 보상 현황을 조회합니다.
-
-        Args:
-            request_id: 사용자 요청 고유 ID
-
-        Returns:
-            사용자 보상 현황 딕셔너리
-        """
-        try:
-            if not request_id:
-                return {
-                    "success": False,
-                    "message": "사용자 식별 정보가 없습니다.",
-                    "total_rewards": {},
-                    "total_count": 0,
-                }
-
-            db = SqliteDBClient()
-
-            # 사용자의 모든 정답 및 보상 이력 조회
-            query = """
-                SELECT reward_stock, reward_amount, completed_at
-                FROM quiz_history 
-                WHERE request_id = ? 
-                  AND is_correct = 1 
-                  AND reward_amount > 0
-                ORDER BY completed_at DESC
-            """
-
-            results, columns = db.fetch_query(query, [request_id])
-            db.close()
-
-            if not results:
-                return {
-                    "success": True,
-                    "message": "아직 받은 보상이 없습니다.",
-                    "total_rewards": {},
-                    "total_count": 0,
-                }
-
-            # 주식별 보상 집계
-            stock_rewards = defaultdict(float)
-            for row in results:
-                stock_name = row[0]
-                amount = float(row[1])
-                stock_rewards[stock_name] += amount
-
-            # 결과 포맷팅
-            formatted_rewards = {}
-            for stock, total_amount in stock_rewards.items():
-                formatted_rewards[stock] = round(total_amount, 7)  # 소수점 7자리까지
-
-            logger.info(
-                f"사용자 {request_id} 보상 현황: {len(formatted_rewards)}종목, 총 {len(results)}회 보상"
-            )
-
-            return {
-                "success": True,
-                "message": f"총 {len(results)}회 퀴즈 정답으로 {len(formatted_rewards)}종목의 주식을 받았습니다.",
-                "total_rewards": formatted_rewards,
-                "total_count": len(results),
-                "last_reward_time": results[0][2] if results else None,
-            }
-
-        except Exception as e:
-            logger.error(f"사용자 보상 현황 조회 중 오류: {e}")
-            return {
-                "success": False,
-                "message": f"보상 현황 조회 중 오류가 발생했습니다: {str(e)}",
-                "total_rewards": {},
-                "total_count": 0,
-            }
-
-    @staticmethod
-    def format_user_rewards_display(rewards_info: Dict[str, Any]) -> str:
-        """
-        사용자 보상 현황을 표시용 텍스트로 포맷팅합니다.
-
-        Args:
-            rewards_info: get_user_total_rewards의 결과
-
-        Returns:
-            포맷된 텍스트
-        """
-        try:
-            if not rewards_info.get("success", False):
-                return f"⚠️ {rewards_info.get('message', '보상 현황을 조회할 수 없습니다.')}"
-
-            total_rewards = rewards_info.get("total_rewards", {})
-            total_count = rewards_info.get("total_count", 0)
-
-            if not total_rewards:
-                return "📊 **현재 보유 주식**\n아직 받은 보상이 없습니다."
-
-            lines = ["📊 **현재 보유 주식**"]
-
-            for stock_name, amount in total_rewards.items():
-                lines.append(f"• {stock_name}: {amount}주")
-
-            lines.append(
-                f"\n총 {total_count}회 퀴즈 정답으로 {len(total_rewards)}종목 보유"
-            )
-
-            return "\n".join(lines)
-
-        except Exception as e:
-            logger.error(f"보상 현황 포맷팅 중 오류: {e}")
-            return "📊 **현재 보유 주식**\n보상 현황 표시 중 오류가 발생했습니다."
-
-    @staticmethod
-    def format_reward_limit_message(next_reward_time: str) -> str:
-        """
-        보상 제한 메시지를 포맷팅합니다.
-
-        Args:
-            next_reward_time: 다음 보상 가능 시간
-
-        Returns:
-            포맷된 제한 메시지
-        """
-        try:
-            return f"""⏰ **보상 지급 제한**
+            for request_id in chunk:
+                if request_id not in results:
+                    results[request_id] = _evaluate_eligibility(request_id, None, 0)
+
+    except Exception as e:
+        logger.error(f"보상 자격 일괄 확인 중 오류: {e}")
+        # 오류 시 일단 허용
+        for request_id in pending:
+            results.setdefault(request_id, (True, None))
+
+    return results
+
+
+def get_user_total_rewards(request_id: str) -> Dict[str, Any]:
+    """
+    사용자의 전체 보상 현황을 조회합니다.
+
+    Args:
+        request_id: 사용자 요청 고유 ID
+
+    Returns:
+        사용자 보상 현황 딕셔너리
+    """
+    if not request_id:
+        return _empty_totals()
+
+    try:
+        db = SqliteDBClient.get_shared_readonly()
+
+        results = db.execute(TOTAL_REWARDS_QUERY, (request_id,))
+
+        return _build_total_rewards(request_id, results)
+
+    except Exception as e:
+        logger.error(f"사용자 보상 현황 조회 중 오류: {e}")
+        return {
+            "success": False,
+            "message": f"보상 현황 조회 중 오류가 발생했습니다: {str(e)}",
+            "total_rewards": {},
+            "total_count": 0,
+        }
+
+
+def get_user_reward_state(
+    request_id: str,
+) -> Tuple[Tuple[bool, Optional[str]], Dict[str, Any]]:
+    """
+    보상 자격과 전체 보상 현황을 하나의 쿼리로 함께 조회합니다.
+
+    Args:
+        request_id: 사용자 요청 고유 ID
+
+    Returns:
+        ((보상 가능 여부, 다음 보상 가능 시간), 사용자 보상 현황 딕셔너리)
+    """
+    if not request_id:
+        logger.warning("request_id가 제공되지 않았습니다.")
+        return (True, None), _empty_totals()
+
+    try:
+        db = SqliteDBClient.get_shared_readonly()
+
+        # 보상 자격이 캐시돼 있으면 집계 쿼리만 실행
+        cached = _get_cached_eligibility(request_id)
+        if cached is not None:
+            results = db.execute(TOTAL_REWARDS_QUERY, (request_id,))
+            return cached, _build_total_rewards(request_id, results)
+
+        results = db.execute(
+            REWARD_STATE_QUERY,
+            (
+                _INTERVAL_MODIFIER,
+                request_id,
+                _CUTOFF_MODIFIER,
+                request_id,
+            ),
+        )
+
+        next_time_str, remaining_seconds = None, 0
+        total_rows = []
+        for kind, *values in results:
+            if kind == "r":
+                next_time_str, remaining_seconds = values[0], values[1]
+            else:
+                total_rows.append(values)
+
+        return (
+            _evaluate_eligibility(request_id, next_time_str, remaining_seconds),
+            _build_total_rewards(request_id, total_rows),
+        )
+
+    except Exception as e:
+        logger.error(f"사용자 보상 상태 조회 중 오류: {e}")
+        return (True, None), {
+            "success": False,
+            "message": f"보상 현황 조회 중 오류가 발생했습니다: {str(e)}",
+            "total_rewards": {},
+            "total_count": 0,
+        }
+
+
+def _empty_totals() -> Dict[str, Any]:
+    """request_id가 없을 때의 보상 현황을 반환합니다. (호출자가 수정할 수 있도록 매번 새로 생성)"""
+    return {
+        "success": False,
+        "message": "사용자 식별 정보가 없습니다.",
+        "total_rewards": {},
+        "total_count": 0,
+    }
+
+
+def _get_cached_eligibility(
+    request_id: str, now: Optional[float] = None
+) -> Optional[Tuple[bool, Optional[str]]]:
+    """
+    만료되지 않은 보상 자격 캐시를 반환합니다. 없으면 None
+    (now: 호출 측에서 한 번 측정한 time.monotonic() 값. 없으면 새로 측정)
+    """
+    with _eligibility_cache_lock:
+        entry = _eligibility_cache.get(request_id)
+        if entry is None:
+            return None
+        if (time.monotonic() if now is None else now) >= entry[0]:
+            del _eligibility_cache[request_id]
+            return None
+        return entry[1]
+
+
+def _cache_eligibility(
+    request_id: str, result: Tuple[bool, Optional[str]], ttl_seconds: float
+) -> None:
+    """보상 자격 결과를 ttl_seconds 동안 캐시합니다."""
+    if ttl_seconds <= 0:
+        return
+    with _eligibility_cache_lock:
+        _eligibility_cache[request_id] = (time.monotonic() + ttl_seconds, result)
+
+
+def record_reward_granted(request_id: str) -> None:
+    """
+    보상 지급 직후 호출합니다. 지급 불가 결과를 짧게 캐시하여 동시에 들어온 자격 확인이
+    DB를 조회하지 않도록 합니다. 이후 확인은 DB에 저장된 보상 시각을 기준으로
+    다시 판단합니다. (보상 이력 저장은 QuizDatabase 담당)
+
+    Args:
+        request_id: 사용자 요청 고유 ID
+    """
+    if not request_id:
+        return
+
+    next_time_str = time.strftime(
+        "%Y-%m-%d %H:%M:%S",
+        time.localtime(time.time() + REWARD_INTERVAL_HOURS * 3600),
+    )
+    _cache_eligibility(request_id, (False, next_time_str), ELIGIBLE_CACHE_TTL_SECONDS)
+
+
+def invalidate_eligibility(request_id: str) -> None:
+    """보상 자격 캐시를 비웁니다. 퀴즈 결과(보상) 저장 후 호출합니다."""
+    with _eligibility_cache_lock:
+        _eligibility_cache.pop(request_id, None)
+
+
+def _evaluate_eligibility(
+    request_id: str, next_time_str: Optional[str], remaining_seconds: float
+) -> Tuple[bool, Optional[str]]:
+    """
+    SQL에서 계산한 다음 보상 가능 시각/남은 시간으로 보상 가능 여부를 판단하고 캐시합니다.
+    지급 가능 결과는 짧게, 지급 불가 결과는 다음 보상 가능 시간까지 캐시합니다.
+    """
+    if not next_time_str:
+        # 24시간 내 보상 이력이 없음 - 지급 가능
+        logger.debug("사용자 %s: 24시간 내 보상 이력 없음 - 지급 가능", request_id)
+        _cache_eligibility(request_id, (True, None), ELIGIBLE_CACHE_TTL_SECONDS)
+        return True, None
+
+    if remaining_seconds <= 0:
+        logger.debug("사용자 %s: 24시간 경과 - 지급 가능", request_id)
+        _cache_eligibility(request_id, (True, None), ELIGIBLE_CACHE_TTL_SECONDS)
+        return True, None
+    else:
+        logger.info("사용자 %s: 24시간 미경과 - 다음 가능 시간: %s", request_id, next_time_str)
+        _cache_eligibility(request_id, (False, next_time_str), remaining_seconds)
+        return False, next_time_str
+
+
+def _build_total_rewards(request_id: str, rows: List[Any]) -> Dict[str, Any]:
+    """
+    종목별 집계 행으로 사용자 보상 현황 딕셔너리를 구성합니다.
+
+    Args:
+        request_id: 사용자 요청 고유 ID
+        rows: (종목명, 보상 합계, 최근 보상 시간, 보상 횟수) 리스트 (보유 수량 많은 종목 순)
+    """
+    if not rows:
+        return {
+            "success": True,
+            "message": "아직 받은 보상이 없습니다.",
+            "total_rewards": {},
+            "total_count": 0,
+        }
+
+    # 보상 합계는 SQL에서 소수점 7자리로 반올림됨
+    formatted_rewards = {row[0]: row[1] for row in rows}
+    total_count = sum(row[3] for row in rows)
+
+    logger.info(
+        "사용자 %s 보상 현황: %d종목, 총 %d회 보상",
+        request_id,
+        len(formatted_rewards),
+        total_count,
+    )
+
+    return {
+        "success": True,
+        "message": f"총 {total_count}회 퀴즈 정답으로 {len(formatted_rewards)}종목의 주식을 받았습니다.",
+        "total_rewards": formatted_rewards,
+        "total_count": total_count,
+        "last_reward_time": max(row[2] for row in rows),
+    }
+
+
+def format_user_rewards_display(rewards_info: Dict[str, Any]) -> str:
+    """
+    사용자 보상 현황을 표시용 텍스트로 포맷팅합니다.
+
+    Args:
+        rewards_info: get_user_total_rewards의 결과
+
+    Returns:
+        포맷된 텍스트
+    """
+    if not rewards_info.get("success", False):
+        return f"⚠️ {rewards_info.get('message', '보상 현황을 조회할 수 없습니다.')}"
+
+    total_rewards = rewards_info.get("total_rewards", {})
+    total_count = rewards_info.get("total_count", 0)
+
+    if not total_rewards:
+        return "📊 **현재 보유 주식**\n아직 받은 보상이 없습니다."
+
+    body = "\n".join(
+        f"• {stock_name}: {amount}주" for stock_name, amount in total_rewards.items()
+    )
+    return (
+        f"📊 **현재 보유 주식**\n{body}\n"
+        f"\n총 {total_count}회 퀴즈 정답으로 {len(total_rewards)}종목 보유"
+    )
+
+
+def format_reward_limit_message(next_reward_time: str) -> str:
+    """
+    보상 제한 메시지를 포맷팅합니다.
+
+    Args:
+        next_reward_time: 다음 보상 가능 시간
+
+    Returns:
+        포맷된 제한 메시지
+    """
+    return _build_limit_message(next_reward_time)
 
-하루에 한 번만 주식 보상을 받을 수 있습니다.
-다음 보상 가능 시간: {next_reward_time}
 
-그래도 퀴즈는 계속 풀 수 있으니 도전해보세요!"""
+class UserRewardManager:
+    """사용자별 퀴즈 보상 관리 클래스 (기존 호출부 호환용, 모듈 함수에 위임)"""
 
-        except Exception as e:
-            logger.error(f"제한 메시지 포맷팅 중 오류: {e}")
-            return "⏰ 하루에 한 번만 주식 보상을 받을 수 있습니다."
+    # 보상 지급 간격 (시간)
+    REWARD_INTERVAL_HOURS = REWARD_INTERVAL_HOURS
+
+    check_reward_eligibility = staticmethod(check_reward_eligibility)
+    check_reward_eligibility_bulk = staticmethod(check_reward_eligibility_bulk)
+    get_user_total_rewards = staticmethod(get_user_total_rewards)
+    get_user_reward_state = staticmethod(get_user_reward_state)
+    record_reward_granted = staticmethod(record_reward_granted)
+    invalidate_eligibility = staticmethod(invalidate_eligibility)
+    format_user_rewards_display = staticmethod(format_user_rewards_display)
+    format_reward_limit_message = staticmethod(format_reward_limit_message)
 
 
 # 전역 인스턴스
@@ -1,8 +1,11 @@
 from langchain.tools import tool
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Optional, List, Tuple, Iterable
+import functools
+import heapq
+import operator
+import time
 from db.sqlite_db import SqliteDBClient
-from db.crud import get_stock_name
 from datetime import datetime
 import pandas as pd
 import sys
@@ -16,8 +19,356 @@ from rag.stock_agent.graph.utils import (
 )
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_date(v: str) -> str:
+    """
+    YYYY-MM-DD 또는 YYYYMMDD 형식의 날짜를 YYYY-MM-DD로 변환합니다. (입력 문자열별 캐시)
+    구분자 유무로 형식을 바로 고르므로 실패한 strptime 시도(예외)가 없습니다.
+    """
+    fmt = "%Y-%m-%d" if "-" in v else "%Y%m%d"
+    try:
+        return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"날짜 변환 실패: {v}") from None
+
+
+# 볼린저 밴드 터치 조건 (허용 오차(%)는 파라미터로 바인딩)
+_BOLLINGER_TOUCH_CONDITIONS = {
+    "UPPER": "o.high BETWEEN ts.value AND ts.value * (1 + ? / 100.0)",
+    "LOWER": "o.low BETWEEN ts.value * (1 - ? / 100.0) AND ts.value",
+}
+
+# RSI 조건별 비교 연산자 (임계값은 파라미터로 바인딩)
+_RSI_CONDITION_OPERATORS = {
+    "OVERBOUGHT": ">=",
+    "OVERSOLD": "<=",
+    "ABOVE": ">",
+    "BELOW": "<",
+}
+
+# 이동평균 편차 조건 (편차 기준(%)은 파라미터로 바인딩)
+_MA_DEVIATION_CONDITIONS = {
+    "ABOVE": "((o.close - ts.value) / ts.value) * 100 >= ?",
+    "BELOW": "((o.close - ts.value) / ts.value) * 100 <= -?",
+    "ABSOLUTE": "ABS(((o.close - ts.value) / ts.value) * 100) >= ?",
+}
+
+# 비교 연산자 문자열 -> 벡터 비교 함수 (메모리 내 필터링용)
+_COMPARE_FUNCS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+# 이동평균 편차 조건별 마스크 (편차 Series, 편차 기준(%))
+_MA_DEVIATION_MASKS = {
+    "ABOVE": lambda deviation, percent: deviation >= percent,
+    "BELOW": lambda deviation, percent: deviation <= -percent,
+    "ABSOLUTE": lambda deviation, percent: deviation.abs() >= percent,
+}
+
+# 지표 값이 숫자인 행만 남기는 조건 (NULL/문자열 값 제외, Python 측 타입 검사 대체)
+_NUMERIC_VALUE_CONDITION = "typeof(ts.value) IN ('real', 'integer')"
+
+# 기간 조회(True)/단일 날짜 조회(False)별 날짜 조건
+_TS_DATE_CONDITIONS = {True: "ts.date BETWEEN ? AND ?", False: "ts.date = ?"}
+
+# 신호 도구 쿼리는 호출마다 문자열을 만들지 않도록 조건 조합별로 미리 생성
+# 볼린저 밴드 터치 쿼리 {(기간 조회 여부, 밴드 타입): SQL}
+_BOLLINGER_QUERIES = {
+    (is_range, band_type): f"""
+        SELECT ts.value as band_value, o.close, s.name
+        FROM technical_signals ts
+        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
+        JOIN stocks s ON ts.ticker = s.ticker
+        WHERE {date_condition} AND ts.indicator = ?
+        AND o.volume > 0 AND o.close > 0
+        AND {_NUMERIC_VALUE_CONDITION}
+        AND {touch_condition}
+        """
+    for is_range, date_condition in _TS_DATE_CONDITIONS.items()
+    for band_type, touch_condition in _BOLLINGER_TOUCH_CONDITIONS.items()
+}
+
+# RSI 조건 쿼리 {(기간 조회 여부, 조건 타입): SQL}
+_RSI_QUERIES = {
+    (is_range, condition): f"""
+        SELECT ts.value as rsi_value, o.close, o.volume, s.name
+        FROM technical_signals ts
+        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
+        JOIN stocks s ON ts.ticker = s.ticker
+        WHERE {date_condition} AND ts.indicator = 'RSI_14'
+        AND o.volume > 0 AND o.close > 0
+        AND {_NUMERIC_VALUE_CONDITION}
+        AND ts.value {compare_op} ?
+        """
+    for is_range, date_condition in _TS_DATE_CONDITIONS.items()
+    for condition, compare_op in _RSI_CONDITION_OPERATORS.items()
+}
+
+# 이동평균 편차 쿼리 {(기간 조회 여부, 조건 타입): SQL}
+_MA_DEVIATION_QUERIES = {
+    (is_range, condition): f"""
+        SELECT ts.value as ma_value, o.close, s.name,
+               ((o.close - ts.value) / ts.value) * 100 as deviation
+        FROM technical_signals ts
+        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
+        JOIN stocks s ON ts.ticker = s.ticker
+        WHERE {date_condition} AND ts.indicator = ?
+        AND o.volume > 0 AND o.close > 0 AND ts.value > 0
+        AND {_NUMERIC_VALUE_CONDITION}
+        AND {deviation_condition}
+        """
+    for is_range, date_condition in _TS_DATE_CONDITIONS.items()
+    for condition, deviation_condition in _MA_DEVIATION_CONDITIONS.items()
+}
+
+# 거래량 편차 조건별 (편차 조건, 정렬 방향) (편차 기준(%)은 파라미터로 바인딩)
+_VOLUME_DEVIATION_CONDITIONS = {
+    "ABOVE": ("((o.volume * 1.0 / ts.value) - 1) * 100 >= ?", "DESC"),
+    "BELOW": ("((o.volume * 1.0 / ts.value) - 1) * 100 <= -?", "ASC"),
+}
+
+# 거래량 편차 쿼리 {(기간 조회 여부, 조건 타입): SQL}
+# 편차 계산/필터링/정렬/개수 제한을 SQL에서 처리하고, 제한 전 전체 일치 건수는
+# COUNT(*) OVER ()로 함께 반환. 종목 마스터에 있는 종목만 대상으로 하고
+# (다른 신호 쿼리의 JOIN stocks와 동일), 종목명은 개수 제한 후 남은 행에만 조인
+_VOLUME_DEVIATION_QUERIES = {
+    (is_range, condition): f"""
+        SELECT t.volume_ma, t.current_volume, t.close,
+               s.name,
+               t.volume_ratio, t.deviation, t.total_count
+        FROM (
+            SELECT ts.ticker, ts.value as volume_ma, o.volume as current_volume,
+                   o.close,
+                   o.volume * 1.0 / ts.value as volume_ratio,
+                   ((o.volume * 1.0 / ts.value) - 1) * 100 as deviation,
+                   COUNT(*) OVER () as total_count
+            FROM technical_signals ts
+            JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
+            WHERE {date_condition} AND ts.indicator = ?
+            AND o.volume > 0 AND ts.value > 0
+            AND {_NUMERIC_VALUE_CONDITION}
+            AND {deviation_condition}
+            AND ts.ticker IN (SELECT ticker FROM stocks)
+            ORDER BY deviation {order}
+            LIMIT ?
+        ) t
+        JOIN stocks s ON t.ticker = s.ticker
+        ORDER BY t.deviation {order}
+        """
+    for is_range, date_condition in _TS_DATE_CONDITIONS.items()
+    for condition, (deviation_condition, order) in _VOLUME_DEVIATION_CONDITIONS.items()
+}
+
+# 거래량 급증 쿼리 {기간 조회 여부: SQL}
+# 종목별 윈도우 함수로 직전 ma_period일(달력 기준)의 평균 거래량을 한 번의 정렬된
+# 스캔으로 계산 (행마다 ohlcv를 다시 훑는 상관 서브쿼리 제거). 윈도우 계산 범위는
+# 조회 구간과 그 직전 ma_period일로 제한하고, 급증 기준(surge_ratio) 필터링과 개수 제한도
+# SQL에서 처리 (제한 전 전체 일치 건수는 COUNT(*) OVER ()로 함께 반환)
+_VOLUME_SURGE_QUERIES = {
+    is_range: f"""
+        WITH v AS (
+            SELECT ticker, date, volume, close,
+                   AVG(volume) OVER (
+                       PARTITION BY ticker
+                       ORDER BY julianday(date)
+                       RANGE BETWEEN ? PRECEDING AND 1 PRECEDING
+                   ) AS avg_volume
+            FROM ohlcv
+            WHERE volume > 0
+              AND date >= date(?, ?)
+              AND date <= ?
+        )
+        SELECT v.volume AS current_volume, v.close, s.name, v.avg_volume,
+               COUNT(*) OVER () AS total_count
+        FROM v
+        JOIN stocks s ON v.ticker = s.ticker
+        WHERE {date_condition}
+          AND v.avg_volume IS NOT NULL
+          AND v.volume >= v.avg_volume * ?
+        ORDER BY v.volume / v.avg_volume DESC
+        LIMIT ?
+        """
+    for is_range, date_condition in {
+        True: "v.date BETWEEN ? AND ?",
+        False: "v.date = ?",
+    }.items()
+}
+
+# 골든/데드 크로스 지표 (signal_type=ALL 조회/횟수 집계용)
+_CROSS_INDICATORS = ("GOLDEN_CROSS", "DEAD_CROSS")
+
+
+def _placeholders(count: int) -> str:
+    """IN 절에 넣을 자리표시자 문자열을 만듭니다. (예: 3 -> "?, ?, ?")"""
+    return ", ".join("?" * count)
+
+
+# 크로스 신호 쿼리 {신호 타입 개수: SQL} (단일 신호 또는 ALL=골든/데드 크로스)
+# 신호 발생 순서와 거래량 기준 정렬(최근 신호와 거래량 많은 순)은 SQL에서 처리
+_CROSS_SIGNAL_QUERIES = {
+    count: f"""
+        SELECT ts.date, ts.indicator as signal_type, o.close, o.volume,
+               COALESCE(s.name, ts.ticker) as name
+        FROM technical_signals ts
+        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
+        LEFT JOIN stocks s ON ts.ticker = s.ticker
+        WHERE ts.date BETWEEN ? AND ?
+        AND ts.indicator IN ({_placeholders(count)})
+        ORDER BY ts.date DESC, o.volume DESC
+        """
+    for count in (1, len(_CROSS_INDICATORS))
+}
+
+# 종목명과 GOLDEN_CROSS/DEAD_CROSS 횟수 조회 (종목명이 없으면 ticker 그대로 사용)
+CROSS_SIGNAL_COUNT_QUERY = f"""
+SELECT COALESCE((SELECT name FROM stocks WHERE ticker = ?), ?),
+       COUNT(CASE WHEN ts.indicator = 'GOLDEN_CROSS' THEN 1 END),
+       COUNT(CASE WHEN ts.indicator = 'DEAD_CROSS' THEN 1 END)
+FROM technical_signals ts
+WHERE ts.ticker = ? AND ts.date BETWEEN ? AND ?
+AND ts.indicator IN ({_placeholders(len(_CROSS_INDICATORS))})
+"""
+
+
+# 이동평균 기간 -> 지표명 (저장된 이동평균 지표는 호출마다 문자열을 만들지 않음)
+_MA_INDICATORS = {period: f"MA_{period}" for period in (5, 20, 60)}
+
+# 단일 날짜 조회 시 한 번에 적재해 도구 간에 공유하는 지표
+_FUSED_INDICATORS = (
+    "RSI_14",
+    "BOLLINGER_UPPER",
+    "BOLLINGER_LOWER",
+    *_MA_INDICATORS.values(),
+)
+
+# 날짜별 지표 일괄 조회 (거래가 있고 종가가 유효한 종목만)
+FUSED_SIGNALS_QUERY = f"""
+SELECT ts.indicator, ts.value, o.close, o.high, o.low, o.volume, s.name
+FROM technical_signals ts
+JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
+JOIN stocks s ON ts.ticker = s.ticker
+WHERE ts.date = ? AND ts.indicator IN ({_placeholders(len(_FUSED_INDICATORS))})
+AND o.volume > 0 AND o.close > 0
+AND {_NUMERIC_VALUE_CONDITION}
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _fetch_signals_for_date(date: str, data_version: tuple) -> pd.DataFrame:
+    """
+    특정 날짜의 RSI/볼린저 밴드/이동평균 지표를 한 번에 조회합니다. (날짜, 데이터 버전별 캐시)
+    같은 날짜에 여러 신호 도구가 호출되어도 DB 조회는 한 번만 수행하고,
+    새 데이터가 적재되어 데이터 버전이 바뀌면 (최대 DATA_VERSION_TTL_SECONDS 후) 다시 조회합니다.
+    반환된 DataFrame은 캐시와 공유되므로 수정하지 않습니다.
+    """
+    db = SqliteDBClient.get_shared()
+    return pd.DataFrame(
+        db.execute_columns(FUSED_SIGNALS_QUERY, (date, *_FUSED_INDICATORS))
+    )
+
+
+def _get_date_signals(
+    start_date: Optional[str],
+    end_date: Optional[str],
+    date: Optional[str],
+    indicator: str,
+) -> Optional[pd.DataFrame]:
+    """
+    단일 날짜 조회이고 일괄 적재 대상 지표이면 해당 지표의 행을 반환합니다.
+    기간 조회이거나 대상이 아닌 지표이면 None (개별 SQL 조회 사용)
+    """
+    if (start_date and end_date) or not date or indicator not in _FUSED_INDICATORS:
+        return None
+    # 데이터 버전은 TTL 동안 재사용되므로 캐시 적중 시 DB 조회 없음
+    df = _fetch_signals_for_date(date, _data_version())
+    return df[df["indicator"] == indicator]
+
+
+def _top_rows(
+    rows: Iterable[tuple],
+    key_index: int,
+    reverse: bool,
+    indicator_type: str,
+    requested_count: Optional[int],
+) -> Tuple[List[tuple], int]:
+    """
+    원시 행을 정렬 기준 열로 정렬한 뒤 반환할 개수만큼 자릅니다.
+    결과 dict는 잘린 행에 대해서만 만들도록 (잘린 행, 전체 개수)를 반환합니다.
+    반환 개수가 전체의 1/4 미만이면 전체 정렬 대신 heapq로 상위 k개만 선택합니다.
+    """
+    rows = list(rows)
+    total_count = len(rows)
+    limit = get_result_count(indicator_type, requested_count, total_count)
+    key = operator.itemgetter(key_index)
+    if limit < total_count // 4:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(limit, rows, key=key), total_count
+    rows.sort(key=key, reverse=reverse)
+    return rows[:limit], total_count
+
+
+# 데이터 버전 조회 (가격/지표 테이블의 최신 날짜, date 인덱스로 즉시 조회)
+# 적재는 별도 프로세스(db/script)에서 수행되므로 캐시 키에 포함해 적재 후 자동 무효화
+DATA_VERSION_QUERY = """
+SELECT (SELECT MAX(date) FROM ohlcv), (SELECT MAX(date) FROM technical_signals)
+"""
+
+
+# 데이터 버전 재조회 간격 (초) - 적재된 새 데이터는 최대 이 시간 안에 반영
+DATA_VERSION_TTL_SECONDS = 30
+
+# 마지막으로 조회한 데이터 버전 (만료 시각(monotonic), 데이터 버전)
+_data_version_cache: Tuple[float, Optional[tuple]] = (0.0, None)
+
+
+def _data_version() -> tuple:
+    """
+    현재 DB의 데이터 버전 (ohlcv 최신 날짜, technical_signals 최신 날짜)을 반환합니다.
+    도구 호출마다 MAX(date)를 조회하지 않도록 DATA_VERSION_TTL_SECONDS 동안 재사용합니다.
+    """
+    global _data_version_cache
+
+    expires_at, version = _data_version_cache
+    now = time.monotonic()
+    if version is None or now >= expires_at:
+        db = SqliteDBClient.get_shared()
+        version = tuple(db.execute(DATA_VERSION_QUERY)[0])
+        _data_version_cache = (now + DATA_VERSION_TTL_SECONDS, version)
+    return version
+
+
+def _cached_execute(query: str, params: tuple) -> tuple:
+    """
+    신호 도구의 조회 결과를 (쿼리, 파라미터, 데이터 버전)별로 캐시합니다.
+    같은 조회가 반복되면 DB를 다시 조회하지 않고, 새 거래일 데이터가 적재되면
+    (최대 DATA_VERSION_TTL_SECONDS 후) 데이터 버전이 바뀌어 다시 조회합니다.
+    """
+    return _execute_versioned(query, params, _data_version())
+
+
+@functools.lru_cache(maxsize=256)
+def _execute_versioned(query: str, params: tuple, data_version: tuple) -> tuple:
+    """데이터 버전별 조회 결과 캐시 (이전 버전 항목은 LRU로 밀려남)"""
+    db = SqliteDBClient.get_shared()
+    return tuple(db.execute(query, params))
+
+
+class DateInput(BaseModel):
+    """날짜 필드(start_date, end_date, date)를 YYYY-MM-DD로 정규화하는 입력 기반 클래스"""
+
+    @field_validator(
+        "start_date", "end_date", "date", mode="before", check_fields=False
+    )
+    @classmethod
+    def normalize_date(cls, v):
+        return _normalize_date(v) if v is not None else v
+
+
 # 볼린저 밴드 터치 도구
-class BollingerTouchInput(BaseModel):
+class BollingerTouchInput(DateInput):
     start_date: Optional[str] = Field(
         None, description="시작 날짜 (YYYY-MM-DD) - 기간 조회 시 사용"
     )
@@ -30,19 +381,6 @@ class BollingerTouchInput(BaseModel):
     band_type: str = Field(default="LOWER", description="밴드 타입 (UPPER, LOWER)")
     tolerance: float = Field(default=0.5, description="터치 허용 오차 (%)")
     count: Optional[int] = Field(default=None, description="반환할 결과 개수")
-    
-    @field_validator("start_date", "end_date", "date", mode="before")
-    @classmethod
-    def normalize_date(cls, v):
-        if v is None:
-            return v
-        formats = ["%Y-%m-%d",  "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        raise ValueError(f"날짜 변환 실패: {v}")
 
 
 
@@ -58,16 +396,15 @@ def get_bollinger_touch_stocks(
     """
     특정 날짜 또는 기간에 볼린저 밴드에 터치한 종목들을 조회합니다.
     """
-    db = SqliteDBClient()
     try:
         # 날짜 조건 결정 (기간 또는 단일 날짜)
         if start_date and end_date:
             # 기간 조회
-            date_condition = "ts.date BETWEEN ? AND ?"
+            is_range = True
             params = [start_date, end_date]
         elif date:
             # 단일 날짜 조회
-            date_condition = "ts.date = ?"
+            is_range = False
             params = [date]
         else:
             return create_result_response(
@@ -80,63 +417,52 @@ def get_bollinger_touch_stocks(
         }
         indicator = indicator_map.get(band_type.upper(), "BOLLINGER_LOWER")
 
-        # 성능 최적화: JOIN을 통해 한 번의 쿼리로 모든 데이터 조회
-        query = f"""
-        SELECT ts.ticker, ts.value as band_value, o.close, o.high, o.low, s.name
-        FROM technical_signals ts
-        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-        JOIN stocks s ON ts.ticker = s.ticker
-        WHERE {date_condition} AND ts.indicator = ?
-        AND o.volume > 0 AND o.close > 0
-        """
-        params.append(indicator)
-        results = db.execute(query, params)
-        touch_stocks = []
-
-        for row in results:
-            ticker, band_value, close, high, low, stock_name = row
-            if band_value is None or not isinstance(band_value, (int, float)):
-                continue
-
-            is_touch = False
+        # 성능 최적화: JOIN과 터치 조건을 한 번의 쿼리로 처리 (조건에 맞는 행만 반환)
+        # (상단밴드: 고가가 밴드~밴드+허용오차, 하단밴드: 저가가 밴드-허용오차~밴드)
+        query = _BOLLINGER_QUERIES.get((is_range, band_type.upper()))
+        params.extend([indicator, tolerance])
+        df = _get_date_signals(start_date, end_date, date, indicator)
+        if query is None:
+            results = []
+        elif df is not None:
+            # 단일 날짜: 날짜별로 캐시된 지표에서 메모리 내 필터링
             if band_type.upper() == "UPPER":
-                touch_range = band_value * (1 + tolerance / 100)
-                is_touch = high >= band_value and high <= touch_range
-            elif band_type.upper() == "LOWER":
-                touch_range = band_value * (1 - tolerance / 100)
-                is_touch = low <= band_value and low >= touch_range
-
-            if is_touch:
-                touch_stocks.append(
-                    {
-                        "name": stock_name,
-                        "close": close,
-                        "band_value": round(band_value, 2),
-                        "touch_type": band_type.lower(),
-                    }
+                mask = df["high"].between(
+                    df["value"], df["value"] * (1 + tolerance / 100)
                 )
-
-        # 볼린저 밴드 터치 정도 기준으로 정렬 (상단밴드는 높은 터치, 하단밴드는 낮은 터치)
-        if band_type.upper() == "UPPER":
-            # 상단밴드 터치: 종가가 밴드에 가까울수록 상위
-            touch_stocks.sort(
-                key=lambda x: (x["close"] / x["band_value"]), reverse=True
+            else:
+                mask = df["low"].between(
+                    df["value"] * (1 - tolerance / 100), df["value"]
+                )
+            results = df.loc[mask, ["value", "close", "name"]].itertuples(
+                index=False, name=None
             )
         else:
-            # 하단밴드 터치: 종가가 밴드에 가까울수록 상위 (낮은 값이 상위)
-            touch_stocks.sort(key=lambda x: (x["close"] / x["band_value"]))
+            results = _cached_execute(query, tuple(params))
+
+        # 종가 기준으로 정렬 (상단밴드는 높은 값이 상위) 후 반환할 행만 dict로 변환
+        sort_key = "close"
+        reverse = band_type.upper() == "UPPER"
+        rows, total_count = _top_rows(results, 1, reverse, "BOLLINGER_BANDS", count)
+        touch_stocks = [
+            {
+                "name": stock_name,
+                "close": close,
+                "band_value": round(band_value, 2),
+                "touch_type": band_type.lower(),
+            }
+            for band_value, close, stock_name in rows
+        ]
 
         # 표준화된 응답 생성 (정렬 정보 포함)
-        sort_key = "close"  # 볼린저 밴드 터치는 종가 기준으로 정렬
-        reverse = band_type.upper() == "UPPER"  # 상단밴드는 높은 값이 상위
-
         return create_result_response(
             data=touch_stocks,
-            total_count=len(touch_stocks),
+            total_count=total_count,
             indicator_type="BOLLINGER_BANDS",
             requested_count=count,
             sort_key=sort_key,
             reverse=reverse,
+            already_sorted=True,
             date=date,
             band_type=band_type,
             tolerance=tolerance,
@@ -144,30 +470,15 @@ def get_bollinger_touch_stocks(
 
     except Exception as e:
         return {"error": f"볼린저 밴드 터치 조회 중 오류 발생: {str(e)}"}
-    finally:
-        db.close()
 
 
 # 골든/데드 크로스 신호 도구
-class CrossSignalInput(BaseModel):
+class CrossSignalInput(DateInput):
     start_date: str = Field(..., description="시작 날짜 (YYYY-MM-DD)")
     end_date: str = Field(..., description="종료 날짜 (YYYY-MM-DD)")
     signal_type: str = Field(
         default="GOLDEN_CROSS", description="신호 타입 (GOLDEN_CROSS, DEAD_CROSS, ALL)"
     )
-    
-    @field_validator("start_date", "end_date", mode="before")
-    @classmethod
-    def normalize_date(cls, v):
-        if v is None:
-            return v
-        formats = ["%Y-%m-%d",  "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        raise ValueError(f"날짜 변환 실패: {v}")
 
 
 
@@ -178,121 +489,36 @@ def get_cross_signal_stocks(
     """
     특정 기간에 골든/데드 크로스가 발생한 종목들을 조회합니다.
     """
-    db = SqliteDBClient()
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
-        cross_stocks = []
-
-        # 특정 날짜 조회인지 기간 조회인지 확인
-        is_single_date = start_date == end_date
-
+        # ALL이면 골든/데드 크로스를 한 번의 쿼리로 조회
+        # (단일 날짜 조회도 시작일 = 종료일인 BETWEEN으로 처리)
         if signal_type.upper() == "ALL":
-            # GOLDEN_CROSS
-            if is_single_date:
-                query1 = """
-                SELECT ts.ticker, ts.date, 'GOLDEN_CROSS' as signal_type, o.close, o.volume
-                FROM technical_signals ts
-                JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-                WHERE ts.date = ? AND ts.indicator = 'GOLDEN_CROSS'
-                """
-                query2 = """
-                SELECT ts.ticker, ts.date, 'DEAD_CROSS' as signal_type, o.close, o.volume
-                FROM technical_signals ts
-                JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-                WHERE ts.date = ? AND ts.indicator = 'DEAD_CROSS'
-                """
-                results1 = db.execute(query1, (start_dt,))
-                results2 = db.execute(query2, (start_dt,))
-            else:
-                query1 = """
-                SELECT ts.ticker, ts.date, 'GOLDEN_CROSS' as signal_type, o.close, o.volume
-                FROM technical_signals ts
-                JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-                WHERE ts.date BETWEEN ? AND ? AND ts.indicator = 'GOLDEN_CROSS'
-                """
-                query2 = """
-                SELECT ts.ticker, ts.date, 'DEAD_CROSS' as signal_type, o.close, o.volume
-                FROM technical_signals ts
-                JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-                WHERE ts.date BETWEEN ? AND ? AND ts.indicator = 'DEAD_CROSS'
-                """
-                results1 = db.execute(query1, (start_dt, end_dt))
-                results2 = db.execute(query2, (start_dt, end_dt))
-
-            for row in results1:
-                ticker, date, signal, close, volume = row
-                stock_name = get_stock_name(ticker)
-                # date가 datetime.date 객체인지 문자열인지 확인
-                if hasattr(date, "strftime"):
-                    date_str = date.strftime("%Y-%m-%d")
-                else:
-                    date_str = str(date)
-                cross_stocks.append(
-                    {
-                        "name": stock_name,
-                        "date": date_str,
-                        "signal_type": signal,
-                        "close": close,
-                        "volume": volume,
-                    }
-                )
-            for row in results2:
-                ticker, date, signal, close, volume = row
-                stock_name = get_stock_name(ticker)
-                # date가 datetime.date 객체인지 문자열인지 확인
-                if hasattr(date, "strftime"):
-                    date_str = date.strftime("%Y-%m-%d")
-                else:
-                    date_str = str(date)
-                cross_stocks.append(
-                    {
-                        "name": stock_name,
-                        "date": date_str,
-                        "signal_type": signal,
-                        "close": close,
-                        "volume": volume,
-                    }
-                )
+            indicators = _CROSS_INDICATORS
         else:
-            indicator = signal_type.upper()
-            if is_single_date:
-                query = """
-                SELECT ts.ticker, ts.date, ? as signal_type, o.close, o.volume
-                FROM technical_signals ts
-                JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-                WHERE ts.date = ? AND ts.indicator = ?
-                """
-                results = db.execute(query, (indicator, start_dt, indicator))
-            else:
-                query = """
-                SELECT ts.ticker, ts.date, ? as signal_type, o.close, o.volume
-                FROM technical_signals ts
-                JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-                WHERE ts.date BETWEEN ? AND ? AND ts.indicator = ?
-                """
-                results = db.execute(query, (indicator, start_dt, end_dt, indicator))
-
-            for row in results:
-                ticker, date, signal, close, volume = row
-                stock_name = get_stock_name(ticker)
-                # date가 datetime.date 객체인지 문자열인지 확인
-                if hasattr(date, "strftime"):
-                    date_str = date.strftime("%Y-%m-%d")
-                else:
-                    date_str = str(date)
-                cross_stocks.append(
-                    {
-                        "name": stock_name,
-                        "date": date_str,
-                        "signal_type": signal,
-                        "close": close,
-                        "volume": volume,
-                    }
-                )
+            indicators = (signal_type.upper(),)
+
+        query = _CROSS_SIGNAL_QUERIES[len(indicators)]
+        results = _cached_execute(query, (start_date, end_date, *indicators))
 
-        # 신호 발생 순서와 거래량 기준으로 정렬 (최근 신호와 거래량 많은 순)
-        cross_stocks.sort(key=lambda x: (x["date"], x["volume"]), reverse=True)
+        # 정렬은 SQL에서 처리되었으므로 반환할 행만 dict로 변환
+        total_count = len(results)
+        limit = get_result_count("CROSS_SIGNAL", None, total_count)
+        cross_stocks = []
+        for date, signal, close, volume, stock_name in results[:limit]:
+            # date가 datetime.date 객체인지 문자열인지 확인
+            if hasattr(date, "strftime"):
+                date_str = date.strftime("%Y-%m-%d")
+            else:
+                date_str = str(date)
+            cross_stocks.append(
+                {
+                    "name": stock_name,
+                    "date": date_str,
+                    "signal_type": signal,
+                    "close": close,
+                    "volume": volume,
+                }
+            )
 
         # 표준화된 응답 생성 (정렬 정보 포함)
         # 크로스 신호는 날짜와 거래량 기준으로 정렬 (최근 신호와 거래량 많은 순)
@@ -301,39 +527,25 @@ def get_cross_signal_stocks(
 
         return create_result_response(
             data=cross_stocks,
-            total_count=len(cross_stocks),
+            total_count=total_count,
             indicator_type="CROSS_SIGNAL",
             requested_count=None,
             sort_key=sort_key,
             reverse=reverse,
+            already_sorted=True,
             start_date=start_date,
             end_date=end_date,
             signal_type=signal_type,
         )
     except Exception as e:
         return {"error": f"크로스 신호 조회 중 오류 발생: {str(e)}"}
-    finally:
-        db.close()
 
 
 # 특정 종목 크로스 신호 횟수 도구
-class CrossSignalCountInput(BaseModel):
+class CrossSignalCountInput(DateInput):
     ticker: str = Field(..., description="종목 코드 (예: 005930.KS)")
     start_date: str = Field(..., description="시작 날짜 (YYYY-MM-DD)")
     end_date: str = Field(..., description="종료 날짜 (YYYY-MM-DD)")
-    
-    @field_validator("start_date", "end_date", mode="before")
-    @classmethod
-    def normalize_date(cls, v):
-        if v is None:
-            return v
-        formats = ["%Y-%m-%d",  "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        raise ValueError(f"날짜 변환 실패: {v}")
 
 
 
@@ -342,18 +554,14 @@ def get_cross_signal_count_by_stock(ticker: str, start_date: str, end_date: str)
     """
     특정 종목의 골든/데드 크로스 발생 횟수를 조회합니다.
     """
-    db = SqliteDBClient()
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
-
         # ticker가 종목명인 경우 ticker 코드로 변환
         if not ticker.endswith(".KS") and not ticker.endswith(".KQ"):
             # 종목명으로 ticker 찾기
             ticker_query = """
             SELECT ticker FROM stocks WHERE name = ?
             """
-            ticker_result = db.execute(ticker_query, (ticker,))
+            ticker_result = _cached_execute(ticker_query, (ticker,))
             if ticker_result:
                 ticker = ticker_result[0][0]
             else:
@@ -377,45 +585,41 @@ def get_cross_signal_count_by_stock(ticker: str, start_date: str, end_date: str)
                     end_date=end_date,
                 )
 
-        stock_name = get_stock_name(ticker)
+        # 종목명과 GOLDEN_CROSS/DEAD_CROSS 횟수를 한 번의 쿼리로 조회
+        stock_name, golden_count, dead_count = _cached_execute(
+            CROSS_SIGNAL_COUNT_QUERY,
+            (ticker, ticker, ticker, start_date, end_date, *_CROSS_INDICATORS),
+        )[0]
 
-        # 해당 종목의 데이터가 있는지 확인
-        data_check_query = """
-        SELECT COUNT(*) FROM ohlcv WHERE ticker = ? AND date BETWEEN ? AND ?
-        """
-        data_count = db.execute(data_check_query, (ticker, start_dt, end_dt))[0][0]
-
-        if data_count == 0:
-            return create_result_response(
-                data=[
-                    {
-                        "name": stock_name,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "golden_cross_count": 0,
-                        "dead_cross_count": 0,
-                        "total_cross_count": 0,
-                        "message": "해당 기간에 데이터가 없습니다.",
-                    }
-                ],
-                total_count=1,
-                indicator_type="CROSS_SIGNAL_COUNT",
-                requested_count=None,
-                ticker=ticker,
-                start_date=start_date,
-                end_date=end_date,
-            )
+        # 신호가 없을 때만 해당 종목의 데이터가 있는지 확인
+        if golden_count == 0 and dead_count == 0:
+            data_check_query = """
+            SELECT EXISTS(SELECT 1 FROM ohlcv WHERE ticker = ? AND date BETWEEN ? AND ?)
+            """
+            has_data = _cached_execute(
+                data_check_query, (ticker, start_date, end_date)
+            )[0][0]
 
-        # GOLDEN_CROSS 카운트
-        query1 = """
-        SELECT COUNT(*) FROM technical_signals ts WHERE ts.ticker = ? AND ts.date BETWEEN ? AND ? AND ts.indicator = 'GOLDEN_CROSS'
-        """
-        # DEAD_CROSS 카운트
-        query2 = """
-        SELECT COUNT(*) FROM technical_signals ts WHERE ts.ticker = ? AND ts.date BETWEEN ? AND ? AND ts.indicator = 'DEAD_CROSS'
-        """
-        golden_count = db.execute(query1, (ticker, start_dt, end_dt))[0][0]
-        dead_count = db.execute(query2, (ticker, start_dt, end_dt))[0][0]
+            if not has_data:
+                return create_result_response(
+                    data=[
+                        {
+                            "name": stock_name,
+                            "start_date": start_date,
+                            "end_date": end_date,
+                            "golden_cross_count": 0,
+                            "dead_cross_count": 0,
+                            "total_cross_count": 0,
+                            "message": "해당 기간에 데이터가 없습니다.",
+                        }
+                    ],
+                    total_count=1,
+                    indicator_type="CROSS_SIGNAL_COUNT",
+                    requested_count=None,
+                    ticker=ticker,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
 
         # 결과를 create_result_response 형식으로 변환
         result_data = {
@@ -438,12 +642,10 @@ def get_cross_signal_count_by_stock(ticker: str, start_date: str, end_date: str)
         )
     except Exception as e:
         return {"error": f"크로스 신호 횟수 조회 중 오류 발생: {str(e)}"}
-    finally:
-        db.close()
 
 
 # 거래량 급증 도구
-class VolumeSurgeInput(BaseModel):
+class VolumeSurgeInput(DateInput):
     start_date: Optional[str] = Field(
         None, description="시작 날짜 (YYYY-MM-DD) - 기간 조회 시 사용"
     )
@@ -456,19 +658,6 @@ class VolumeSurgeInput(BaseModel):
     surge_ratio: float = Field(default=100.0, description="급증 기준 비율 (%)")
     ma_period: int = Field(default=20, description="이동평균 기간")
     count: Optional[int] = Field(default=None, description="반환할 결과 개수")
-    
-    @field_validator("start_date", "end_date", "date", mode="before")
-    @classmethod
-    def normalize_date(cls, v):
-        if v is None:
-            return v
-        formats = ["%Y-%m-%d",  "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        raise ValueError(f"날짜 변환 실패: {v}")
 
 
 
@@ -484,17 +673,15 @@ def get_volume_surge_stocks(
     """
     특정 날짜 또는 기간에 거래량이 급증한 종목들을 조회합니다.
     """
-    db = SqliteDBClient()
-
     try:
         # 날짜 조건 결정 (기간 또는 단일 날짜)
         if start_date and end_date:
             # 기간 조회
-            date_condition = "o.date BETWEEN ? AND ?"
+            is_range = True
             params = [start_date, end_date]
         elif date:
             # 단일 날짜 조회
-            date_condition = "o.date = ?"
+            is_range = False
             params = [date]
         else:
             return create_result_response(
@@ -504,46 +691,47 @@ def get_volume_surge_stocks(
                 requested_count=count,
             )
 
-        # 성능 최적화: 서브쿼리를 사용하여 한 번의 쿼리로 모든 데이터 조회
-        query = f"""
-        SELECT o.ticker, o.volume as current_volume, o.close, s.name,
-               (SELECT AVG(prev_o.volume) 
-                FROM ohlcv prev_o 
-                WHERE prev_o.ticker = o.ticker 
-                AND prev_o.date < o.date 
-                AND prev_o.date >= date(o.date, '-{ma_period} days')
-                AND prev_o.volume > 0) as avg_volume
-        FROM ohlcv o
-        JOIN stocks s ON o.ticker = s.ticker
-        WHERE {date_condition} AND o.volume > 0
-        """
-
-        results = db.execute(query, params)
-        surge_stocks = []
-        for row in results:
-            ticker, current_volume, close, stock_name, avg_volume = row
-
-            if avg_volume and avg_volume > 0:
-                volume_ratio = (current_volume / avg_volume) * 100
-
-                if volume_ratio >= surge_ratio:
-                    surge_stocks.append(
-                        {
-                            "name": stock_name,
-                            "current_volume": current_volume,
-                            "avg_volume": round(avg_volume, 0),
-                            "volume_ratio": round(volume_ratio, 1),
-                            "close": close,
-                        }
-                    )
+        # 요청 개수가 0 이하이면 조회 없이 빈 응답 반환 (음수 LIMIT은 SQLite에서 무제한)
+        limit = get_result_count("VOLUME_SURGE", count, sys.maxsize)
+        if limit <= 0:
+            return create_result_response(
+                data=[],
+                total_count=0,
+                indicator_type="VOLUME_SURGE",
+                requested_count=count,
+            )
 
-        # 거래량 비율 기준으로 정렬 (내림차순)
-        surge_stocks.sort(key=lambda x: x["volume_ratio"], reverse=True)
+        # 성능 최적화: 윈도우 함수로 평균 거래량 계산과 급증 필터링을 한 번의 쿼리로 처리
+        query = _VOLUME_SURGE_QUERIES[is_range]
+        params = [
+            ma_period,
+            params[0],
+            f"-{ma_period} days",
+            params[-1],
+            *params,
+            surge_ratio / 100,
+            limit,
+        ]
+
+        # 거래량 비율 기준 정렬(내림차순)과 개수 제한은 SQL에서 처리
+        # 긴 기간 조회에서도 반환할 행만 가져오고 캐시에 보관
+        results = _cached_execute(query, tuple(params))
+        total_count = results[0][-1] if results else 0
+        surge_stocks = [
+            {
+                "name": stock_name,
+                "current_volume": current_volume,
+                "avg_volume": round(avg_volume, 0),
+                "volume_ratio": round((current_volume / avg_volume) * 100, 1),
+                "close": close,
+            }
+            for current_volume, close, stock_name, avg_volume, _ in results
+        ]
 
         # 표준화된 응답 생성
         return create_result_response(
             data=surge_stocks,
-            total_count=len(surge_stocks),
+            total_count=total_count,
             indicator_type="VOLUME_SURGE",
             requested_count=count,
             date=date,
@@ -553,12 +741,10 @@ def get_volume_surge_stocks(
 
     except Exception as e:
         return {"error": f"거래량 급증 조회 중 오류 발생: {str(e)}"}
-    finally:
-        db.close()
 
 
 # RSI 도구
-class RSIInput(BaseModel):
+class RSIInput(DateInput):
     start_date: Optional[str] = Field(
         None, description="시작 날짜 (YYYY-MM-DD) - 기간 조회 시 사용"
     )
@@ -574,19 +760,6 @@ class RSIInput(BaseModel):
         description="조건 타입 (OVERBOUGHT, OVERSOLD, ABOVE, BELOW)",
     )
     count: Optional[int] = Field(default=None, description="반환할 결과 개수")
-    
-    @field_validator("start_date", "end_date", "date", mode="before")
-    @classmethod
-    def normalize_date(cls, v):
-        if v is None:
-            return v
-        formats = ["%Y-%m-%d",  "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        raise ValueError(f"날짜 변환 실패: {v}")
 
 
 
@@ -602,81 +775,63 @@ def get_rsi_stocks(
     """
     특정 날짜 또는 기간에 RSI 조건을 만족하는 종목들을 조회합니다.
     """
-    db = SqliteDBClient()
-
     try:
         # 날짜 조건 결정 (기간 또는 단일 날짜)
         if start_date and end_date:
             # 기간 조회
-            date_condition = "ts.date BETWEEN ? AND ?"
+            is_range = True
             params = [start_date, end_date]
         elif date:
             # 단일 날짜 조회
-            date_condition = "ts.date = ?"
+            is_range = False
             params = [date]
         else:
             return create_result_response(
                 data=[], total_count=0, indicator_type="RSI", requested_count=count
             )
 
-        # 성능 최적화: JOIN을 통해 한 번의 쿼리로 모든 데이터 조회
-        query = f"""
-        SELECT ts.ticker, ts.value as rsi_value, o.close, o.volume, s.name
-        FROM technical_signals ts
-        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-        JOIN stocks s ON ts.ticker = s.ticker
-        WHERE {date_condition} AND ts.indicator = 'RSI_14'
-        AND o.volume > 0 AND o.close > 0
-        """
-
-        results = db.execute(query, params)
-        rsi_stocks = []
-        for row in results:
-            ticker, rsi_value, close, volume, stock_name = row
-
-            # rsi_value가 None이거나 유효하지 않은 경우 건너뛰기
-            if rsi_value is None or not isinstance(rsi_value, (int, float)):
-                continue
-
-            # 조건 확인
-            is_match = False
-            if condition.upper() == "OVERBOUGHT":
-                is_match = rsi_value >= rsi_threshold
-            elif condition.upper() == "OVERSOLD":
-                is_match = rsi_value <= rsi_threshold
-            elif condition.upper() == "ABOVE":
-                is_match = rsi_value > rsi_threshold
-            elif condition.upper() == "BELOW":
-                is_match = rsi_value < rsi_threshold
-
-            if is_match:
-                rsi_stocks.append(
-                    {
-                        "name": stock_name,
-                        "rsi": round(rsi_value, 2),
-                        "close": close,
-                        "volume": volume,
-                        "condition": condition.lower(),
-                    }
-                )
-
-        # RSI 값 기준으로 정렬 (과매수는 내림차순, 과매도는 오름차순)
-        if condition.upper() in ["OVERBOUGHT", "ABOVE"]:
-            rsi_stocks.sort(key=lambda x: x["rsi"], reverse=True)
+        # 성능 최적화: JOIN과 RSI 조건을 한 번의 쿼리로 처리 (조건에 맞는 행만 반환)
+        query = _RSI_QUERIES.get((is_range, condition.upper()))
+        params.append(rsi_threshold)
+
+        df = _get_date_signals(start_date, end_date, date, "RSI_14")
+        if query is None:
+            results = []
+        elif df is not None:
+            # 단일 날짜: 날짜별로 캐시된 지표에서 메모리 내 필터링
+            compare_op = _RSI_CONDITION_OPERATORS[condition.upper()]
+            mask = _COMPARE_FUNCS[compare_op](df["value"], rsi_threshold)
+            results = df.loc[
+                mask, ["value", "close", "volume", "name"]
+            ].itertuples(index=False, name=None)
         else:
-            rsi_stocks.sort(key=lambda x: x["rsi"])
+            results = _cached_execute(query, tuple(params))
 
-        # 표준화된 응답 생성 (정렬 정보 포함)
+        # RSI 값 기준으로 정렬 (과매수는 내림차순, 과매도는 오름차순)
+        # 반환할 행만 dict로 변환
         sort_key = "rsi"
         reverse = condition.upper() in ["OVERBOUGHT", "ABOVE"]
+        rows, total_count = _top_rows(results, 0, reverse, "RSI", count)
+        rsi_stocks = [
+            {
+                "name": stock_name,
+                "rsi": round(rsi_value, 2),
+                "close": close,
+                "volume": volume,
+                "condition": condition.lower(),
+            }
+            for rsi_value, close, volume, stock_name in rows
+        ]
 
+        # 표준화된 응답 생성 (정렬 정보 포함)
         return create_result_response(
             data=rsi_stocks,
-            total_count=len(rsi_stocks),
+            total_count=total_count,
             indicator_type="RSI",
             requested_count=count,
             sort_key=sort_key,
             reverse=reverse,
+            already_sorted=True,
             date=date,
             rsi_threshold=rsi_threshold,
             condition=condition,
@@ -684,12 +839,10 @@ def get_rsi_stocks(
 
     except Exception as e:
         return {"error": f"RSI 조회 중 오류 발생: {str(e)}"}
-    finally:
-        db.close()
 
 
 # 이동평균 편차 도구
-class MADeviationInput(BaseModel):
+class MADeviationInput(DateInput):
     start_date: Optional[str] = Field(
         None, description="시작 날짜 (YYYY-MM-DD) - 기간 조회 시 사용"
     )
@@ -705,19 +858,6 @@ class MADeviationInput(BaseModel):
         default="ABOVE", description="조건 타입 (ABOVE, BELOW, ABSOLUTE)"
     )
     count: Optional[int] = Field(default=None, description="반환할 결과 개수")
-    
-    @field_validator("start_date", "end_date", "date", mode="before")
-    @classmethod
-    def normalize_date(cls, v):
-        if v is None:
-            return v
-        formats = ["%Y-%m-%d",  "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        raise ValueError(f"날짜 변환 실패: {v}")
 
 
 
@@ -734,17 +874,15 @@ def get_ma_deviation_stocks(
     """
     특정 날짜 또는 기간에 이동평균 대비 가격 편차가 있는 종목들을 조회합니다.
     """
-    db = SqliteDBClient()
-
     try:
         # 날짜 조건 결정 (기간 또는 단일 날짜)
         if start_date and end_date:
             # 기간 조회
-            date_condition = "ts.date BETWEEN ? AND ?"
+            is_range = True
             params = [start_date, end_date]
         elif date:
             # 단일 날짜 조회
-            date_condition = "ts.date = ?"
+            is_range = False
             params = [date]
         else:
             return create_result_response(
@@ -754,78 +892,54 @@ def get_ma_deviation_stocks(
                 requested_count=count,
             )
 
-        # 성능 최적화: JOIN을 통해 한 번의 쿼리로 모든 데이터 조회
-        query = f"""
-        SELECT ts.ticker, ts.value as ma_value, o.close, o.volume, s.name
-        FROM technical_signals ts
-        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-        JOIN stocks s ON ts.ticker = s.ticker
-        WHERE {date_condition} AND ts.indicator = ?
-        AND o.volume > 0 AND o.close > 0
-        """
-
-        indicator = f"MA_{ma_period}"
-        params.append(indicator)
-        results = db.execute(query, params)
-        deviation_stocks = []
-
-        for row in results:
-            ticker, ma_value, close, volume, stock_name = row
-
-            if (
-                ma_value is None
-                or not isinstance(ma_value, (int, float))
-                or ma_value <= 0
-            ):
-                continue
-
-            # 편차 계산
-            deviation = ((close - ma_value) / ma_value) * 100
-
-            # 조건 확인
-            is_match = False
-            if condition.upper() == "ABOVE":
-                is_match = deviation >= deviation_percent
-            elif condition.upper() == "BELOW":
-                is_match = deviation <= -deviation_percent
-            elif condition.upper() == "ABSOLUTE":
-                is_match = abs(deviation) >= deviation_percent
-
-            if is_match:
-                deviation_stocks.append(
-                    {
-                        "name": stock_name,
-                        "close": close,
-                        "ma_value": round(ma_value, 2),
-                        "deviation": round(deviation, 2),
-                        "condition": condition.lower(),
-                    }
-                )
-
-        # 편차 기준으로 정렬 (ABOVE는 내림차순, BELOW는 오름차순)
-        if condition.upper() == "ABOVE":
-            deviation_stocks.sort(key=lambda x: x["deviation"], reverse=True)
-        elif condition.upper() == "BELOW":
-            deviation_stocks.sort(key=lambda x: x["deviation"])
-        else:  # ABSOLUTE
-            deviation_stocks.sort(key=lambda x: abs(x["deviation"]), reverse=True)
+        # 성능 최적화: JOIN, 편차 계산과 조건을 한 번의 쿼리로 처리 (조건에 맞는 행만 반환)
+        # (편차 = (종가 - 이동평균) / 이동평균 * 100)
+        query = _MA_DEVIATION_QUERIES.get((is_range, condition.upper()))
+
+        indicator = _MA_INDICATORS.get(ma_period) or f"MA_{ma_period}"
+        params.extend([indicator, deviation_percent])
+        df = _get_date_signals(start_date, end_date, date, indicator)
+        if query is None:
+            results = []
+        elif df is not None:
+            # 단일 날짜: 날짜별로 캐시된 지표에서 메모리 내 필터링
+            df = df[df["value"] > 0]
+            deviation = ((df["close"] - df["value"]) / df["value"]) * 100
+            mask = _MA_DEVIATION_MASKS[condition.upper()](deviation, deviation_percent)
+            results = zip(
+                df["value"][mask],
+                df["close"][mask],
+                df["name"][mask],
+                deviation[mask],
+            )
+        else:
+            results = _cached_execute(query, tuple(params))
 
-        # 표준화된 응답 생성 (정렬 정보 포함)
+        # 편차 기준으로 정렬 (BELOW는 오름차순, 그 외는 내림차순)
+        # 반환할 행만 dict로 변환
         sort_key = "deviation"
-        if condition.upper() == "ABOVE":
-            reverse = True
-        elif condition.upper() == "BELOW":
-            reverse = False
-        else:  # ABSOLUTE
-            reverse = True
+        reverse = condition.upper() != "BELOW"
+        rows, total_count = _top_rows(results, 3, reverse, "MA_DEVIATION", count)
+        deviation_stocks = [
+            {
+                "name": stock_name,
+                "close": close,
+                "ma_value": round(ma_value, 2),
+                "deviation": round(deviation, 2),
+                "condition": condition.lower(),
+            }
+            for ma_value, close, stock_name, deviation in rows
+        ]
 
+        # 표준화된 응답 생성 (정렬 정보 포함)
         return create_result_response(
             data=deviation_stocks,
-            total_count=len(deviation_stocks),
+            total_count=total_count,
             indicator_type="MA_DEVIATION",
             requested_count=count,
             sort_key=sort_key,
             reverse=reverse,
+            already_sorted=True,
             date=date,
             ma_period=ma_period,
             deviation_percent=deviation_percent,
@@ -834,12 +948,10 @@ def get_ma_deviation_stocks(
 
     except Exception as e:
         return {"error": f"이동평균 편차 조회 중 오류 발생: {str(e)}"}
-    finally:
-        db.close()
 
 
 # 거래량 편차 검색 도구
-class VolumeDeviationInput(BaseModel):
+class VolumeDeviationInput(DateInput):
     start_date: Optional[str] = Field(
         None, description="시작 날짜 (YYYY-MM-DD) - 기간 조회 시 사용"
     )
@@ -857,19 +969,6 @@ class VolumeDeviationInput(BaseModel):
         default="ABOVE", description="조건 타입 (ABOVE: 평균 이상, BELOW: 평균 이하)"
     )
     count: Optional[int] = Field(default=None, description="반환할 결과 개수")
-    
-    @field_validator("start_date", "end_date", "date", mode="before")
-    @classmethod
-    def normalize_date(cls, v):
-        if v is None:
-            return v
-        formats = ["%Y-%m-%d",  "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(v, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        raise ValueError(f"날짜 변환 실패: {v}")
 
 
 
@@ -886,16 +985,21 @@ def get_volume_deviation_stocks(
     """
     특정 날짜 또는 기간에 거래량이 이동평균 대비 편차가 있는 종목들을 조회합니다.
     """
-    db = SqliteDBClient()
     try:
+        cond = condition.upper()
+        if cond not in _VOLUME_DEVIATION_CONDITIONS:
+            return {
+                "error": f"지원하지 않는 조건 타입입니다: {condition}. 지원 조건: ABOVE, BELOW"
+            }
+
         # 날짜 조건 결정 (기간 또는 단일 날짜)
         if start_date and end_date:
             # 기간 조회
-            date_condition = "ts.date BETWEEN ? AND ?"
+            is_range = True
             params = [start_date, end_date]
         elif date:
             # 단일 날짜 조회
-            date_condition = "ts.date = ?"
+            is_range = False
             params = [date]
         else:
             return create_result_response(
@@ -915,66 +1019,49 @@ def get_volume_deviation_stocks(
 
         indicator = volume_ma_map[volume_ma_period]
 
-        # 거래량 편차 계산을 위한 쿼리
-        query = f"""
-        SELECT ts.ticker, ts.value as volume_ma, o.volume as current_volume, o.close, s.name
-        FROM technical_signals ts
-        JOIN ohlcv o ON ts.ticker = o.ticker AND ts.date = o.date
-        JOIN stocks s ON ts.ticker = s.ticker
-        WHERE {date_condition} AND ts.indicator = ?
-        AND o.volume > 0 AND ts.value > 0
-        """
-
-        params.append(indicator)
-        results = db.execute(query, params)
-        deviation_stocks = []
-
-        for row in results:
-            ticker, volume_ma, current_volume, close, stock_name = row
-
-            if volume_ma is None or current_volume is None:
-                continue
-
-            # 거래량 편차 계산
-            volume_ratio = current_volume / volume_ma
-            deviation = (volume_ratio - 1) * 100  # 퍼센트로 변환
-
-            # 조건에 따른 필터링
-            is_match = False
-            if condition.upper() == "ABOVE":
-                is_match = deviation >= deviation_percent
-            elif condition.upper() == "BELOW":
-                is_match = deviation <= -deviation_percent
-
-            if is_match:
-                deviation_stocks.append(
-                    {
-                        "name": stock_name,
-                        "close": close,
-                        "current_volume": current_volume,
-                        "volume_ma": round(volume_ma, 0),
-                        "deviation_percent": round(deviation, 2),
-                        "volume_ratio": round(volume_ratio, 2),
-                    }
-                )
-
-        # 편차율 기준으로 정렬 (높은 편차가 상위)
-        if condition.upper() == "ABOVE":
-            deviation_stocks.sort(key=lambda x: x["deviation_percent"], reverse=True)
-        else:
-            deviation_stocks.sort(key=lambda x: x["deviation_percent"])
+        # 반환 개수는 전체 일치 건수와 무관하게 정해지므로 LIMIT으로 바인딩
+        # 요청 개수가 0 이하이면 조회 없이 빈 응답 반환 (음수 LIMIT은 SQLite에서 무제한)
+        limit = get_result_count("VOLUME_DEVIATION", count, sys.maxsize)
+        if limit <= 0:
+            return create_result_response(
+                data=[],
+                total_count=0,
+                indicator_type="VOLUME_DEVIATION",
+                requested_count=count,
+            )
 
-        # 표준화된 응답 생성 (정렬 정보 포함)
+        # 성능 최적화: 거래량 편차 계산, 조건 필터링, 정렬과 개수 제한을 한 번의 쿼리로 처리
+        # (ABOVE는 높은 편차가 상위, BELOW는 낮은 편차가 상위)
+        query = _VOLUME_DEVIATION_QUERIES[(is_range, cond)]
         sort_key = "deviation_percent"
-        reverse = condition.upper() == "ABOVE"
+        reverse = cond == "ABOVE"
+
+        params.extend([indicator, deviation_percent, limit])
+        results = _cached_execute(query, tuple(params))
+        total_count = results[0][-1] if results else 0
+        deviation_stocks = [
+            {
+                "name": stock_name,
+                "close": close,
+                "current_volume": current_volume,
+                "volume_ma": round(volume_ma, 0),
+                "deviation_percent": round(deviation, 2),
+                "volume_ratio": round(volume_ratio, 2),
+            }
+            for (
+                volume_ma, current_volume, close, stock_name, volume_ratio, deviation, _
+            ) in results
+        ]
 
+        # 표준화된 응답 생성 (정렬 정보 포함)
         return create_result_response(
             data=deviation_stocks,
-            total_count=len(deviation_stocks),
+            total_count=total_count,
             indicator_type="VOLUME_DEVIATION",
             requested_count=count,
             sort_key=sort_key,
             reverse=reverse,
+            already_sorted=True,
             date=date,
             volume_ma_period=volume_ma_period,
             deviation_percent=deviation_percent,
@@ -983,5 +1070,3 @@ def get_volume_deviation_stocks(
 
     except Exception as e:
         return {"error": f"거래량 편차 조회 중 오류 발생: {str(e)}"}
-    finally:
-        db.close()
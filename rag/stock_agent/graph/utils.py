@@ -3,7 +3,16 @@ Stock Agent 공통 유틸리티 함수들
 결과 개수 관리, 데이터 포맷팅 등 공통 기능 제공
 """
 
-from typing import List, Dict, Any, Optional
+import functools
+import hashlib
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 from .constant import (
     DEFAULT_RESULT_COUNT,
     MAX_RESULT_COUNT,
@@ -12,6 +21,7 @@ from .constant import (
 )
 
 
+@functools.lru_cache(maxsize=4096)
 def get_result_count(
     indicator_type: Optional[str] = None,
     requested_count: Optional[int] = None,
@@ -25,19 +35,18 @@ def get_result_count(
         requested_count: 사용자가 요청한 개수
         total_available: 실제 사용 가능한 총 개수
     """
+    settings = (
+        TECHNICAL_INDICATOR_SETTINGS.get(indicator_type) if indicator_type else None
+    )
+
     # 1. 사용자가 요청한 개수가 있으면 우선 적용 (최대값 제한)
     if requested_count is not None:
-        max_allowed = MAX_RESULT_COUNT
-        if indicator_type and indicator_type in TECHNICAL_INDICATOR_SETTINGS:
-            max_allowed = TECHNICAL_INDICATOR_SETTINGS[indicator_type]["max_count"]
+        max_allowed = settings["max_count"] if settings else MAX_RESULT_COUNT
 
         return min(requested_count, max_allowed, total_available)
 
     # 2. 지표별 기본값 적용
-    if indicator_type and indicator_type in TECHNICAL_INDICATOR_SETTINGS:
-        default_count = TECHNICAL_INDICATOR_SETTINGS[indicator_type]["default_count"]
-    else:
-        default_count = DEFAULT_RESULT_COUNT
+    default_count = settings["default_count"] if settings else DEFAULT_RESULT_COUNT
 
     # 3. 실제 사용 가능한 개수와 비교하여 최소값 반환
     return min(default_count, total_available)
@@ -48,22 +57,32 @@ def limit_results(
     count: int,
     sort_key: Optional[str] = None,
     reverse: bool = False,
+    already_sorted: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     결과를 제한하고 정렬하는 함수
+    전체 정렬이 필요하면 data를 제자리 정렬합니다. (호출자가 새로 만든 리스트를 전달)
 
     Args:
         data: 원본 데이터 리스트
         count: 반환할 개수
-        sort_key: 정렬 기준 키
+        sort_key: 정렬 기준 키 (모든 항목에 키가 있어야 함)
         reverse: 역순 정렬 여부
+        already_sorted: 호출자가 이미 정렬한 데이터면 True (다시 정렬하지 않고 자르기만 함)
     """
     if not data:
         return []
 
-    # 정렬
+    if already_sorted:
+        return data[:count]
+
+    # 정렬 (상위 count개만 필요하면 전체 정렬 대신 힙 선택, 동률 순서는 sorted와 동일)
     if sort_key:
-        data = sorted(data, key=lambda x: x.get(sort_key, 0), reverse=reverse)
+        key = itemgetter(sort_key)
+        if 0 <= count < len(data):
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return select(count, data, key=key)
+        data.sort(key=key, reverse=reverse)
 
     # 개수 제한
     return data[:count]
@@ -76,6 +95,7 @@ def create_result_response(
     requested_count: Optional[int] = None,
     sort_key: Optional[str] = None,
     reverse: bool = False,
+    already_sorted: bool = False,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -86,13 +106,18 @@ def create_result_response(
         total_count: 총 개수
         indicator_type: 지표 타입
         requested_count: 요청된 개수
+        sort_key: 정렬 기준 키
+        reverse: 역순 정렬 여부
+        already_sorted: data가 sort_key/reverse 순서로 이미 정렬되어 있으면 True
         **kwargs: 추가 메타데이터
 
     Returns:
         Dict[str, Any]: 표준화된 응답
     """
     actual_count = get_result_count(indicator_type, requested_count, total_count)
-    limited_data = limit_results(data, actual_count, sort_key, reverse)
+    limited_data = limit_results(
+        data, actual_count, sort_key, reverse, already_sorted
+    )
 
     response = {
         "total_count": total_count,
@@ -102,3 +127,109 @@ def create_result_response(
     }
 
     return response
+
+
+# 공유 스레드 풀 크기 (뉴스 검색 동시 요청 수 이상)
+_SHARED_EXECUTOR_MAX_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_executor() -> ThreadPoolExecutor:
+    """
+    노드/도구가 공유하는 I/O 대기용 스레드 풀을 반환합니다. (최초 호출 시 생성)
+    LLM 호출, 외부 API 검색 등을 겹쳐 실행할 때 사용합니다.
+    풀 작업 안에서 다시 이 풀에 작업을 제출하고 결과를 기다리면 교착될 수 있으므로 중첩 제출은 피합니다.
+    """
+    return ThreadPoolExecutor(
+        max_workers=_SHARED_EXECUTOR_MAX_WORKERS, thread_name_prefix="stock-agent"
+    )
+
+
+# LLM 응답 캐시 (모델, 프롬프트 버전, 프롬프트 해시) -> 응답 텍스트
+_LLM_CACHE_MAXSIZE = 2048
+_llm_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+
+def _llm_cache_key(llm: Any, prompt: str, prompt_version: str) -> Tuple[str, str, str]:
+    """LLM 응답 캐시 키 (모델, 프롬프트 버전, 프롬프트 해시)를 만듭니다."""
+    model = getattr(llm, "model_name", None) or type(llm).__name__
+    return (
+        model,
+        prompt_version,
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+    )
+
+
+def get_cached_llm_response(
+    llm: Any, prompt: str, prompt_version: str = "v1"
+) -> Optional[str]:
+    """캐시된 LLM 응답을 반환합니다. (없으면 None)"""
+    key = _llm_cache_key(llm, prompt, prompt_version)
+    with _llm_cache_lock:
+        cached = _llm_cache.get(key)
+        if cached:
+            _llm_cache.move_to_end(key)
+        return cached
+
+
+def cache_llm_response(
+    llm: Any, prompt: str, result: str, prompt_version: str = "v1"
+) -> None:
+    """
+    LLM 응답을 캐시에 저장합니다.
+    응답 형식 검증이 필요한 호출은 검증에 성공한 응답만 저장합니다.
+    """
+    # 비어있는 응답은 캐시하지 않고 다음 호출에서 다시 요청
+    if not result:
+        return
+
+    key = _llm_cache_key(llm, prompt, prompt_version)
+    with _llm_cache_lock:
+        _llm_cache[key] = result
+        _llm_cache.move_to_end(key)
+        if len(_llm_cache) > _LLM_CACHE_MAXSIZE:
+            _llm_cache.popitem(last=False)
+
+
+def cached_llm_invoke(llm: Any, prompt: str, prompt_version: str = "v1") -> str:
+    """
+    동일한 프롬프트에 대한 LLM 호출 결과를 캐시하여 반환하는 함수
+
+    정보성(상태 변경이 없는) 호출에만 사용해야 합니다.
+    프롬프트 템플릿이나 후처리 방식이 바뀌면 prompt_version을 올려 기존 캐시를 무효화합니다.
+
+    Args:
+        llm: invoke(prompt)를 지원하는 LLM 클라이언트
+        prompt: LLM에게 전달할 프롬프트
+        prompt_version: 프롬프트 버전
+
+    Returns:
+        str: 공백이 제거된 LLM 응답 텍스트
+    """
+    cached = get_cached_llm_response(llm, prompt, prompt_version)
+    if cached:
+        return cached
+
+    result = llm.invoke(prompt).content.strip()
+    cache_llm_response(llm, prompt, result, prompt_version)
+    return result
+
+
+# 초 단위 현재 시각 ISO 문자열 캐시 (정수 초, 문자열) - 튜플 교체로 스레드 간 일관성 유지
+_now_iso_cache: Tuple[int, str] = (0, "")
+
+
+def now_iso() -> str:
+    """
+    현재 시각을 초 단위 ISO 문자열로 반환합니다.
+    같은 초 안의 호출은 캐시된 문자열을 재사용합니다. (밀리초 이하 정밀도는 포함하지 않음)
+    """
+    global _now_iso_cache
+
+    now = int(time.time())
+    cached_second, cached_iso = _now_iso_cache
+    if cached_second != now:
+        cached_iso = datetime.fromtimestamp(now).isoformat()
+        _now_iso_cache = (now, cached_iso)
+    return cached_iso
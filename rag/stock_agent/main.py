@@ -10,8 +10,6 @@ load_dotenv()
 if __name__ == "__main__":
     logger.info("--STOCK AGENT START--")
 
-    state = default_stock_agent_state()
-
     # 테스트 쿼리들
     test_queries = ["패션플랫폼이 2024-06-01부터 2025-06-30까지 데드크로스 또는 골든크로스가 몇번 발생했어?"]
 
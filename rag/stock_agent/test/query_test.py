@@ -1,13 +1,55 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from rag.stock_agent.graph.graph import app
 from rag.stock_agent.graph.state import default_stock_agent_state
 from utils.logger import get_logger
+import argparse
 import os
 
 logger = get_logger(__name__)
 
+# 동시에 처리할 질문 수 (기본 1: 에이전트는 동시 사용을 지원하지 않고 ClovaX 호출 한도가 있음)
+# QUERY_TEST_WORKERS 환경 변수나 --workers 옵션으로 변경
+MAX_WORKERS = int(os.getenv("QUERY_TEST_WORKERS", "1"))
 
-def main():
+# 결과를 parquet과 함께 csv로도 내보낼지 여부 (사람이 열어보는 용도)
+EXPORT_CSV = True
+
+
+def read_questions(csv_path: str) -> pd.DataFrame:
+    """
+    테스트 질문을 읽습니다.
+    같은 이름의 parquet이 csv보다 최신이면 parquet을 우선 사용합니다. (재파싱 없이 빠르게 로드)
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(
+        parquet_path
+    ) >= os.path.getmtime(csv_path):
+        logger.info(f"parquet 파일 사용: {parquet_path}")
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    return pd.read_csv(csv_path)
+
+
+def write_results(df: pd.DataFrame, csv_path: str) -> None:
+    """
+    테스트 결과를 parquet(zstd)으로 저장하고, 설정에 따라 csv로도 내보냅니다.
+    다음 실행에서 parquet이 우선 사용되도록 csv를 먼저 씁니다.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if EXPORT_CSV:
+        df.to_csv(csv_path, index=False)
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=False)
+
+
+def run_one(question: str) -> dict:
+    """질문 하나에 대해 그래프를 실행하고 결과 state를 반환합니다."""
+    logger.info(f"질문: {question}")
+    state = default_stock_agent_state()
+    state["query"] = question
+    return app.invoke(state)
+
+
+def main(max_workers: int = MAX_WORKERS):
     # test_question 폴더 내의 모든 csv 파일 나열
     test_dir = "test_question"
     files = [f for f in os.listdir(test_dir) if f.endswith(".csv")]
@@ -29,26 +71,38 @@ def main():
     csv_path = os.path.join(test_dir, files[choice - 1])
     logger.info(f"선택된 파일: {csv_path}")
 
-    df = pd.read_csv(csv_path)
+    df = read_questions(csv_path)
 
-    for idx, row in df.iterrows():
-        question = row["question"]
+    # nan 또는 공백 질문이 나오기 전까지의 질문만 테스트
+    questions = []
+    for question in df["question"]:
         if pd.isna(question) or str(question).strip() == "":
             logger.info("질문이 nan 또는 공백입니다. 테스트를 종료합니다.")
-            df = df.iloc[:idx]
             break
-        logger.info(f"질문: {question}")
+        questions.append(question)
+    df = df.iloc[: len(questions)].copy()
 
-        state = default_stock_agent_state()
-        state["query"] = question
-        res = app.invoke(state)
+    # 질문별 그래프 실행 (2 이상이면 병렬 처리, 결과는 질문 순서대로 반환)
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run_one, questions))
+    else:
+        results = [run_one(question) for question in questions]
 
-        # res 전체를 state 컬럼에, res["response"]를 answer 컬럼에 저장
-        df.at[idx, "state"] = str(res)
-        df.at[idx, "answer"] = res["response"]
+    # res 전체를 state 컬럼에, res["response"]를 answer 컬럼에 저장
+    df["state"] = [str(res) for res in results]
+    df["answer"] = [res["response"] for res in results]
 
-    df.to_csv(csv_path, index=False)
+    write_results(df, csv_path)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="테스트 질문 일괄 실행")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help="동시에 처리할 질문 수 (기본값: QUERY_TEST_WORKERS 환경 변수 또는 1)",
+    )
+    args = parser.parse_args()
+    main(max_workers=args.workers)